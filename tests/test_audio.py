@@ -1,6 +1,5 @@
 """Unit tests for whisprbar.audio module."""
 
-import queue
 import threading
 import time
 from unittest.mock import MagicMock, patch
@@ -11,6 +10,11 @@ import pytest
 from whisprbar import audio
 
 
+def _reference_pcm16(samples):
+    """Reference float -> int16 conversion at the shared PCM16_SCALE."""
+    return np.clip(np.asarray(samples) * audio.PCM16_SCALE, -32768, 32767).astype(np.int16)
+
+
 @pytest.mark.unit
 def test_list_input_devices():
     """Test listing audio input devices."""
@@ -57,6 +61,76 @@ def test_find_device_index_by_name_substring_match():
         assert audio.find_device_index_by_name("Microphone") == 1
 
 
+@pytest.mark.unit
+def test_find_device_index_by_name_prefers_exact_match_in_single_scan():
+    """Exact match wins over an earlier substring match with one device scan."""
+    mock_devices = [
+        {"index": 0, "name": "USB Microphone Pro"},
+        {"index": 1, "name": "USB Microphone"},
+    ]
+    mock_list = MagicMock(return_value=mock_devices)
+
+    with patch("whisprbar.audio.recorder.list_input_devices", mock_list):
+        assert audio.find_device_index_by_name("USB Microphone") == 1
+
+    mock_list.assert_called_once_with()
+
+
+@pytest.mark.unit
+def test_find_device_index_by_name_uses_caller_device_list():
+    """A pre-fetched device list should be searched without a new scan."""
+    mock_devices = [{"index": 3, "name": "Headset Mic"}]
+    mock_list = MagicMock(side_effect=AssertionError("unexpected device scan"))
+
+    with patch("whisprbar.audio.recorder.list_input_devices", mock_list):
+        assert audio.find_device_index_by_name("headset", mock_devices) == 3
+
+    mock_list.assert_not_called()
+
+
+@pytest.mark.unit
+def test_list_input_devices_caches_scan_until_refresh(monkeypatch):
+    """Device enumeration should hit sounddevice once until refreshed."""
+    from whisprbar.audio import recorder
+
+    calls = []
+
+    class FakeSoundDevice:
+        @staticmethod
+        def query_devices():
+            calls.append(True)
+            return [
+                {"name": "Output", "max_input_channels": 0},
+                {"name": "Mic", "max_input_channels": 1},
+            ]
+
+    monkeypatch.setattr(recorder, "_get_sounddevice", lambda: FakeSoundDevice())
+    recorder.invalidate_device_cache()
+    try:
+        assert recorder.list_input_devices() == [{"index": 1, "name": "Mic"}]
+        assert recorder.list_input_devices() == [{"index": 1, "name": "Mic"}]
+        assert len(calls) == 1
+
+        recorder.list_input_devices(refresh=True)
+        assert len(calls) == 2
+    finally:
+        recorder.invalidate_device_cache()
+
+
+@pytest.mark.unit
+def test_device_index_is_stale_after_re_enumeration(monkeypatch):
+    """A stored index is stale once the configured name resolves elsewhere."""
+    from whisprbar import config
+    from whisprbar.audio import recorder
+
+    monkeypatch.setitem(config.cfg, "device_name", "USB Mic")
+    monkeypatch.setitem(recorder.recording_state, "device_idx", 2)
+
+    assert not audio.device_index_is_stale([{"index": 2, "name": "USB Mic"}])
+    assert audio.device_index_is_stale([{"index": 4, "name": "USB Mic"}])
+    assert audio.device_index_is_stale([{"index": 0, "name": "Built-in"}])
+
+
 @pytest.mark.unit
 def test_find_device_index_by_name_none():
     """Test finding device with None name returns None."""
@@ -161,6 +235,242 @@ def test_apply_vad_with_silence(sample_audio_silent, mock_config):
     assert len(result) > 0
 
 
+@pytest.mark.unit
+@pytest.mark.skipif(not audio.VAD_AVAILABLE, reason="webrtcvad not available")
+def test_apply_vad_skips_webrtcvad_for_near_silence(mock_config, monkeypatch):
+    """Input below the silence threshold is returned without running webrtcvad."""
+    from whisprbar import config
+    from whisprbar.audio import vad
+
+    class ForbiddenVad:
+        def __init__(self, mode):
+            raise AssertionError("webrtcvad must not run on near-silent input")
+
+    monkeypatch.setattr(vad.webrtcvad, "Vad", ForbiddenVad)
+    mock_config.update({"use_vad": True, "vad_energy_floor": 0.0005})
+    config.cfg.clear()
+    config.cfg.update(mock_config)
+
+    rng = np.random.default_rng(0)
+    hiss = (rng.standard_normal(16000) * 0.0002).astype(np.float32)
+
+    result = audio.apply_vad(hiss)
+    np.testing.assert_array_equal(result, hiss)
+    assert audio.apply_vad(hiss, as_pcm16=True).dtype == np.int16
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not audio.VAD_AVAILABLE, reason="webrtcvad not available")
+def test_apply_vad_keeps_separate_segments_with_padding(mock_config):
+    """Two bursts split by silence come back as two padded segments."""
+    from whisprbar import config
+
+    frame = 480  # 30 ms at 16 kHz
+    t = np.arange(10 * frame, dtype=np.float32) / 16000
+    burst = (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    silence = np.zeros(20 * frame, dtype=np.float32)
+    signal = np.concatenate((silence, burst, silence, burst, silence))
+
+    mock_config.update(
+        {
+            "use_vad": True,
+            "vad_mode": 3,
+            "vad_bridge_ms": 0,
+            "vad_padding_ms": 60,
+            "vad_min_output_ratio": 0.0,
+            "vad_min_energy_frames": 1,
+        }
+    )
+    config.cfg.clear()
+    config.cfg.update(mock_config)
+
+    result = audio.apply_vad(signal)
+
+    assert result.size % frame == 0
+    loud = np.abs(result.reshape(-1, frame)).max(axis=1) > 0.1
+    loud_idx = np.flatnonzero(loud)
+    # Both bursts survive intact, separated by (trimmed) padding silence
+    assert loud_idx.size == 20
+    assert np.count_nonzero(np.diff(loud_idx) > 1) == 1
+    assert result.size < signal.size
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not audio.VAD_AVAILABLE, reason="webrtcvad not available")
+def test_apply_vad_appends_voiced_remainder_to_last_segment(mock_config):
+    """A voiced partial frame at the end is kept after the final segment."""
+    from whisprbar import config
+
+    frame = 480
+    t = np.arange(10 * frame + 100, dtype=np.float32) / 16000
+    burst = (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    signal = np.concatenate((np.zeros(20 * frame, dtype=np.float32), burst))
+
+    mock_config.update({"use_vad": True, "vad_min_output_ratio": 0.0, "vad_padding_ms": 60})
+    config.cfg.clear()
+    config.cfg.update(mock_config)
+
+    result = audio.apply_vad(signal, as_pcm16=True)
+
+    assert result.size % frame == 100
+    assert result.size < signal.size
+    expected_tail = _reference_pcm16(signal[-100:])
+    np.testing.assert_array_equal(result[-100:], expected_tail)
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not audio.VAD_AVAILABLE, reason="webrtcvad not available")
+def test_apply_vad_as_pcm16_returns_same_samples_as_int16(sample_audio, mock_config):
+    """as_pcm16 returns the VAD output as int16 without a float round trip."""
+    from whisprbar import config
+
+    silence = np.zeros(16000, dtype=np.float32)
+    signal = np.concatenate((silence, sample_audio, silence))
+    mock_config.update({"use_vad": True, "vad_min_output_ratio": 0.0})
+    config.cfg.clear()
+    config.cfg.update(mock_config)
+
+    as_float = audio.apply_vad(signal)
+    as_pcm16 = audio.apply_vad(signal, as_pcm16=True)
+
+    assert as_pcm16.dtype == np.int16
+    assert as_float.size == as_pcm16.size < signal.size
+    assert np.allclose(as_float, as_pcm16 / audio.PCM16_SCALE)
+
+    # Captured int16 PCM is accepted as input without requantizing
+    captured = _reference_pcm16(signal).reshape(-1, 1)
+    np.testing.assert_array_equal(audio.apply_vad(captured, as_pcm16=True), as_pcm16)
+
+    # The VAD-off path converts once as well
+    config.cfg["use_vad"] = False
+    assert audio.apply_vad(signal, as_pcm16=True).dtype == np.int16
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not audio.VAD_AVAILABLE, reason="webrtcvad not available")
+def test_apply_vad_feeds_frames_and_falls_back_on_errors(sample_audio, mock_config, monkeypatch):
+    """Each 30 ms frame reaches webrtcvad once; a frame error returns the input."""
+    from whisprbar import config
+    from whisprbar.audio import vad
+
+    frame_sizes = []
+
+    class FailingVad:
+        def __init__(self, mode):
+            pass
+
+        def is_speech(self, frame, sample_rate):
+            frame_sizes.append(len(bytes(frame)))
+            if len(frame_sizes) == 3:
+                raise ValueError("bad frame")
+            return True
+
+    monkeypatch.setattr(vad.webrtcvad, "Vad", FailingVad)
+    mock_config["use_vad"] = True
+    config.cfg.clear()
+    config.cfg.update(mock_config)
+
+    result = audio.apply_vad(sample_audio)
+
+    assert frame_sizes == [960, 960, 960]
+    assert result is sample_audio or np.array_equal(result, sample_audio.reshape(-1))
+
+
+@pytest.mark.unit
+def test_drop_short_runs_clears_only_short_runs():
+    """Runs shorter than min_len are dropped, including ones at the edges."""
+    from whisprbar.audio import vad
+
+    mask = np.array([1, 0, 1, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1, 1, 0, 1], dtype=bool)
+    expected = np.array([0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0], dtype=bool)
+
+    result = vad._drop_short_runs(mask, 3)
+
+    assert np.array_equal(result, expected)
+    assert mask[0] and mask[-1]  # input left untouched
+    assert np.array_equal(vad._drop_short_runs(mask, 1), mask)
+    assert not vad._drop_short_runs(np.zeros(0, dtype=bool), 3).size
+
+
+@pytest.mark.unit
+def test_dilate_mask_matches_box_convolution():
+    """Dilation equals the old convolve bridge and keeps the mask length."""
+    from whisprbar.audio import vad
+
+    rng = np.random.default_rng(0)
+    mask = rng.random(200) < 0.05
+    for radius in (1, 2, 4, 7):
+        kernel = np.ones(2 * radius + 1, dtype=int)
+        expected = np.convolve(mask.astype(int), kernel, mode="same") > 0
+        assert np.array_equal(vad._dilate_mask(mask, radius), expected)
+
+    # Radius wider than the mask still yields a mask of the same size
+    short = np.array([False, True, False])
+    assert vad._dilate_mask(short, 5).tolist() == [True, True, True]
+
+
+@pytest.mark.unit
+def test_chunk_energy_matches_window_rms():
+    """Per-chunk energies should combine into the same RMS as the joined window."""
+    from whisprbar.audio import vad
+
+    rng = np.random.default_rng(0)
+    chunks = [rng.uniform(-0.5, 0.5, (1024, 1)).astype(np.float32) for _ in range(4)]
+
+    energies = [vad._chunk_energy(chunk) for chunk in chunks]
+    rms = np.sqrt(sum(e for e, _ in energies) / sum(n for _, n in energies))
+
+    joined = np.concatenate(chunks).reshape(-1)
+    assert rms == pytest.approx(float(np.sqrt(np.mean(np.square(joined)))), rel=1e-5)
+
+
+@pytest.mark.unit
+def test_float_to_pcm16_clips_without_touching_input():
+    """Fused conversion matches scale, clip -> int16 and leaves the input intact."""
+    from whisprbar.audio import float_to_pcm16
+
+    samples = np.array([[-1.5], [-1.0], [-0.25], [0.0], [0.5], [0.99999], [2.0]], dtype=np.float32)
+    original = samples.copy()
+
+    result = float_to_pcm16(samples)
+
+    expected = _reference_pcm16(original).reshape(-1)
+    np.testing.assert_array_equal(result, expected)
+    np.testing.assert_array_equal(samples, original)
+    assert np.shares_memory(float_to_pcm16(result), result)
+
+
+@pytest.mark.unit
+def test_pcm16_float_round_trip_is_lossless():
+    """int16 -> float32 -> int16 uses one scale both ways and returns the same samples."""
+    from whisprbar.audio import float_to_pcm16, pcm16_to_float32
+
+    pcm16 = np.array([-32768, -16384, -1, 0, 1, 12345, 32767], dtype=np.int16)
+
+    np.testing.assert_array_equal(float_to_pcm16(pcm16_to_float32(pcm16)), pcm16)
+
+
+@pytest.mark.unit
+def test_encode_wav_pcm16_matches_wave_module(sample_audio):
+    """The precomputed header path should produce the same file as wave.Wave_write."""
+    import io
+    import wave
+
+    from whisprbar.audio import CHANNELS, SAMPLE_RATE, encode_wav_pcm16
+
+    pcm16 = _reference_pcm16(sample_audio)
+    expected = io.BytesIO()
+    with wave.open(expected, "wb") as wf:
+        wf.setnchannels(CHANNELS)
+        wf.setsampwidth(2)
+        wf.setframerate(SAMPLE_RATE)
+        wf.writeframes(pcm16.tobytes())
+
+    assert encode_wav_pcm16(sample_audio) == expected.getvalue()
+    # int16 PCM is written as-is
+    assert encode_wav_pcm16(pcm16) == expected.getvalue()
+
+
 @pytest.mark.unit
 def test_split_audio_into_chunks(sample_audio_long, mock_config):
     """Test splitting long audio into chunks."""
@@ -252,7 +562,7 @@ def test_recording_callback_forwards_audio_chunks_to_streaming_callback(monkeypa
     chunks = []
     frame = np.array([[0.1], [0.2], [0.3]], dtype=np.float32)
 
-    monkeypatch.setattr(recorder, "AUDIO_QUEUE", queue.Queue())
+    monkeypatch.setattr(recorder, "AUDIO_BUFFER", recorder.AudioCaptureBuffer())
     monkeypatch.setattr(recorder.time, "monotonic", lambda: 123.456)
     monkeypatch.setattr(
         recorder,
@@ -276,29 +586,104 @@ def test_recording_callback_forwards_audio_chunks_to_streaming_callback(monkeypa
 
 
 @pytest.mark.unit
-def test_recording_callback_does_not_take_state_lock_while_queue_lock_is_held(monkeypatch):
+def test_recording_callback_converts_int16_capture_for_live_consumers(monkeypatch):
+    """int16 stream blocks are stored as PCM16 and forwarded as float32."""
+    from whisprbar.audio import recorder
+
+    chunks = []
+    frame = np.array([[16384], [-8192]], dtype=np.int16)
+    buffer_obj = recorder.AudioCaptureBuffer()
+
+    monkeypatch.setattr(recorder, "AUDIO_BUFFER", buffer_obj)
+    monkeypatch.setattr(
+        recorder,
+        "_recording_callbacks",
+        {"on_audio_level": None, "on_audio_chunk": chunks.append},
+    )
+
+    recorder.recording_callback(frame, len(frame), None, None)
+
+    assert chunks[0].dtype == np.float32
+    np.testing.assert_array_equal(chunks[0], [[0.5], [-0.25]])
+    np.testing.assert_array_equal(buffer_obj.to_array(), [[0.5], [-0.25]])
+
+
+@pytest.mark.unit
+def test_recording_callback_shares_stored_block_with_level_and_vad(monkeypatch):
+    """Level meter and VAD monitor should read the stored block without copies."""
+    from collections import deque
+
+    from whisprbar.audio import recorder, vad
+
+    frame = np.full((4, 1), 16384, dtype=np.int16)
+    buffer_obj = recorder.AudioCaptureBuffer()
+    vad_queue = deque(maxlen=vad.VAD_MONITOR_MAX_CHUNKS)
+    levels = []
+
+    monkeypatch.setattr(recorder, "AUDIO_BUFFER", buffer_obj)
+    monkeypatch.setattr(vad, "VAD_MONITOR_QUEUE", vad_queue)
+    monkeypatch.setattr(recorder, "_audio_rms_to_indicator_level", lambda rms: rms)
+    monkeypatch.setattr(
+        recorder,
+        "_recording_callbacks",
+        {"on_audio_level": levels.append, "on_audio_chunk": None},
+    )
+
+    recorder.recording_callback(frame, len(frame), None, None)
+
+    queued = vad_queue.popleft()
+    assert np.shares_memory(queued, buffer_obj._data)
+    assert levels == [pytest.approx(0.5)]
+
+
+@pytest.mark.unit
+def test_recording_callback_vad_queue_keeps_newest_chunks_when_full(monkeypatch):
+    """A lagging VAD monitor loses the oldest chunks, not the newest."""
+    from collections import deque
+
+    from whisprbar.audio import recorder, vad
+
+    vad_queue = deque(maxlen=2)
+    monkeypatch.setattr(recorder, "AUDIO_BUFFER", recorder.AudioCaptureBuffer())
+    monkeypatch.setattr(vad, "VAD_MONITOR_QUEUE", vad_queue)
+    monkeypatch.setattr(
+        recorder,
+        "_recording_callbacks",
+        {"on_audio_level": None, "on_audio_chunk": None},
+    )
+
+    for value in (1000, 2000, 3000):
+        frame = np.full((4, 1), value, dtype=np.int16)
+        recorder.recording_callback(frame, len(frame), None, None)
+
+    assert len(vad_queue) == 2
+    assert [int(chunk[0, 0]) for chunk in vad_queue] == [2000, 3000]
+
+
+@pytest.mark.unit
+def test_recording_callback_does_not_take_state_lock_while_buffer_lock_is_held(monkeypatch):
     """Audio callback lock ordering must stay compatible with stop_recording()."""
     from whisprbar.audio import recorder
 
     frame = np.array([[0.1], [0.2]], dtype=np.float32)
-    queue_lock_held = {"value": False}
+    buffer_lock_held = {"value": False}
 
-    class TrackingQueueLock:
+    class TrackingBufferLock:
         def __enter__(self):
-            queue_lock_held["value"] = True
+            buffer_lock_held["value"] = True
 
         def __exit__(self, _exc_type, _exc, _tb):
-            queue_lock_held["value"] = False
+            buffer_lock_held["value"] = False
 
     class AssertStateLock:
         def __enter__(self):
-            assert queue_lock_held["value"] is False
+            assert buffer_lock_held["value"] is False
 
         def __exit__(self, _exc_type, _exc, _tb):
             return False
 
-    monkeypatch.setattr(recorder, "AUDIO_QUEUE", queue.Queue())
-    monkeypatch.setattr(recorder, "audio_queue_lock", TrackingQueueLock())
+    monkeypatch.setattr(recorder, "AUDIO_BUFFER", recorder.AudioCaptureBuffer())
+    monkeypatch.setattr(recorder, "audio_buffer_lock", TrackingBufferLock())
     monkeypatch.setattr(recorder, "_recording_state_lock", AssertStateLock())
     monkeypatch.setattr(
         recorder,
@@ -315,6 +700,86 @@ def test_recording_callback_does_not_take_state_lock_while_queue_lock_is_held(mo
     recorder.recording_callback(frame, len(frame), None, None)
 
 
+@pytest.mark.unit
+def test_recording_callback_skips_state_lock_after_first_audio(monkeypatch):
+    """Once first audio is stamped, later blocks must not touch the state lock."""
+    from whisprbar.audio import recorder
+
+    class FailingStateLock:
+        def __enter__(self):
+            raise AssertionError("state lock taken in steady-state callback")
+
+        def __exit__(self, _exc_type, _exc, _tb):
+            return False
+
+    frame = np.zeros((2, 1), dtype=np.int16)
+    monkeypatch.setattr(recorder, "AUDIO_BUFFER", recorder.AudioCaptureBuffer())
+    monkeypatch.setattr(recorder, "_recording_state_lock", FailingStateLock())
+    monkeypatch.setattr(recorder, "_recording_callbacks", {})
+    monkeypatch.setitem(recorder.recording_state, "first_audio_at_monotonic", 1.0)
+
+    recorder.recording_callback(frame, len(frame), None, None)
+
+    assert recorder.recording_state["first_audio_at_monotonic"] == 1.0
+
+
+@pytest.mark.unit
+def test_audio_capture_buffer_grows_and_keeps_written_views_valid():
+    """Capture buffer should grow past its initial capacity without losing frames."""
+    from whisprbar.audio import recorder
+
+    buffer_obj = recorder.AudioCaptureBuffer(initial_seconds=0.0)
+    assert buffer_obj.to_array() is None
+
+    blocks = [
+        np.full((recorder.BLOCK_SIZE, 1), idx * 1000, dtype=np.int16) for idx in range(3)
+    ]
+    first_view = buffer_obj.write(blocks[0])
+    for block in blocks[1:]:
+        buffer_obj.write(block)
+
+    assert len(buffer_obj) == 3 * recorder.BLOCK_SIZE
+    np.testing.assert_array_equal(first_view, blocks[0])
+    result = buffer_obj.to_array()
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, np.concatenate(blocks) / recorder.PCM16_SCALE)
+    pcm16 = buffer_obj.to_pcm16()
+    np.testing.assert_array_equal(pcm16, np.concatenate(blocks))
+    assert np.shares_memory(pcm16, buffer_obj.to_pcm16())
+
+
+@pytest.mark.unit
+def test_stop_recording_hands_off_captured_pcm16_without_copy(monkeypatch):
+    """stop_recording should return the capture buffer's int16 frames as a view."""
+    from whisprbar.audio import recorder
+
+    buffer_obj = recorder.AudioCaptureBuffer()
+    stored = buffer_obj.write(np.arange(-512, 512, dtype=np.int16).reshape(-1, 1))
+    monkeypatch.setattr(recorder, "AUDIO_BUFFER", buffer_obj)
+    monkeypatch.setitem(recorder.recording_state, "recording", True)
+    monkeypatch.setitem(recorder.recording_state, "stream", None)
+    monkeypatch.setitem(recorder._recording_callbacks, "on_stop", None)
+
+    result = recorder.stop_recording()
+
+    assert result.dtype == np.int16
+    assert np.shares_memory(result, stored)
+    assert recorder.recording_state["audio_data"] is result
+    assert recorder.AUDIO_BUFFER is None
+
+
+@pytest.mark.unit
+def test_audio_capture_buffer_stores_float_blocks_as_clipped_pcm16():
+    """Float blocks should be scaled into int16 storage and clipped at full scale."""
+    from whisprbar.audio import recorder
+
+    buffer_obj = recorder.AudioCaptureBuffer()
+    stored = buffer_obj.write(np.array([[0.5], [-0.5], [1.5], [-1.5]], dtype=np.float32))
+
+    assert stored.dtype == np.int16
+    assert stored.reshape(-1).tolist() == [16384, -16384, 32767, -32768]
+
+
 @pytest.mark.unit
 def test_indicator_level_mapping_makes_normal_speech_visible():
     """Typical speech RMS should drive the recording indicator clearly."""
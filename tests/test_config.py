@@ -22,6 +22,23 @@ def test_load_env_file_values_basic(mock_env_file, monkeypatch):
     assert values["EMPTY_VALUE"] == ""
 
 
+@pytest.mark.unit
+def test_load_env_file_values_reparses_after_file_changes(tmp_path, monkeypatch):
+    """Cached env parsing should follow edits and keep the line semantics."""
+    env_path = tmp_path / "whisprbar.env"
+    env_path.write_text("# comment\nA = 'one'\nnoequals\nB=x=y#z\n", encoding="utf-8")
+    monkeypatch.setattr(config, "get_env_file_path", lambda: env_path)
+
+    first = config.load_env_file_values()
+    first["A"] = "mutated"
+
+    assert config.load_env_file_values() == {"A": "one", "B": "x=y#z"}
+
+    config.save_env_file_value("C", "three words")
+
+    assert config.load_env_file_values() == {"A": "one", "B": "x=y#z", "C": "three words"}
+
+
 @pytest.mark.unit
 def test_load_env_file_values_nonexistent():
     """Test loading environment variables when file doesn't exist."""
@@ -31,6 +48,21 @@ def test_load_env_file_values_nonexistent():
     assert isinstance(values, dict)
 
 
+@pytest.mark.unit
+def test_json_helpers_round_trip_unicode_and_raise_stdlib_decode_errors():
+    """json_dumps/json_loads behave the same with or without orjson."""
+    payload = {"text": "Grüße ✓", "count": 2, "nested": [1.5, None, True]}
+
+    encoded = config.json_dumps(payload, indent=True)
+
+    assert "Grüße ✓" in encoded
+    assert encoded.splitlines()[1].startswith('  "')
+    assert config.json_loads(encoded) == payload
+    assert config.json_loads(encoded.encode("utf-8")) == payload
+    with pytest.raises(json.JSONDecodeError):
+        config.json_loads("{not json")
+
+
 @pytest.mark.unit
 def test_load_config_with_defaults(monkeypatch_home, monkeypatch):
     """Test that load_config returns default values when no config file exists."""
@@ -171,6 +203,30 @@ def test_save_config_creates_parent_directory(tmp_path, monkeypatch):
     assert json.loads(config_path.read_text(encoding="utf-8"))["language"] == "en"
 
 
+@pytest.mark.unit
+def test_save_config_serializes_a_snapshot_under_lock(tmp_path, monkeypatch):
+    """The dump sees cfg as it was at call time and runs while the save lock is held."""
+    config_path = tmp_path / "whisprbar.json"
+    monkeypatch.setattr(config, "CONFIG_PATH", config_path)
+    config.cfg["language"] = "en"
+    real_dumps = config.json_dumps
+    seen = []
+
+    def mutating_dumps(obj, indent=False):
+        seen.append(config._save_config_lock.locked())
+        config.cfg["language"] = "de"
+        config.cfg["added_mid_dump"] = True
+        return real_dumps(obj, indent=indent)
+
+    monkeypatch.setattr(config, "json_dumps", mutating_dumps)
+    config.save_config()
+
+    saved = json.loads(config_path.read_text(encoding="utf-8"))
+    assert seen == [True]
+    assert saved["language"] == "en"
+    assert "added_mid_dump" not in saved
+
+
 @pytest.mark.unit
 def test_save_env_file_value_rejects_newline_in_value(tmp_path, monkeypatch):
     """A pasted secret must not be able to inject additional env-file keys."""
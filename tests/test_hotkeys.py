@@ -217,6 +217,18 @@ def test_hotkey_event_matches_keeps_modifier_only_hotkeys_working():
     assert hotkeys.hotkey_event_matches("CTRL_R", {"CTRL", "ALT"}, frozenset(), "CTRL_R") is False
 
 
+@pytest.mark.unit
+def test_hotkey_mask_matches_uses_exact_modifier_masks():
+    """Bitmask matching mirrors the set-based exact-modifier semantics."""
+    ctrl = hotkeys.modifiers_to_mask({"CTRL"})
+    ctrl_alt = hotkeys.modifiers_to_mask({"CTRL", "ALT"})
+
+    assert hotkeys.hotkey_mask_matches("F9", ctrl, ctrl, "F9") is True
+    assert hotkeys.hotkey_mask_matches("F9", ctrl_alt, ctrl, "F9") is False
+    assert hotkeys.hotkey_mask_matches("F8", ctrl, ctrl, "F9") is False
+    assert hotkeys.hotkey_mask_matches("CTRL_R", ctrl, 0, "CTRL_R") is True
+
+
 @pytest.mark.unit
 def test_event_to_token_fkeys():
     """Test converting keyboard events to tokens for F-keys."""
@@ -103,7 +103,7 @@ def test_on_recording_stop_starts_only_one_background_thread_for_transcription(
     from whisprbar.ui import recording_indicator
 
     monkeypatch.setattr(audio, "apply_noise_reduction", lambda audio_data: audio_data)
-    monkeypatch.setattr(audio, "apply_vad", lambda audio_data: audio_data)
+    monkeypatch.setattr(audio, "apply_vad", lambda audio_data, **_kwargs: audio_data)
     monkeypatch.setattr(ui, "show_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "update_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "hide_live_overlay", lambda *_args, **_kwargs: None)
@@ -163,7 +163,7 @@ def test_on_recording_stop_does_not_lower_process_priority(monkeypatch, mock_con
     from whisprbar.ui import recording_indicator
 
     monkeypatch.setattr(audio, "apply_noise_reduction", lambda audio_data: audio_data)
-    monkeypatch.setattr(audio, "apply_vad", lambda audio_data: audio_data)
+    monkeypatch.setattr(audio, "apply_vad", lambda audio_data, **_kwargs: audio_data)
     monkeypatch.setattr(ui, "show_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "update_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "hide_live_overlay", lambda *_args, **_kwargs: None)
@@ -331,7 +331,7 @@ def test_on_recording_stop_claims_live_session_before_publishing_idle(monkeypatc
     from whisprbar.ui import recording_indicator
 
     monkeypatch.setattr(audio, "apply_noise_reduction", lambda audio_data: audio_data)
-    monkeypatch.setattr(audio, "apply_vad", lambda audio_data: audio_data)
+    monkeypatch.setattr(audio, "apply_vad", lambda audio_data, **_kwargs: audio_data)
     monkeypatch.setattr(ui, "show_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "update_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "hide_live_overlay", lambda *_args, **_kwargs: None)
@@ -443,7 +443,7 @@ def test_on_recording_stop_without_live_session_does_not_claim_new_recording(mon
     from whisprbar.ui import recording_indicator
 
     monkeypatch.setattr(audio, "apply_noise_reduction", lambda audio_data: audio_data)
-    monkeypatch.setattr(audio, "apply_vad", lambda audio_data: audio_data)
+    monkeypatch.setattr(audio, "apply_vad", lambda audio_data, **_kwargs: audio_data)
     monkeypatch.setattr(ui, "show_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "update_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "hide_live_overlay", lambda *_args, **_kwargs: None)
@@ -609,7 +609,7 @@ def test_on_recording_stop_skips_noise_reduction_for_live_session(monkeypatch, m
         raise AssertionError("noise reduction should not run for live sessions")
 
     monkeypatch.setattr(audio, "apply_noise_reduction", fail_noise_reduction)
-    monkeypatch.setattr(audio, "apply_vad", lambda audio_data: audio_data)
+    monkeypatch.setattr(audio, "apply_vad", lambda audio_data, **_kwargs: audio_data)
     monkeypatch.setattr(ui, "show_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "update_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "hide_live_overlay", lambda *_args, **_kwargs: None)
@@ -684,7 +684,7 @@ def test_on_recording_stop_starts_live_finish_before_vad(monkeypatch, mock_confi
     from whisprbar.ui import recording_indicator
 
     monkeypatch.setattr(audio, "apply_noise_reduction", lambda audio_data: audio_data)
-    monkeypatch.setattr(audio, "apply_vad", lambda audio_data: order.append("vad") or audio_data)
+    monkeypatch.setattr(audio, "apply_vad", lambda audio_data, **_kwargs: order.append("vad") or audio_data)
     monkeypatch.setattr(ui, "show_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "update_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "hide_live_overlay", lambda *_args, **_kwargs: None)
@@ -747,7 +747,7 @@ def test_on_recording_stop_does_not_hide_success_overlay_immediately(monkeypatch
     from whisprbar.ui import recording_indicator
 
     monkeypatch.setattr(audio, "apply_noise_reduction", lambda audio_data: audio_data)
-    monkeypatch.setattr(audio, "apply_vad", lambda audio_data: audio_data)
+    monkeypatch.setattr(audio, "apply_vad", lambda audio_data, **_kwargs: audio_data)
     monkeypatch.setattr(ui, "show_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "update_live_overlay", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(ui, "hide_live_overlay", lambda: hide_calls.append("hide"))
@@ -239,6 +239,55 @@ def test_start_live_transcription_session_stores_backend_session(monkeypatch):
     assert main._active_live_transcription_session is session
 
 
+@pytest.mark.unit
+def test_on_recording_start_prepares_backend_in_background(monkeypatch):
+    """Recording start warms the transcriber on a daemon thread until it succeeds once."""
+    from whisprbar import main
+    from whisprbar.ui import recording_indicator
+
+    started = []
+
+    class ImmediateThread:
+        def __init__(self, target=None, args=(), daemon=None, **kwargs):
+            self._target = target
+            self._args = args
+            started.append((kwargs.get("name"), daemon))
+
+        def start(self):
+            self._target(*self._args)
+
+    transcriber = MagicMock()
+    transcriber.prepare.side_effect = RuntimeError("no API key")
+    monkeypatch.setattr(main.threading, "Thread", ImmediateThread)
+    monkeypatch.setattr(main, "get_transcriber", lambda: transcriber)
+    monkeypatch.setattr(main, "refresh_tray_indicator", lambda _state: None)
+    monkeypatch.setattr(main, "refresh_menu", lambda _callbacks, _state: None)
+    monkeypatch.setattr(main, "get_callbacks", lambda: {})
+    monkeypatch.setattr(main, "play_audio_feedback", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(recording_indicator, "show_recording_indicator", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(main.state, "recording", False)
+    monkeypatch.setattr(main, "_warmup_in_flight", False)
+    monkeypatch.setattr(main, "_warmed_backend", None)
+    monkeypatch.setitem(main.cfg, "transcription_backend", "openai")
+
+    main.on_recording_start()
+
+    assert started == [("whisprbar-asr-prepare", True)]
+    transcriber.prepare.assert_called_once_with()
+
+    # A failed warm-up is retried; a successful one is not repeated
+    transcriber.prepare.side_effect = None
+    main.on_recording_start()
+    main.on_recording_start()
+    assert len(started) == 2
+    assert transcriber.prepare.call_count == 2
+
+    # Switching backends warms the new one
+    monkeypatch.setitem(main.cfg, "transcription_backend", "deepgram")
+    main.on_recording_start()
+    assert len(started) == 3
+
+
 @pytest.mark.unit
 def test_push_live_audio_chunk_forwards_to_active_session(monkeypatch):
     """Captured audio frames should be sent to the active live backend session."""
@@ -73,18 +73,12 @@ def test_register_configured_hotkeys_restarts_listener_when_requested(mock_confi
     assert manager.start_calls == 1
 
 
-@pytest.mark.unit
-def test_main_releases_resources_when_tray_startup_fails(monkeypatch):
-    """Tray startup failures should stop hotkeys and release the singleton lock."""
-    manager = DummyHotkeyManager()
-    manager.set_special_handlers = lambda **_kwargs: None
-
+def _patch_main_startup(monkeypatch, manager):
+    """Stub main() startup steps up to a tray start that raises 'tray boom'."""
     monkeypatch.setattr(main, "ensure_stdin_open", lambda: None)
     monkeypatch.setattr(main, "acquire_singleton_lock", lambda: True)
-    release_singleton_lock = MagicMock()
-    monkeypatch.setattr(main, "release_singleton_lock", release_singleton_lock)
-    shutdown_tray = MagicMock()
-    monkeypatch.setattr(main, "shutdown_tray", shutdown_tray)
+    monkeypatch.setattr(main, "release_singleton_lock", MagicMock())
+    monkeypatch.setattr(main, "shutdown_tray", MagicMock())
     monkeypatch.setattr(main, "load_config", lambda: config.cfg)
     monkeypatch.setattr(main, "detect_session_type", lambda: "x11")
     monkeypatch.setattr(main, "select_tray_backend", lambda: "gtk")
@@ -113,13 +107,54 @@ def test_main_releases_resources_when_tray_startup_fails(monkeypatch):
     else:
         monkeypatch.setattr("gi.repository.GLib.timeout_add", lambda *_args, **_kwargs: None)
 
+
+@pytest.mark.unit
+def test_main_releases_resources_when_tray_startup_fails(monkeypatch):
+    """Tray startup failures should stop hotkeys and release the singleton lock."""
+    manager = DummyHotkeyManager()
+    manager.set_special_handlers = lambda **_kwargs: None
+
+    _patch_main_startup(monkeypatch, manager)
+
     with pytest.raises(RuntimeError, match="tray boom"):
         main.main()
 
     assert manager.start_calls == 1
     assert manager.stop_calls == 1
-    shutdown_tray.assert_called_once()
-    release_singleton_lock.assert_called_once()
+    main.shutdown_tray.assert_called_once()
+    main.release_singleton_lock.assert_called_once()
+
+
+@pytest.mark.unit
+def test_main_probes_audio_device_on_daemon_thread(monkeypatch):
+    """The device lookup runs on a daemon thread; the client preflight stays inline."""
+    import threading
+
+    manager = DummyHotkeyManager()
+    manager.set_special_handlers = lambda **_kwargs: None
+    _patch_main_startup(monkeypatch, manager)
+    monkeypatch.setitem(config.cfg, "transcription_backend", "openai")
+    probes = {}
+    device_done = threading.Event()
+
+    def client_probe():
+        probes["client"] = threading.current_thread()
+        return True
+
+    def device_probe():
+        probes["device"] = threading.current_thread()
+        device_done.set()
+
+    monkeypatch.setattr(main, "prepare_openai_client", client_probe)
+    monkeypatch.setattr(main, "update_device_index", device_probe)
+
+    with pytest.raises(RuntimeError, match="tray boom"):
+        main.main()
+
+    assert device_done.wait(timeout=2.0)
+    assert probes["client"] is threading.main_thread()
+    assert probes["device"].name == "whisprbar-device-probe"
+    assert probes["device"].daemon is True
 
 
 @pytest.mark.unit
@@ -145,3 +180,35 @@ def test_register_configured_hotkeys_show_history_uses_real_callback(mock_config
     manager.registered["show_history"]["callback"]()
 
     open_history.assert_called_once_with()
+
+
+@pytest.mark.unit
+def test_schedule_idle_coalesces_tasks_with_the_same_tag(monkeypatch):
+    """Repeated requests for a queued tag run once; the tag frees up after it runs."""
+    import builtins
+    import types
+
+    original_import = builtins.__import__
+    queued = []
+    fake_repository = types.SimpleNamespace(GLib=types.SimpleNamespace(idle_add=queued.append))
+
+    def fake_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if name == "gi.repository" and "GLib" in fromlist:
+            return fake_repository
+        return original_import(name, globals, locals, fromlist, level)
+
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+    monkeypatch.setattr(main, "_idle_tasks", set())
+    runs = []
+
+    main.schedule_idle("tray_refresh", lambda: runs.append("refresh"))
+    main.schedule_idle("tray_refresh", lambda: runs.append("duplicate"))
+    main.schedule_idle("open_history", lambda: runs.append("history"))
+
+    assert len(queued) == 2
+    for callback in queued:
+        assert callback() is False
+    assert runs == ["refresh", "history"]
+
+    main.schedule_idle("tray_refresh", lambda: runs.append("again"))
+    assert len(queued) == 3
@@ -1,13 +1,30 @@
 """Unit tests for whisprbar.paste module."""
 
+import shutil
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from whisprbar import paste
+from whisprbar import paste, utils
 from whisprbar.flow.models import PastePolicy
 
 
+@pytest.fixture(autouse=True)
+def reset_auto_paste_cache(monkeypatch):
+    """Start every test without cached paste detection, session type, command lookups or libxdo."""
+    utils.clear_command_cache()
+    paste.is_wayland_session.cache_clear()
+    monkeypatch.setattr(
+        paste, "_AUTO_PASTE_CACHE", {"sequence": "ctrl_v", "timestamp": 0.0, "win_id": None}
+    )
+    monkeypatch.setattr(paste, "LIBXDO_AVAILABLE", False)
+    monkeypatch.setattr(paste, "_xdo_instance", None)
+    monkeypatch.setattr(paste, "_xdo_init_failed", False)
+    yield
+    utils.clear_command_cache()
+    paste.is_wayland_session.cache_clear()
+
+
 @pytest.mark.unit
 def test_is_wayland_session_true(monkeypatch):
     """Test is_wayland_session returns True for Wayland."""
@@ -15,6 +32,19 @@ def test_is_wayland_session_true(monkeypatch):
     assert paste.is_wayland_session() is True
 
 
+@pytest.mark.unit
+def test_is_wayland_session_is_computed_once(monkeypatch):
+    """The session type is cached until the cache is cleared."""
+    monkeypatch.setenv("XDG_SESSION_TYPE", "wayland")
+    assert paste.is_wayland_session() is True
+
+    monkeypatch.setenv("XDG_SESSION_TYPE", "x11")
+    assert paste.is_wayland_session() is True
+
+    paste.is_wayland_session.cache_clear()
+    assert paste.is_wayland_session() is False
+
+
 @pytest.mark.unit
 def test_is_wayland_session_false(monkeypatch):
     """Test is_wayland_session returns False for X11."""
@@ -134,6 +164,64 @@ def test_detect_auto_paste_sequence_terminal_detection(monkeypatch):
             assert result == "ctrl_shift_v"
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "name, class_name, expected",
+    [
+        ("~/src - fish", 'wm_class(string) = "kitty", "kitty"', "ctrl_shift_v"),
+        ("user@host: ~ - tmux", "", "ctrl_shift_v"),
+        ("Inbox - Mozilla Thunderbird", 'wm_class(string) = "mail", "thunderbird"', "ctrl_v"),
+        ("", "", "ctrl_v"),
+    ],
+)
+def test_classify_window_paste_sequence_matches_terminal_keywords(
+    monkeypatch, name, class_name, expected
+):
+    """Terminal keywords in either the window name or class select Ctrl+Shift+V."""
+
+    def mock_run(args, **kwargs):
+        if "getwindowname" in args:
+            return MagicMock(returncode=0, stdout=f"{name}\n")
+        return MagicMock(returncode=0, stdout=class_name)
+
+    monkeypatch.setattr(shutil, "which", lambda binary, path=None: f"/usr/bin/{binary}")
+    with patch("whisprbar.paste._run_paste_command", side_effect=mock_run):
+        assert paste._classify_window_paste_sequence("/usr/bin/xdotool", "42") == expected
+
+
+@pytest.mark.unit
+def test_detect_auto_paste_sequence_reuses_result_for_same_window(monkeypatch):
+    """Same focused window within the TTL skips the name/class lookups."""
+    active = {"win_id": "111"}
+    calls = []
+
+    def mock_run(args, **kwargs):
+        calls.append(args[1] if "xdotool" in args[0] else "xprop")
+        if "getactivewindow" in args:
+            return MagicMock(returncode=0, stdout=f"{active['win_id']}\n")
+        if "getwindowname" in args:
+            return MagicMock(returncode=0, stdout="Konsole\n")
+        return MagicMock(returncode=0, stdout="")
+
+    monkeypatch.setattr(shutil, "which", lambda name, path=None: f"/usr/bin/{name}")
+    with patch("whisprbar.paste._run_paste_command", side_effect=mock_run):
+        assert paste._detect_auto_paste_sequence_blocking("/usr/bin/xdotool") == "ctrl_shift_v"
+        assert paste._detect_auto_paste_sequence_blocking("/usr/bin/xdotool") == "ctrl_shift_v"
+        assert calls == ["getactivewindow", "getwindowname", "xprop", "getactivewindow"]
+
+        # Focus change re-detects
+        active["win_id"] = "222"
+        calls.clear()
+        paste._detect_auto_paste_sequence_blocking("/usr/bin/xdotool")
+        assert calls == ["getactivewindow", "getwindowname", "xprop"]
+
+        # Expired entries re-detect too
+        paste._AUTO_PASTE_CACHE["timestamp"] -= paste.AUTO_PASTE_CACHE_TTL
+        calls.clear()
+        paste._detect_auto_paste_sequence_blocking("/usr/bin/xdotool")
+        assert calls == ["getactivewindow", "getwindowname", "xprop"]
+
+
 @pytest.mark.unit
 def test_detect_auto_paste_sequence_no_active_window_returns_clipboard(monkeypatch):
     """No active X11 window means the transcript should stay in the clipboard."""
@@ -230,6 +318,64 @@ def test_perform_auto_paste_ctrl_v_with_xdotool(monkeypatch, mock_config):
                 assert result.sequence == "ctrl_v"
 
 
+@pytest.mark.unit
+def test_perform_auto_paste_uses_libxdo_without_forking(monkeypatch, mock_config):
+    """With python-libxdo available the paste keystroke is sent in-process."""
+    monkeypatch.setenv("XDG_SESSION_TYPE", "x11")
+    mock_config["paste_sequence"] = "ctrl_shift_v"
+    mock_config["paste_delay_ms"] = 0
+    paste.cfg = mock_config
+
+    xdo_instance = MagicMock()
+    xdo_module = MagicMock(CURRENTWINDOW=0)
+    xdo_module.Xdo.return_value = xdo_instance
+    monkeypatch.setattr(paste, "LIBXDO_AVAILABLE", True)
+    monkeypatch.setattr(paste, "_xdo_module", xdo_module)
+
+    with patch("whisprbar.paste.copy_to_clipboard", return_value=True):
+        with patch("subprocess.run") as mock_run:
+            first = paste.perform_auto_paste("Test")
+            second = paste.perform_auto_paste("Test")
+
+    mock_run.assert_not_called()
+    xdo_module.Xdo.assert_called_once()
+    xdo_instance.send_keysequence_window.assert_called_with(0, b"ctrl+Shift+v")
+    assert first.status == second.status == "inserted"
+
+
+@pytest.mark.unit
+def test_send_keysequence_holds_xdo_lock_while_sending(monkeypatch):
+    """Calls on the shared libxdo X connection are serialized by _xdo_lock."""
+    held = []
+    xdo_instance = MagicMock()
+    xdo_instance.send_keysequence_window.side_effect = lambda *_args: held.append(paste._xdo_lock.locked())
+    xdo_module = MagicMock(CURRENTWINDOW=0)
+    xdo_module.Xdo.return_value = xdo_instance
+    monkeypatch.setattr(paste, "LIBXDO_AVAILABLE", True)
+    monkeypatch.setattr(paste, "_xdo_module", xdo_module)
+
+    assert paste._send_keysequence("ctrl+v") is True
+    assert held == [True]
+    assert not paste._xdo_lock.locked()
+
+
+@pytest.mark.unit
+def test_send_keysequence_falls_back_to_xdotool_when_libxdo_fails(monkeypatch):
+    """A failed libxdo init is remembered and xdotool is used instead."""
+    xdo_module = MagicMock()
+    xdo_module.Xdo.side_effect = RuntimeError("no display")
+    monkeypatch.setattr(paste, "LIBXDO_AVAILABLE", True)
+    monkeypatch.setattr(paste, "_xdo_module", xdo_module)
+
+    with patch("shutil.which", return_value="/usr/bin/xdotool"):
+        with patch("subprocess.run", return_value=MagicMock(returncode=0)) as mock_run:
+            assert paste._send_keysequence("ctrl+v") is True
+            assert paste._send_keysequence("ctrl+v") is True
+
+    xdo_module.Xdo.assert_called_once()
+    assert mock_run.call_args[0][0] == ["/usr/bin/xdotool", "key", "ctrl+v"]
+
+
 @pytest.mark.unit
 def test_perform_auto_paste_policy_overrides_sequence_and_spacing(monkeypatch, mock_config):
     """PastePolicy can override one paste without mutating global cfg."""
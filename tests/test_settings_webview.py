@@ -482,6 +482,7 @@ def test_apply_settings_payload_updates_config_env_and_flow_files():
         save_dictionary_func=lambda entries: saved_dictionary.extend(entries),
         save_snippets_func=lambda entries: saved_snippets.extend(entries),
         update_device_func=lambda: updated_devices.append(True),
+        device_stale_func=lambda: False,
         reset_indicator_func=lambda: None,
         vad_available=True,
         noise_reduction_available=True,
@@ -507,6 +508,81 @@ def test_apply_settings_payload_updates_config_env_and_flow_files():
     assert state["wayland_notice_shown"] is False
 
 
+def test_apply_settings_payload_skips_writes_when_nothing_changed():
+    config = {"hotkeys": {"toggle_recording": "F9"}, "hotkey": "F9"}
+    saved_config = []
+    updated_devices = []
+    stale = {"value": False}
+
+    def apply(settings):
+        return apply_settings_payload(
+            config,
+            {"settings": settings, "hotkeys": {}, "api_keys": {}, "dictionary": [], "snippets": []},
+            save_config_func=lambda: saved_config.append(True),
+            save_env_func=lambda _key, _value: None,
+            save_dictionary_func=lambda _entries: None,
+            save_snippets_func=lambda _entries: None,
+            update_device_func=lambda: updated_devices.append(True),
+            device_stale_func=lambda: stale["value"],
+            reset_indicator_func=lambda: None,
+        )
+
+    first = apply({"device_name": "Studio Mic"})
+    assert first.changed is True
+    assert saved_config == [True]
+    assert updated_devices == [True]
+
+    again = apply({"device_name": "Studio Mic"})
+    assert again.ok is True
+    assert again.changed is False
+    assert saved_config == [True]
+
+    theme_only = apply({"device_name": "Studio Mic", "theme_preference": "dark"})
+    assert theme_only.changed is True
+    assert saved_config == [True, True]
+    assert updated_devices == [True]
+
+    # Same device name, but its index went stale after a re-scan
+    stale["value"] = True
+    apply({"device_name": "Studio Mic", "theme_preference": "light"})
+    assert updated_devices == [True, True]
+
+
+def test_apply_settings_payload_saves_inline_and_probes_device_on_worker_when_async():
+    import threading
+
+    config = {"hotkeys": {"toggle_recording": "F9"}, "hotkey": "F9"}
+    save_threads = []
+    device_threads = []
+    persisted = threading.Event()
+
+    result = apply_settings_payload(
+        config,
+        {
+            "settings": {"device_name": "Studio Mic"},
+            "hotkeys": {},
+            "api_keys": {},
+            "dictionary": [],
+            "snippets": [],
+        },
+        save_config_func=lambda: save_threads.append(threading.current_thread().name),
+        save_env_func=lambda _key, _value: None,
+        save_dictionary_func=lambda _entries: None,
+        save_snippets_func=lambda _entries: None,
+        update_device_func=lambda: device_threads.append(threading.current_thread().name),
+        device_stale_func=lambda: False,
+        reset_indicator_func=lambda: None,
+        persist_async=True,
+        on_persisted=persisted.set,
+    )
+
+    assert result.ok is True
+    assert result.changed is True
+    assert persisted.wait(timeout=2.0)
+    assert save_threads == [threading.current_thread().name]
+    assert device_threads == ["whisprbar-settings-save"]
+
+
 def test_apply_settings_payload_rejects_hotkey_conflicts_without_writing():
     config = {"hotkeys": {"toggle_recording": "F9"}, "hotkey": "F9"}
     saved_config = []
@@ -528,6 +604,7 @@ def test_apply_settings_payload_rejects_hotkey_conflicts_without_writing():
         save_dictionary_func=lambda _entries: None,
         save_snippets_func=lambda _entries: None,
         update_device_func=lambda: None,
+        device_stale_func=lambda: False,
     )
 
     assert result.ok is False
@@ -574,6 +651,7 @@ def test_apply_settings_payload_clamps_runtime_sensitive_values():
         save_dictionary_func=lambda _entries: None,
         save_snippets_func=lambda _entries: None,
         update_device_func=lambda: None,
+        device_stale_func=lambda: False,
         reset_indicator_func=lambda: None,
     )
 
@@ -258,6 +258,39 @@ def test_openai_transcriber_get_name():
     assert transcriber.get_name() == "OpenAI Whisper API"
 
 
+@pytest.mark.unit
+def test_openai_transcriber_uploads_in_memory_wav():
+    """The WAV is passed to the SDK as a bytes tuple, not a temp file handle."""
+    from whisprbar.audio import encode_wav_pcm16
+
+    transcriber = transcription.OpenAITranscriber()
+    transcriber.client = MagicMock()
+    transcriber.client.audio.transcriptions.create.return_value = SimpleNamespace(text=" hello ")
+    audio = np.full(1600, 0.25, dtype=np.float32)
+
+    assert transcriber.transcribe(audio, "en") == "hello"
+
+    kwargs = transcriber.client.audio.transcriptions.create.call_args.kwargs
+    assert kwargs["file"] == ("audio.wav", encode_wav_pcm16(audio), "audio/wav")
+    assert kwargs["language"] == "en"
+
+
+@pytest.mark.unit
+def test_transcriber_prepare_runs_backend_setup():
+    """prepare() is a no-op by default and creates clients/models for real backends."""
+    transcription.Transcriber().prepare()
+
+    openai = transcription.OpenAITranscriber()
+    openai.ensure_client = MagicMock(return_value=True)
+    openai.prepare()
+    openai.ensure_client.assert_called_once_with()
+
+    local = transcription.FasterWhisperTranscriber()
+    local.ensure_model = MagicMock(return_value=True)
+    local.prepare()
+    local.ensure_model.assert_called_once_with()
+
+
 @pytest.mark.unit
 def test_faster_whisper_transcriber_get_name():
     """Test FasterWhisperTranscriber.get_name()."""
@@ -281,6 +314,38 @@ def test_streaming_transcriber_supports_streaming():
     assert transcriber.supports_streaming() is True
 
 
+@pytest.mark.unit
+def test_transcribe_audio_converts_pcm16_for_float_backends(mock_config, monkeypatch):
+    """int16 VAD output reaches float-only backends as float32 samples."""
+    from whisprbar import config
+    from whisprbar.transcription import chunking
+
+    config.cfg.clear()
+    config.cfg.update(mock_config)
+    config.cfg["postprocess_enabled"] = False
+
+    received = []
+
+    class FloatOnlyTranscriber(transcription.Transcriber):
+        def transcribe(self, audio, language="de"):
+            received.append(audio)
+            return "hello"
+
+        def get_name(self):
+            return "FloatOnly"
+
+    monkeypatch.setattr(chunking, "get_transcriber", lambda: FloatOnlyTranscriber())
+    monkeypatch.setattr(chunking, "update_live_overlay", lambda *args, **kwargs: None)
+    monkeypatch.setattr(chunking, "hide_live_overlay", lambda *args, **kwargs: None)
+
+    pcm16 = np.full(16000, 16384, dtype=np.int16)
+    assert chunking.transcribe_audio(pcm16, "en") == "hello"
+
+    assert received[0].dtype == np.float32
+    assert np.allclose(received[0], 0.5)
+    assert transcription.OpenAITranscriber().accepts_pcm16() is True
+
+
 @pytest.mark.unit
 def test_transcriber_start_streaming_default_none():
     """Batch-only backends should opt out of live streaming by default."""
@@ -331,7 +396,7 @@ def test_elevenlabs_audio_chunk_to_base64_encodes_pcm16():
     )
 
     pcm16 = np.frombuffer(base64.b64decode(encoded), dtype=np.int16)
-    assert pcm16.tolist() == [-32767, 0, 16383, 32767, 32767]
+    assert pcm16.tolist() == [-32768, 0, 16384, 32767, 32767]
 
 
 @pytest.mark.unit
@@ -55,10 +55,15 @@ class DummyMenuItem:
     """PyStray menu item stub that records labels and handlers."""
 
     def __init__(self, text, action=None, **kwargs):
-        self.text = text
+        self._text = text
         self.action = action
         self.kwargs = kwargs
 
+    @property
+    def text(self):
+        # Mirror pystray: callable labels are evaluated on each read
+        return self._text(self) if callable(self._text) else self._text
+
 
 class DummyMenu:
     """PyStray menu stub with separator support."""
@@ -89,11 +94,16 @@ class DummyGtkMenuItem:
     def __init__(self, label=None):
         self.label = label
         self.handlers = {}
+        self.handler_data = {}
         self.sensitive = True
         self.submenu = None
 
-    def connect(self, event, handler):
+    def connect(self, event, handler, *user_data):
         self.handlers[event] = handler
+        self.handler_data[event] = user_data
+
+    def activate(self):
+        self.handlers["activate"](self, *self.handler_data["activate"])
 
     def set_sensitive(self, value):
         self.sensitive = value
@@ -116,8 +126,10 @@ class DummyGtkCheckMenuItem(DummyGtkMenuItem):
 class ImmediateGLib:
     """GLib stub that executes idle callbacks synchronously."""
 
+    PRIORITY_LOW = 300
+
     @staticmethod
-    def idle_add(callback):
+    def idle_add(callback, priority=None):
         callback()
 
 
@@ -149,6 +161,67 @@ def test_get_tray_labels_follow_config_language():
     assert english["quit"] == "Quit"
 
 
+@pytest.mark.unit
+def test_get_tray_labels_translates_each_language_once(monkeypatch):
+    """Label sets are memoized per language and handed out as copies."""
+    calls = []
+    real_t = tray.t
+    tray._tray_labels_for_language.cache_clear()
+    monkeypatch.setattr(tray, "t", lambda key, config=None: calls.append(key) or real_t(key, config))
+
+    try:
+        first = tray.get_tray_labels({"language": "en"})
+        first["quit"] = "changed"
+        second = tray.get_tray_labels({"language": "en"})
+
+        assert second["quit"] == "Quit"
+        assert len(calls) == len(tray._TRAY_LABEL_NAMES)
+
+        assert tray.get_tray_labels({"language": "de"})["quit"] == "Beenden"
+        assert len(calls) == 2 * len(tray._TRAY_LABEL_NAMES)
+    finally:
+        tray._tray_labels_for_language.cache_clear()
+
+
+@pytest.mark.unit
+def test_icons_reuse_stored_files_keyed_by_render_parameters(monkeypatch_home, monkeypatch):
+    """Stored icon files are reused per render key and re-rendered when corrupt or stale."""
+    import io
+
+    from PIL import Image
+
+    def png(color):
+        buffer = io.BytesIO()
+        Image.new("RGBA", (4, 4), color).save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    renders = []
+    monkeypatch.setattr(tray, "ensure_directories", lambda: None)
+    monkeypatch.setattr(tray, "render_icon_png", lambda state: renders.append(state) or png("red"))
+    monkeypatch.setattr(tray, "icon_render_key", lambda state: "key1")
+    icons_dir = monkeypatch_home / ".local" / "share" / "whisprbar" / "icons"
+
+    image, path = tray._load_icon("ready")
+    assert path == str(icons_dir / "ready-key1.png")
+    assert image.size == (4, 4)
+    tray._load_icon("ready")
+    assert renders == ["ready"]
+
+    # A truncated file is re-rendered and rewritten instead of crashing startup
+    (icons_dir / "ready-key1.png").write_bytes(b"\x89PNG\r\n")
+    tray._load_icon("ready")
+    assert renders == ["ready", "ready"]
+    tray._load_icon("ready")
+    assert renders == ["ready", "ready"]
+
+    # New render parameters produce a new file and drop the old one
+    monkeypatch.setattr(tray, "icon_render_key", lambda state: "key2")
+    _image, path = tray._load_icon("ready")
+    assert path == str(icons_dir / "ready-key2.png")
+    assert renders == ["ready"] * 3
+    assert sorted(p.name for p in icons_dir.glob("ready-*.png")) == ["ready-key2.png"]
+
+
 @pytest.mark.unit
 def test_pystray_menu_includes_status_toggle_and_diagnostics(monkeypatch):
     """PyStray menu should expose current status, primary toggle, and diagnostics."""
@@ -187,6 +260,52 @@ def test_pystray_menu_includes_status_toggle_and_diagnostics(monkeypatch):
     assert diagnostics_calls == ["diagnostics"]
 
 
+@pytest.mark.unit
+def test_pystray_vad_checkmark_is_evaluated_live(monkeypatch):
+    """The VAD checkmark reads cfg on each paint, so a toggle needs no menu rebuild."""
+    dummy_pystray = SimpleNamespace(Menu=DummyMenu, MenuItem=DummyMenuItem)
+    callbacks = {
+        "toggle_vad": lambda: None,
+        "open_settings": lambda: None,
+        "quit": lambda: None,
+    }
+    config = {"language": "en", "use_vad": True}
+
+    monkeypatch.setattr(tray, "pystray", dummy_pystray)
+    monkeypatch.setattr(tray, "cfg", config)
+    monkeypatch.setattr(tray, "read_history", lambda limit=10: [])
+
+    menu = tray.build_pystray_menu(callbacks, {})
+    vad_item = next(item for item in menu.items if getattr(item, "text", "") == "Voice detection (VAD)")
+    assert vad_item.kwargs["checked"](vad_item) is True
+
+    config["use_vad"] = False
+    assert vad_item.kwargs["checked"](vad_item) is False
+
+
+@pytest.mark.unit
+def test_pystray_status_items_follow_state_without_rebuild(monkeypatch):
+    """Status and recording action labels are read from state on each paint."""
+    dummy_pystray = SimpleNamespace(Menu=DummyMenu, MenuItem=DummyMenuItem)
+    callbacks = {
+        "toggle_recording": lambda: None,
+        "toggle_vad": lambda: None,
+        "open_settings": lambda: None,
+        "quit": lambda: None,
+    }
+    state = {"recording": False}
+
+    monkeypatch.setattr(tray, "pystray", dummy_pystray)
+    monkeypatch.setattr(tray, "cfg", {"language": "en"})
+    monkeypatch.setattr(tray, "read_history", lambda limit=10: [])
+
+    menu = tray.build_pystray_menu(callbacks, state)
+    assert [menu.items[0].text, menu.items[1].text] == ["Ready", "Start recording"]
+
+    state["recording"] = True
+    assert [menu.items[0].text, menu.items[1].text] == ["Recording", "Stop recording"]
+
+
 @pytest.mark.unit
 def test_pystray_menu_uses_stop_label_while_recording(monkeypatch):
     """The primary PyStray action should switch to Stop recording when active."""
@@ -215,7 +334,7 @@ def test_appindicator_refresh_uses_compact_panel_label(monkeypatch, tmp_path):
     appindicator = SimpleNamespace(IndicatorStatus=SimpleNamespace(ACTIVE="active"))
 
     monkeypatch.setattr(tray, "_indicator", indicator)
-    monkeypatch.setattr(tray, "_icon_files", {"recording": tmp_path / "recording.png"})
+    monkeypatch.setattr(tray, "_icon_files", {"recording": str(tmp_path / "recording.png")})
     monkeypatch.setattr(tray, "cfg", {"language": "en"})
     monkeypatch.setattr(tray, "GLib", ImmediateGLib)
     monkeypatch.setattr(tray, "AppIndicator3", appindicator)
@@ -226,6 +345,145 @@ def test_appindicator_refresh_uses_compact_panel_label(monkeypatch, tmp_path):
     assert indicator.labels == [("REC", "WhisprBar")]
 
 
+@pytest.mark.unit
+def test_appindicator_refreshes_coalesce_into_one_idle_callback(monkeypatch, tmp_path):
+    """A burst of icon/menu refreshes should schedule a single GTK update."""
+    indicator = DummyIndicator()
+    indicator.menus = []
+    indicator.set_menu = indicator.menus.append
+    appindicator = SimpleNamespace(IndicatorStatus=SimpleNamespace(ACTIVE="active"))
+    scheduled = []
+    built = []
+
+    def fake_build_menu(callbacks, state):
+        built.append(dict(state))
+        return DummyGtkMenu()
+
+    monkeypatch.setattr(tray, "_indicator", indicator)
+    monkeypatch.setattr(
+        tray,
+        "_icon_files",
+        {"ready": str(tmp_path / "ready.png"), "recording": str(tmp_path / "recording.png")},
+    )
+    monkeypatch.setattr(tray, "cfg", {"language": "en"})
+    monkeypatch.setattr(
+        tray,
+        "GLib",
+        SimpleNamespace(
+            PRIORITY_LOW=300,
+            idle_add=lambda callback, priority=None: scheduled.append((callback, priority)),
+        ),
+    )
+    monkeypatch.setattr(tray, "AppIndicator3", appindicator)
+    monkeypatch.setattr(tray, "build_appindicator_menu", fake_build_menu)
+    monkeypatch.setattr(tray, "_pending_refresh", {})
+    monkeypatch.setattr(tray, "_refresh_scheduled", False)
+    monkeypatch.setattr(tray, "_menu_signature", None)
+    monkeypatch.setattr(tray, "HIST_FILE", tmp_path / "history.jsonl")
+
+    tray.refresh_tray_indicator({"tray_backend": "appindicator", "recording": False})
+    tray.refresh_menu({}, {"tray_backend": "appindicator", "recording": False})
+    tray.refresh_tray_indicator({"tray_backend": "appindicator", "recording": True})
+    tray.refresh_menu({}, {"tray_backend": "appindicator", "recording": True})
+
+    assert len(scheduled) == 1
+    callback, priority = scheduled[0]
+    assert priority == 300
+    assert callback() is False
+
+    assert indicator.icon_tooltips == [(str(tmp_path / "recording.png"), "Recording")]
+    assert [state["recording"] for state in built] == [True]
+    assert len(indicator.menus) == 1
+    assert tray._refresh_scheduled is False
+
+    # An unchanged menu is not rebuilt; a history change is.
+    tray.refresh_menu({}, {"tray_backend": "appindicator", "recording": True})
+    scheduled.pop()[0]()
+    assert len(built) == 1
+
+    (tmp_path / "history.jsonl").write_text('{"text": "hi"}\n', encoding="utf-8")
+    tray.refresh_menu({}, {"tray_backend": "appindicator", "recording": True})
+    scheduled.pop()[0]()
+    assert len(built) == 2
+
+
+@pytest.mark.unit
+def test_pystray_refresh_menu_skips_rebuild_when_inputs_unchanged(monkeypatch, tmp_path):
+    """PyStray keeps its menu until something the menu shows has changed."""
+
+    class MenuIcon:
+        def __init__(self):
+            self.menu = None
+            self.updates = 0
+
+        def update_menu(self):
+            self.updates += 1
+
+    icon = MenuIcon()
+    builds = []
+    config = {"language": "en", "use_vad": False}
+    callbacks = {"toggle_vad": lambda: None}
+
+    monkeypatch.setattr(tray, "_icon", icon)
+    monkeypatch.setattr(tray, "_icon_ready", True)
+    monkeypatch.setattr(tray, "_menu_signature", None)
+    monkeypatch.setattr(tray, "cfg", config)
+    monkeypatch.setattr(tray, "HIST_FILE", tmp_path / "history.jsonl")
+    monkeypatch.setattr(
+        tray,
+        "build_pystray_menu",
+        lambda _callbacks, _state: builds.append(True) or object(),
+    )
+
+    state = {"recording": False}
+    tray.refresh_menu(callbacks, state)
+    tray.refresh_menu(callbacks, state)
+    assert len(builds) == 1
+    assert icon.updates == 1
+
+    # Live-only changes repaint the existing menu
+    config["use_vad"] = True
+    tray.refresh_menu(callbacks, state)
+    state["recording"] = True
+    tray.refresh_menu(callbacks, state)
+    assert len(builds) == 1
+    assert icon.updates == 3
+
+    # Structural changes (history, state dict) rebuild it
+    (tmp_path / "history.jsonl").write_text('{"text": "hi"}\n', encoding="utf-8")
+    tray.refresh_menu(callbacks, state)
+    tray.refresh_menu(callbacks, {"recording": True})
+    assert len(builds) == 3
+    assert icon.updates == 5
+
+
+@pytest.mark.unit
+def test_pystray_title_is_built_once_per_language_and_hotkey(monkeypatch):
+    """Tray titles should be reused across state changes until inputs change."""
+    label_calls = []
+
+    def fake_key_to_label(key):
+        label_calls.append(key)
+        return key.upper()
+
+    monkeypatch.setattr(tray, "cfg", {"language": "en"})
+    monkeypatch.setattr(tray, "key_to_label", fake_key_to_label)
+    monkeypatch.setattr(tray, "_tray_titles", {})
+    monkeypatch.setattr(tray, "_tray_titles_key", None)
+    state = {"hotkey_key": "f9", "session_type": "x11"}
+
+    ready = tray._pystray_title("ready", state)
+    recording = tray._pystray_title("recording", state)
+
+    assert ready.startswith("WhisprBar - Ready [x11] (F9:")
+    assert recording.startswith("WhisprBar - Recording [x11] (F9:")
+    assert label_calls == ["f9"]
+
+    state["hotkey_key"] = "f10"
+    assert "(F10:" in tray._pystray_title("ready", state)
+    assert label_calls == ["f9", "f10"]
+
+
 @pytest.mark.unit
 def test_appindicator_menu_includes_status_toggle_and_diagnostics(monkeypatch):
     """AppIndicator menu should expose the same UX-critical rows as PyStray."""
@@ -263,6 +521,46 @@ def test_appindicator_menu_includes_status_toggle_and_diagnostics(monkeypatch):
     assert "Quit" in labels
 
 
+@pytest.mark.unit
+def test_appindicator_history_items_share_one_handler(monkeypatch):
+    """History rows connect a shared handler and pass their text as user data."""
+    gtk = SimpleNamespace(
+        Menu=DummyGtkMenu,
+        MenuItem=DummyGtkMenuItem,
+        CheckMenuItem=DummyGtkCheckMenuItem,
+        SeparatorMenuItem=lambda: "separator",
+    )
+    copied = []
+    callbacks = {
+        "copy_to_clipboard": copied.append,
+        "clear_history": lambda: None,
+        "toggle_vad": lambda: None,
+        "open_settings": lambda: None,
+        "quit": lambda: None,
+    }
+    entries = [{"text": "first transcript"}, {"text": "second transcript"}]
+
+    monkeypatch.setattr(tray, "APPINDICATOR_AVAILABLE", True)
+    monkeypatch.setattr(tray, "Gtk", gtk)
+    monkeypatch.setattr(tray, "cfg", {"language": "en"})
+    monkeypatch.setattr(tray, "read_history", lambda limit=10: entries)
+    monkeypatch.setattr(tray, "format_history_entry", lambda entry, max_length=50: entry["text"])
+
+    menu = tray.build_appindicator_menu(callbacks, {"recording": False, "transcribing": False})
+    recent = next(item for item in menu.items if getattr(item, "label", None) == "Recent")
+    history_items = [
+        item for item in recent.submenu.items
+        if getattr(item, "label", None) in {"first transcript", "second transcript"}
+    ]
+
+    assert len(history_items) == 2
+    assert history_items[0].handlers["activate"] is history_items[1].handlers["activate"]
+
+    history_items[1].activate()
+    history_items[0].activate()
+    assert copied == ["second transcript", "first transcript"]
+
+
 @pytest.mark.unit
 def test_shutdown_tray_hides_and_stops_pystray_icon(monkeypatch):
     """PyStray shutdown should hide the icon and clear module state."""
@@ -0,0 +1,74 @@
+"""Unit tests for shared UI helpers."""
+
+import pytest
+
+from whisprbar.ui.helpers import escape_markup
+
+
+@pytest.mark.unit
+def test_escape_markup_escapes_markup_characters():
+    """All five markup-significant characters are escaped in one pass."""
+    assert escape_markup("Tom & Jerry <b>\"hi\"</b> it's") == (
+        "Tom &amp; Jerry &lt;b&gt;&quot;hi&quot;&lt;/b&gt; it&apos;s"
+    )
+
+
+@pytest.mark.unit
+def test_escape_markup_leaves_plain_and_non_ascii_text_unchanged():
+    """Text without markup characters, including umlauts, passes through."""
+    assert escape_markup("Grüße aus Köln – 2.5s") == "Grüße aus Köln – 2.5s"
+    assert escape_markup("") == ""
+
+
+@pytest.mark.unit
+def test_escape_markup_escapes_control_characters():
+    """Control bytes become character references; tab, newline and CR are kept."""
+    assert escape_markup("a\x01b\x1bc\x7f\x9f") == "a&#x1;b&#x1b;c&#x7f;&#x9f;"
+    assert escape_markup("tab\tnew\nline\r") == "tab\tnew\nline\r"
+    assert escape_markup("\x85") == "\x85"
+
+
+@pytest.mark.unit
+def test_snap_scale_to_step_only_changes_value_on_new_step():
+    """Dragged values are rounded to the step and clamped to the range."""
+    from whisprbar.ui.helpers import snap_scale_to_step
+
+    class FakeAdjustment:
+        def __init__(self):
+            self.value = 180.0
+            self.set_calls = []
+
+        def get_lower(self):
+            return 0.0
+
+        def get_upper(self):
+            return 400.0
+
+        def get_value(self):
+            return self.value
+
+        def set_value(self, value):
+            self.set_calls.append(value)
+            self.value = value
+
+    class FakeScale:
+        def __init__(self):
+            self.adjustment = FakeAdjustment()
+            self.handlers = {}
+
+        def connect(self, signal, handler):
+            self.handlers[signal] = handler
+
+        def get_adjustment(self):
+            return self.adjustment
+
+    scale = FakeScale()
+    snap_scale_to_step(scale, 10.0)
+    change_value = scale.handlers["change-value"]
+
+    assert change_value(scale, None, 183.4) is True
+    assert change_value(scale, None, 186.0) is True
+    assert change_value(scale, None, 188.9) is True
+    assert change_value(scale, None, 999.0) is True
+
+    assert scale.adjustment.set_calls == [190.0, 400.0]
@@ -1,7 +1,9 @@
 """Unit tests for whisprbar.utils module."""
 
 import json
+import os
 import shutil
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -45,6 +47,33 @@ def test_command_exists_with_nonexistent_command():
     assert utils.command_exists("this_command_definitely_does_not_exist_12345") is False
 
 
+@pytest.mark.unit
+def test_command_exists_caches_lookups_per_path(monkeypatch):
+    """Repeated checks should scan PATH once until PATH or the cache changes."""
+    calls = []
+
+    def fake_which(name, path=None):
+        calls.append((name, path))
+        return "/usr/bin/xclip"
+
+    utils.clear_command_cache()
+    monkeypatch.setattr(utils.shutil, "which", fake_which)
+    monkeypatch.setenv("PATH", "/usr/bin")
+
+    assert utils.command_exists("xclip") is True
+    assert utils.command_exists("xclip") is True
+    assert utils.find_command("xclip") == "/usr/bin/xclip"
+    assert calls == [("xclip", "/usr/bin")]
+
+    monkeypatch.setenv("PATH", "/opt/bin")
+    utils.command_exists("xclip")
+    utils.clear_command_cache()
+    utils.command_exists("xclip")
+
+    assert calls == [("xclip", "/usr/bin"), ("xclip", "/opt/bin"), ("xclip", "/opt/bin")]
+    utils.clear_command_cache()
+
+
 @pytest.mark.unit
 def test_detect_session_type_x11(monkeypatch):
     """Test session type detection for X11."""
@@ -137,6 +166,84 @@ def test_build_icon_state_variants_are_nonblank_and_distinct(size):
     assert alpha_masks["ready"] != alpha_masks["transcribing"]
 
 
+@pytest.mark.unit
+def test_render_icon_png_is_cached_and_matches_build_icon():
+    """render_icon_png should encode each state once and match build_icon pixels."""
+    import io
+
+    utils.render_icon_png.cache_clear()
+    first = utils.render_icon_png("recording")
+    second = utils.render_icon_png("recording")
+
+    assert first is second
+    assert utils.render_icon_png.cache_info().hits == 1
+    decoded = Image.open(io.BytesIO(first))
+    assert decoded.tobytes() == utils.build_icon(state="recording").tobytes()
+
+
+@pytest.mark.unit
+def test_notify_creates_libnotify_notification_per_call(monkeypatch):
+    """Each toast gets its own libnotify notification, shown without a subprocess."""
+    notify_module = MagicMock()
+    first, second = MagicMock(), MagicMock()
+    notify_module.Notification.new.side_effect = [first, second]
+    popen = MagicMock()
+
+    monkeypatch.setattr(utils, "_libnotify_resolved", True)
+    monkeypatch.setattr(utils, "_libnotify", notify_module)
+    monkeypatch.setattr(utils.subprocess, "Popen", popen)
+    monkeypatch.setitem(utils.cfg, "notifications_enabled", True)
+
+    utils.notify("first", "Title")
+    utils.notify("second", "Title")
+
+    assert [c.args for c in notify_module.Notification.new.call_args_list] == [
+        ("Title", "first", None),
+        ("Title", "second", None),
+    ]
+    first.show.assert_called_once_with()
+    second.show.assert_called_once_with()
+    first.update.assert_not_called()
+    popen.assert_not_called()
+
+
+@pytest.mark.unit
+def test_notify_shows_libnotify_notification_outside_lock(monkeypatch):
+    """show() may block on D-Bus, so it must not run under the libnotify lock."""
+    notify_module = MagicMock()
+    held = []
+    notification = MagicMock()
+    notification.show.side_effect = lambda: held.append(utils._libnotify_lock.locked())
+    notify_module.Notification.new.return_value = notification
+
+    monkeypatch.setattr(utils, "_libnotify_resolved", True)
+    monkeypatch.setattr(utils, "_libnotify", notify_module)
+    monkeypatch.setitem(utils.cfg, "notifications_enabled", True)
+
+    utils.notify("hello", "Title")
+
+    assert held == [False]
+
+
+@pytest.mark.unit
+def test_notify_falls_back_to_command_when_libnotify_fails(monkeypatch):
+    """A libnotify error should fall back to the resolved notification command."""
+    notify_module = MagicMock()
+    notify_module.Notification.new.return_value.show.side_effect = RuntimeError("no dbus")
+    popen = MagicMock()
+
+    monkeypatch.setattr(utils, "_libnotify_resolved", True)
+    monkeypatch.setattr(utils, "_libnotify", notify_module)
+    monkeypatch.setattr(utils, "_notify_backend_resolved", True)
+    monkeypatch.setattr(utils, "_notify_backend_cache", "notify-send")
+    monkeypatch.setattr(utils.subprocess, "Popen", popen)
+    monkeypatch.setitem(utils.cfg, "notifications_enabled", True)
+
+    utils.notify("hello", "Title")
+
+    popen.assert_called_once_with(["notify-send", "Title", "hello"])
+
+
 @pytest.mark.unit
 def test_build_notification_icon():
     """Test build_notification_icon creates a valid 64x64 icon."""
@@ -213,6 +320,34 @@ def test_write_history_preserves_metadata(tmp_path, monkeypatch):
     assert hist_file.stat().st_mode & 0o777 == 0o600
 
 
+@pytest.mark.unit
+def test_write_history_appends_each_entry_in_one_write(tmp_path, monkeypatch):
+    """Each entry is a single O_APPEND write of the UTF-8 encoded line."""
+    from whisprbar import config
+
+    hist_file = tmp_path / "history.jsonl"
+    monkeypatch.setattr(utils, "HIST_FILE", hist_file)
+    monkeypatch.setattr(utils, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(config, "cfg", {"language": "de", "flow_history_storage": "normal"})
+
+    writes = []
+    real_write = utils.os.write
+
+    def recording_write(fd, data):
+        writes.append(bytes(data))
+        return real_write(fd, data)
+
+    monkeypatch.setattr(utils.os, "write", recording_write)
+
+    utils.write_history("Grüße aus Köln", 1.0, 3)
+    utils.write_history("zweiter Eintrag", 1.0, 2)
+
+    assert len(writes) == 2
+    assert all(chunk.endswith(b"\n") for chunk in writes)
+    entries = [json.loads(line) for line in hist_file.read_text(encoding="utf-8").splitlines()]
+    assert [entry["text"] for entry in entries] == ["Grüße aus Köln", "zweiter Eintrag"]
+
+
 @pytest.mark.unit
 def test_write_history_normal_mode_prunes_oversized_file_immediately(tmp_path, monkeypatch):
     """Normal history mode enforces the documented 30-entry cap on every write."""
@@ -328,6 +463,45 @@ def test_is_newer_version_invalid_inputs():
     assert utils.is_newer_version("", "") is False
 
 
+@pytest.mark.unit
+def test_parse_version_packs_components_into_one_int():
+    """Parsed versions compare numerically, not lexically."""
+    assert utils.parse_version("1.10.0") == (1 << 48) | (10 << 32)
+    assert utils.parse_version("1.10.0") > utils.parse_version("1.9.9")
+    assert utils.parse_version("1.2") == utils.parse_version("1.2.0.0")
+    for invalid in ("1.x", "1.70000", "1.2.3.4.5"):
+        with pytest.raises(ValueError):
+            utils.parse_version(invalid)
+
+
+@pytest.mark.unit
+def test_check_for_updates_async_skips_network_after_recent_check(monkeypatch, tmp_path):
+    """A stored check younger than the interval should avoid a second fetch."""
+    state_path = tmp_path / "update_check.json"
+    fetches = []
+
+    def fake_fetch():
+        fetches.append(True)
+        return "0.0.1"
+
+    monkeypatch.setattr(utils, "UPDATE_CHECK_STATE_PATH", state_path)
+    monkeypatch.setattr(utils, "fetch_latest_release_tag", fake_fetch)
+    monkeypatch.setattr(utils.threading, "Thread", _ImmediateThread)
+    monkeypatch.setitem(utils.cfg, "check_updates", True)
+
+    utils.check_for_updates_async()
+    utils.check_for_updates_async()
+
+    assert fetches == [True]
+    assert json.loads(state_path.read_text())["tag"] == "0.0.1"
+
+    stale = time.time() - utils.UPDATE_CHECK_INTERVAL - 1
+    os.utime(state_path, (stale, stale))
+    utils.check_for_updates_async()
+
+    assert fetches == [True, True]
+
+
 @pytest.mark.unit
 def test_collect_diagnostics_basic(monkeypatch):
     """Test basic diagnostic collection."""
@@ -366,6 +540,40 @@ def test_collect_diagnostics_basic(monkeypatch):
     assert api_diag.status == utils.STATUS_OK
 
 
+@pytest.mark.unit
+def test_cached_collect_diagnostics_reuses_fresh_results(monkeypatch):
+    """Cached diagnostics are reused until forced, expired or the environment changes."""
+    monkeypatch.setenv("XDG_SESSION_TYPE", "x11")
+    monkeypatch.setitem(utils.cfg, "language", "en")
+    utils.clear_diagnostics_cache()
+
+    runs = []
+
+    def fake_collect():
+        runs.append(True)
+        return [utils.DiagnosticResult("session", "Session", utils.STATUS_OK, str(len(runs)))]
+
+    monkeypatch.setattr(utils, "collect_diagnostics", fake_collect)
+
+    try:
+        first = utils.cached_collect_diagnostics()
+        assert utils.cached_collect_diagnostics() == first
+        assert len(runs) == 1
+
+        utils.cached_collect_diagnostics(force=True)
+        assert len(runs) == 2
+
+        monkeypatch.setenv("XDG_SESSION_TYPE", "wayland")
+        utils.cached_collect_diagnostics()
+        assert len(runs) == 3
+
+        monkeypatch.setattr(utils, "DIAGNOSTICS_CACHE_TTL", 0.0)
+        utils.cached_collect_diagnostics()
+        assert len(runs) == 4
+    finally:
+        utils.clear_diagnostics_cache()
+
+
 @pytest.mark.unit
 def test_collect_diagnostics_uses_german_labels(monkeypatch):
     monkeypatch.setenv("XDG_SESSION_TYPE", "x11")
@@ -558,6 +766,16 @@ def test_get_whisprbar_temp_dir_repairs_existing_permissions(monkeypatch):
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.mark.unit
+def test_icon_render_key_depends_on_state_and_size():
+    """The render key is stable per (state, size) and differs between them."""
+    utils.icon_render_key.cache_clear()
+
+    assert utils.icon_render_key("ready") == utils.icon_render_key("ready")
+    assert utils.icon_render_key("ready") != utils.icon_render_key("recording")
+    assert utils.icon_render_key("ready", 64) != utils.icon_render_key("ready", 32)
+
+
 @pytest.mark.unit
 def test_store_icon_creates_file(monkeypatch_home, tmp_path, monkeypatch):
     """Test that store_icon saves icon to disk."""
@@ -11,10 +11,16 @@ from .processing import (
     NOISEREDUCE_AVAILABLE,
     apply_noise_reduction,
     split_audio_into_chunks,
+    block_sum_squares,
+    build_wav_header,
+    pcm16_to_float32,
+    float_to_pcm16,
+    encode_wav_pcm16,
 )
 
 from .vad import (
     VAD_AVAILABLE,
+    VAD_MONITOR_MAX_CHUNKS,
     VAD_MONITOR_QUEUE,
     vad_monitor_lock,
     vad_auto_stop_monitor,
@@ -22,8 +28,10 @@ from .vad import (
 )
 
 from .recorder import (
-    AUDIO_QUEUE,
-    audio_queue_lock,
+    AudioCaptureBuffer,
+    PCM16_SCALE,
+    AUDIO_BUFFER,
+    audio_buffer_lock,
     recording_state,
     _recording_callbacks,
     recording_callback,
@@ -32,8 +40,10 @@ from .recorder import (
     set_recording_callbacks,
     get_recording_state,
     list_input_devices,
+    invalidate_device_cache,
     find_device_index_by_name,
     update_device_index,
+    device_index_is_stale,
 )
 
 __all__ = [
@@ -44,10 +54,14 @@ __all__ = [
     # Availability flags
     "VAD_AVAILABLE",
     "NOISEREDUCE_AVAILABLE",
-    # Queues and state
-    "AUDIO_QUEUE",
+    # Buffers, queues and state
+    "AudioCaptureBuffer",
+    "PCM16_SCALE",
+    "pcm16_to_float32",
+    "AUDIO_BUFFER",
+    "VAD_MONITOR_MAX_CHUNKS",
     "VAD_MONITOR_QUEUE",
-    "audio_queue_lock",
+    "audio_buffer_lock",
     "vad_monitor_lock",
     "recording_state",
     # Recording
@@ -57,12 +71,18 @@ __all__ = [
     "set_recording_callbacks",
     "get_recording_state",
     "list_input_devices",
+    "invalidate_device_cache",
     "find_device_index_by_name",
     "update_device_index",
+    "device_index_is_stale",
     # VAD
     "vad_auto_stop_monitor",
     "apply_vad",
     # Processing
     "apply_noise_reduction",
     "split_audio_into_chunks",
+    "block_sum_squares",
+    "build_wav_header",
+    "float_to_pcm16",
+    "encode_wav_pcm16",
 ]
@@ -3,6 +3,7 @@
 Contains audio constants, noise reduction, and chunking functions.
 """
 
+import struct
 from typing import List, Tuple
 
 import numpy as np
@@ -14,6 +15,8 @@ from whisprbar.utils import debug
 SAMPLE_RATE = 16000  # 16 kHz sampling rate for Whisper
 CHANNELS = 1  # Mono audio
 BLOCK_SIZE = 1024  # Audio buffer block size
+PCM16_SAMPLE_WIDTH = 2  # Bytes per 16-bit PCM sample
+PCM16_SCALE = 32768.0  # Full-scale value for 16-bit PCM <-> float32, both directions
 
 # Check for optional dependencies
 try:
@@ -24,6 +27,108 @@ except ImportError:
     NOISEREDUCE_AVAILABLE = False
 
 
+def block_sum_squares(block: np.ndarray) -> float:
+    """Return the sum of squared samples of an audio block in float units.
+
+    int16 PCM blocks are scaled to [-1.0, 1.0) units. The squares are
+    accumulated in float64 by einsum without building a float copy of the
+    block, so this is safe to call from the audio callback.
+
+    Args:
+        block: int16 PCM or float audio block
+
+    Returns:
+        Sum of squared samples
+    """
+    flat = block.reshape(-1)
+    total = float(np.einsum("i,i->", flat, flat, dtype=np.float64))
+    if block.dtype == np.int16:
+        total /= PCM16_SCALE * PCM16_SCALE
+    return total
+
+
+def build_wav_header(n_frames: int, sample_rate: int = SAMPLE_RATE, channels: int = CHANNELS) -> bytes:
+    """Build the 44-byte RIFF/WAVE header for 16-bit PCM audio.
+
+    Args:
+        n_frames: Number of sample frames that follow the header
+        sample_rate: Sample rate in Hz
+        channels: Number of interleaved channels
+
+    Returns:
+        Header bytes (RIFF, fmt and data chunk headers)
+    """
+    block_align = channels * PCM16_SAMPLE_WIDTH
+    data_size = n_frames * block_align
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        PCM16_SAMPLE_WIDTH * 8,
+        b"data",
+        data_size,
+    )
+
+
+def pcm16_to_float32(block: np.ndarray) -> np.ndarray:
+    """Return a new float32 copy of an audio block scaled to [-1.0, 1.0).
+
+    int16 blocks are converted in a single pass; float blocks are copied
+    unchanged so callers always get an array they own.
+    """
+    if block.dtype == np.int16:
+        return np.divide(block, PCM16_SCALE, dtype=np.float32)
+    return np.array(block, dtype=np.float32)
+
+
+def float_to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """Convert float audio in [-1, 1] to 16-bit PCM samples.
+
+    int16 input is already PCM and is returned as-is, so audio that stayed
+    int16 through VAD is not scaled a second time.
+
+    Args:
+        audio: Float audio or int16 PCM as numpy array
+
+    Returns:
+        Flat int16 numpy array
+    """
+    if audio.dtype == np.int16:
+        return audio.reshape(-1)
+    # One scaled float temporary, clipped in place to the int16 range and
+    # cast straight into the result. Uses the same PCM16_SCALE as
+    # pcm16_to_float32(), so int16 -> float -> int16 round-trips exactly.
+    scaled = np.multiply(audio.reshape(-1), PCM16_SCALE)
+    np.clip(scaled, -32768, 32767, out=scaled)
+    pcm16 = np.empty(scaled.shape, dtype=np.int16)
+    np.copyto(pcm16, scaled, casting="unsafe")
+    return pcm16
+
+
+def encode_wav_pcm16(audio: np.ndarray) -> bytes:
+    """Encode audio as an in-memory 16-bit PCM WAV file.
+
+    Writes the precomputed header followed by the raw sample bytes instead
+    of going through wave.Wave_write.
+
+    Args:
+        audio: Mono float audio in [-1, 1] or int16 PCM as numpy array
+
+    Returns:
+        Complete WAV file contents
+    """
+    pcm16 = float_to_pcm16(audio)
+    return build_wav_header(pcm16.size // CHANNELS) + pcm16.tobytes()
+
+
 def apply_noise_reduction(audio: np.ndarray) -> np.ndarray:
     """Apply noise reduction to audio.
 
@@ -31,10 +136,10 @@ def apply_noise_reduction(audio: np.ndarray) -> np.ndarray:
     (fan, hum, keyboard clicks, etc.).
 
     Args:
-        audio: Input audio as numpy array
+        audio: Input audio as float numpy array or int16 PCM
 
     Returns:
-        Noise-reduced audio, or original if reduction disabled/fails
+        Noise-reduced float32 audio, or original if reduction disabled/fails
     """
     if not cfg.get("noise_reduction_enabled") or not NOISEREDUCE_AVAILABLE:
         return audio
@@ -47,7 +152,7 @@ def apply_noise_reduction(audio: np.ndarray) -> np.ndarray:
         debug(f"Applying noise reduction (strength: {strength:.2f})")
 
         # noisereduce expects mono float32
-        mono = audio.reshape(-1).astype(np.float32)
+        mono = pcm16_to_float32(audio.reshape(-1))
 
         # Apply noise reduction
         reduced = nr.reduce_noise(
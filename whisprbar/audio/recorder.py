@@ -4,21 +4,91 @@ Handles audio stream management, recording start/stop, and device selection.
 """
 
 import contextlib
-import queue
 import sys
 import threading
 import time
+from collections import deque
 from typing import Callable, List, Optional
 
 import numpy as np
 
 from whisprbar.config import cfg
 from whisprbar.utils import debug
-from .processing import SAMPLE_RATE, CHANNELS, BLOCK_SIZE
+from .processing import (
+    SAMPLE_RATE,
+    CHANNELS,
+    BLOCK_SIZE,
+    PCM16_SCALE,
+    block_sum_squares,
+    pcm16_to_float32,
+)
+
+
+class AudioCaptureBuffer:
+    """Preallocated, growable int16 PCM buffer for captured audio frames.
+
+    The sounddevice callback is the only writer: each block is copied straight
+    into preallocated storage with slice assignment instead of allocating a new
+    array and pushing it through a locked queue. Capacity doubles when a
+    recording outgrows it, so long recordings cost O(log n) reallocations.
+    Written regions are never overwritten, so views returned by write() stay
+    valid after the buffer grows.
+
+    Samples are kept as 16-bit PCM (half the size of float32). to_pcm16()
+    hands the recording off without a copy; to_array() converts to float32
+    for callers that need samples in [-1.0, 1.0).
+    """
+
+    def __init__(self, initial_seconds: float = 30.0, channels: int = CHANNELS):
+        capacity = max(BLOCK_SIZE, int(SAMPLE_RATE * initial_seconds))
+        self._data = np.empty((capacity, channels), dtype=np.int16)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self, min_capacity: int) -> None:
+        capacity = max(min_capacity, self._data.shape[0] * 2)
+        grown = np.empty((capacity, self._data.shape[1]), dtype=self._data.dtype)
+        grown[: self._size] = self._data[: self._size]
+        self._data = grown
+
+    def write(self, block: np.ndarray) -> np.ndarray:
+        """Append a block of frames and return a view of the stored PCM16 copy.
+
+        int16 blocks are stored as-is; float blocks are scaled from [-1.0, 1.0].
+        """
+        end = self._size + block.shape[0]
+        if end > self._data.shape[0]:
+            self._grow(end)
+        target = self._data[self._size:end]
+        if block.dtype == np.int16:
+            target[...] = block
+        else:
+            np.clip(np.multiply(block, PCM16_SCALE), -32768, 32767, out=target, casting="unsafe")
+        self._size = end
+        return target
+
+    def to_array(self) -> Optional[np.ndarray]:
+        """Return the captured frames as float32 trimmed to size, or None if empty."""
+        if self._size == 0:
+            return None
+        return pcm16_to_float32(self._data[: self._size])
+
+    def to_pcm16(self) -> Optional[np.ndarray]:
+        """Return a view of the captured int16 frames trimmed to size, or None if empty.
+
+        The view shares storage with the buffer, so only call this once the
+        buffer has been detached from the audio callback.
+        """
+        if self._size == 0:
+            return None
+        return self._data[: self._size]
+
 
 # Global state for recording
-AUDIO_QUEUE: Optional[queue.Queue] = None
-audio_queue_lock = threading.Lock()
+AUDIO_BUFFER: Optional[AudioCaptureBuffer] = None
+audio_buffer_lock = threading.Lock()
 _recording_state_lock = threading.Lock()  # Protects recording_state from concurrent access
 recording_state = {
     "recording": False,
@@ -78,12 +148,36 @@ def _get_sounddevice():
     return _sd_module
 
 
-def list_input_devices() -> List[dict]:
+# PortAudio enumerates devices once at initialization, so re-querying only
+# repeats the same host API walk. Cache the scan until explicitly refreshed.
+_input_devices_cache: Optional[List[dict]] = None
+_input_devices_lock = threading.Lock()
+
+
+def invalidate_device_cache() -> None:
+    """Drop the cached input device list so the next lookup re-scans."""
+    global _input_devices_cache
+    with _input_devices_lock:
+        _input_devices_cache = None
+
+
+def list_input_devices(refresh: bool = False) -> List[dict]:
     """List all available audio input devices.
 
+    The device scan is cached after the first successful query; pass
+    refresh=True (or call invalidate_device_cache()) to re-scan.
+
+    Args:
+        refresh: Ignore the cached scan and query sounddevice again
+
     Returns:
         List of dicts with 'index' and 'name' keys for each input device
     """
+    global _input_devices_cache
+    with _input_devices_lock:
+        if _input_devices_cache is not None and not refresh:
+            return [dict(device) for device in _input_devices_cache]
+
     devices = []
     try:
         sd = _get_sounddevice()
@@ -100,16 +194,24 @@ def list_input_devices() -> List[dict]:
                     "name": info.get("name", f"Device {idx}"),
                 }
             )
+    with _input_devices_lock:
+        _input_devices_cache = [dict(device) for device in devices]
     return devices
 
 
-def find_device_index_by_name(name: Optional[str]) -> Optional[int]:
+def find_device_index_by_name(
+    name: Optional[str],
+    devices: Optional[List[dict]] = None,
+) -> Optional[int]:
     """Find audio device index by name.
 
-    First tries exact match (case-insensitive), then substring match.
+    Exact matches (case-insensitive) win over substring matches; both are
+    collected in a single pass over the device list.
 
     Args:
         name: Device name to search for, or None for system default
+        devices: Device list already fetched by the caller; defaults to
+            list_input_devices()
 
     Returns:
         Device index or None if not found
@@ -117,26 +219,45 @@ def find_device_index_by_name(name: Optional[str]) -> Optional[int]:
     if not name:
         return None
 
-    # Try exact match first
-    for device in list_input_devices():
-        if device["name"].lower() == name.lower():
+    if devices is None:
+        devices = list_input_devices()
+    target = name.lower()
+    substring_match: Optional[int] = None
+    for device in devices:
+        device_name = device["name"].lower()
+        if device_name == target:
             return device["index"]
+        if substring_match is None and target in device_name:
+            substring_match = device["index"]
 
-    # Try substring match
-    for device in list_input_devices():
-        if name.lower() in device["name"].lower():
-            return device["index"]
+    return substring_match
 
-    return None
 
+def update_device_index(devices: Optional[List[dict]] = None) -> None:
+    """Update device index from current config.
 
-def update_device_index() -> None:
-    """Update device index from current config."""
-    idx = find_device_index_by_name(cfg.get("device_name"))
+    Args:
+        devices: Device list already fetched by the caller, if any
+    """
+    idx = find_device_index_by_name(cfg.get("device_name"), devices)
     with _recording_state_lock:
         recording_state["device_idx"] = idx
 
 
+def device_index_is_stale(devices: Optional[List[dict]] = None) -> bool:
+    """Check whether the stored device index no longer matches the config.
+
+    True when the configured device name now resolves to a different index
+    (device re-enumerated, plugged in or removed since the last update).
+
+    Args:
+        devices: Device list already fetched by the caller, if any
+    """
+    expected = find_device_index_by_name(cfg.get("device_name"), devices)
+    with _recording_state_lock:
+        return recording_state.get("device_idx") != expected
+
+
 def _max_recording_monitor(generation: int, max_seconds: float) -> None:
     """Stop a Flow recording once its configured maximum duration is reached."""
     time.sleep(max_seconds)
@@ -190,11 +311,13 @@ def _audio_rms_to_indicator_level(rms: float) -> float:
 def recording_callback(indata, frames, time_info, status):
     """Sounddevice callback for audio recording.
 
-    Called by sounddevice in audio thread. Copies audio data to queue
-    for main thread processing.
+    Called by sounddevice in audio thread. Copies audio data into the
+    preallocated capture buffer for main thread processing. The level meter
+    and VAD monitor read the stored PCM16 block directly; only a live
+    transcription session gets its own float32 copy.
 
     Args:
-        indata: Audio data from sounddevice
+        indata: int16 audio data from sounddevice
         frames: Number of frames
         time_info: Timing information
         status: Stream status flags
@@ -202,63 +325,61 @@ def recording_callback(indata, frames, time_info, status):
     if status and status.input_overflow:
         print(f"[WARN] Audio overflow: {status}", file=sys.stderr)
 
-    # Copy data once to avoid multiple copies
-    data_copy = indata.copy()
-
-    # Use non-blocking put to prevent callback thread blocking (defensive programming)
-    # Queue is unbounded so this should never raise queue.Full, but we handle it anyway
-    queued = False
-    with audio_queue_lock:
-        queue_obj = AUDIO_QUEUE
-        if queue_obj is not None:
-            try:
-                queue_obj.put_nowait(data_copy)
-                queued = True
-            except queue.Full:
-                # Should never happen with unbounded queue, but handle defensively
-                print("[ERROR] Audio queue unexpectedly full, dropping frame", file=sys.stderr)
-
-    if queued:
+    # Write under the lock so stop_recording() never reads a half-written block
+    stored = None
+    with audio_buffer_lock:
+        buffer_obj = AUDIO_BUFFER
+        if buffer_obj is not None:
+            stored = buffer_obj.write(indata)
+
+    # Unlocked pre-check: after the first block this is a single dict read
+    # instead of a lock round-trip per block. The locked re-check keeps the
+    # first writer authoritative.
+    if stored is not None and recording_state.get("first_audio_at_monotonic") is None:
         with _recording_state_lock:
             if recording_state.get("first_audio_at_monotonic") is None:
                 recording_state["first_audio_at_monotonic"] = time.monotonic()
 
+    from .vad import VAD_MONITOR_QUEUE
+    on_audio_level = _recording_callbacks.get("on_audio_level")
+    on_audio_chunk = _recording_callbacks.get("on_audio_chunk")
+    if not (on_audio_level or on_audio_chunk or VAD_MONITOR_QUEUE is not None):
+        return
+
+    # Stored regions are never overwritten, so the buffer view can be shared
+    # without copying; indata itself is only valid during this callback.
+    block = stored if stored is not None else pcm16_to_float32(indata)
+
     # Feed audio level to recording indicator
-    if _recording_callbacks.get("on_audio_level"):
+    if on_audio_level:
         try:
-            import numpy as np
-            rms = float(np.sqrt(np.mean(data_copy.astype(np.float32) ** 2)))
+            rms = float(np.sqrt(block_sum_squares(block) / max(1, block.size)))
             level = _audio_rms_to_indicator_level(rms)
-            _recording_callbacks["on_audio_level"](level)
+            on_audio_level(level)
         except Exception:
             pass
 
     # Feed live transcription sessions without blocking local recording.
-    if _recording_callbacks.get("on_audio_chunk"):
+    if on_audio_chunk:
         try:
-            _recording_callbacks["on_audio_chunk"](data_copy)
+            on_audio_chunk(pcm16_to_float32(indata))
         except Exception as exc:
             debug(f"Audio chunk callback error: {exc}")
 
-    # Also feed to VAD monitor queue if it exists
-    from .vad import vad_monitor_lock, VAD_MONITOR_QUEUE
-    with vad_monitor_lock:
-        vad_queue_obj = VAD_MONITOR_QUEUE
-        if vad_queue_obj is not None:
-            try:
-                vad_queue_obj.put_nowait(data_copy)
-            except queue.Full:
-                # VAD queue full, skip this chunk (monitor is lagging)
-                pass
+    # Also feed to VAD monitor queue if it exists. deque.append is atomic and
+    # bounded by maxlen, so no lock is taken on the audio thread; a stale
+    # reference after the monitor is torn down only feeds a discarded deque.
+    if VAD_MONITOR_QUEUE is not None:
+        VAD_MONITOR_QUEUE.append(block)
 
 
 def start_recording() -> None:
     """Start audio recording.
 
-    Opens audio stream and begins capturing audio to queue.
+    Opens audio stream and begins capturing audio into the capture buffer.
     Optionally starts VAD auto-stop monitor if enabled.
     """
-    global AUDIO_QUEUE
+    global AUDIO_BUFFER
 
     with _recording_state_lock:
         if recording_state.get("recording") or recording_state.get("starting"):
@@ -270,21 +391,20 @@ def start_recording() -> None:
     try:
         sd = _get_sounddevice()
 
-        # Use unbounded queue to support recordings of any length
+        # Growable buffer supports recordings of any length
         # Memory usage is self-limiting: bounded by user behavior (hotkey release)
-        # Queue is drained immediately after recording stops and then destroyed
-        # Example: 5-minute recording = 5min x 60s x 16kHz x 4 bytes = 19.2 MB
+        # Example: 5-minute recording = 5min x 60s x 16kHz x 2 bytes = 9.6 MB
         # This is acceptable for modern systems and prevents truncation of long recordings
-        queue_obj: queue.Queue = queue.Queue()
-        with audio_queue_lock:
-            AUDIO_QUEUE = queue_obj
+        buffer_obj = AudioCaptureBuffer()
+        with audio_buffer_lock:
+            AUDIO_BUFFER = buffer_obj
 
         # Create separate queue for VAD monitoring if auto-stop is enabled
-        from .vad import VAD_AVAILABLE, VAD_MONITOR_QUEUE, vad_monitor_lock, vad_auto_stop_monitor
+        from .vad import VAD_AVAILABLE, VAD_MONITOR_MAX_CHUNKS, vad_monitor_lock, vad_auto_stop_monitor
         import whisprbar.audio.vad as _vad_module
 
         if cfg.get("vad_auto_stop_enabled") and VAD_AVAILABLE:
-            vad_queue_obj: queue.Queue = queue.Queue(maxsize=100)  # Limit size to prevent memory issues
+            vad_queue_obj: deque = deque(maxlen=VAD_MONITOR_MAX_CHUNKS)  # Limit size to prevent memory issues
             with vad_monitor_lock:
                 _vad_module.VAD_MONITOR_QUEUE = vad_queue_obj
 
@@ -296,7 +416,7 @@ def start_recording() -> None:
             channels=CHANNELS,
             blocksize=BLOCK_SIZE,
             callback=recording_callback,
-            dtype="float32",
+            dtype="int16",
             device=device_idx,
         )
 
@@ -340,8 +460,8 @@ def start_recording() -> None:
             recording_state["starting"] = False
             recording_state["recording"] = False
             recording_state["stream"] = None
-        with audio_queue_lock:
-            AUDIO_QUEUE = None
+        with audio_buffer_lock:
+            AUDIO_BUFFER = None
         import whisprbar.audio.vad as _vad_module
         from .vad import vad_monitor_lock
         with vad_monitor_lock:
@@ -353,13 +473,15 @@ def start_recording() -> None:
 def stop_recording() -> Optional[np.ndarray]:
     """Stop audio recording and return captured audio.
 
-    Stops the audio stream, collects all queued audio data, and
-    concatenates it into a single numpy array.
+    Stops the audio stream and returns the frames collected in the
+    capture buffer. The int16 PCM is handed off as-is, so stopping costs
+    no copy or float conversion of the recording; apply_vad() and the
+    transcription backends accept int16 input directly.
 
     Returns:
-        Audio data as float32 numpy array, or None if no audio captured
+        Audio data as int16 PCM numpy array, or None if no audio captured
     """
-    global AUDIO_QUEUE
+    global AUDIO_BUFFER
 
     with _recording_state_lock:
         if not recording_state.get("recording"):
@@ -368,13 +490,10 @@ def stop_recording() -> Optional[np.ndarray]:
         recording_state["stopped_at_monotonic"] = time.monotonic()
         stream = recording_state.get("stream")
 
-    with audio_queue_lock:
-        queue_obj = AUDIO_QUEUE
-
-    frames: List[np.ndarray] = []
+    with audio_buffer_lock:
+        buffer_obj = AUDIO_BUFFER
 
-    # Calculate single unified grace period for queue draining
-    # This is the time we wait after stopping the stream for buffered audio to arrive
+    # Single unified grace period bounding how long we wait for tail audio
     grace_ms = max(100, min(2000, int(cfg.get("stop_tail_grace_ms", 200))))
     grace_seconds = grace_ms / 1000.0
 
@@ -391,35 +510,25 @@ def stop_recording() -> Optional[np.ndarray]:
     with _recording_state_lock:
         recording_state["stream"] = None
 
-    # Drain all remaining frames from queue with early-exit optimization
-    # After the stream is stopped, buffered frames arrive briefly then stop.
-    # Break early after consecutive empty polls instead of waiting full timeout.
-    if queue_obj is not None:
+    audio_data = None
+    if buffer_obj is not None:
+        # stream.stop() waits for pending callbacks, so the buffer is normally
+        # complete already. Poll once more in case a backend delivers a late
+        # block, and exit as soon as the write position stops moving.
         drain_deadline = time.monotonic() + drain_timeout_seconds
-        consecutive_empty = 0
-        # 3 consecutive empty polls (150ms) = no more data coming
-        max_consecutive_empty = 3
+        with audio_buffer_lock:
+            captured = len(buffer_obj)
         while time.monotonic() < drain_deadline:
-            try:
-                frame = queue_obj.get(timeout=0.05)
-                frames.append(frame)
-                consecutive_empty = 0  # Reset on successful read
-            except queue.Empty:
-                consecutive_empty += 1
-                if consecutive_empty >= max_consecutive_empty:
-                    debug(f"Queue drain: early exit after {consecutive_empty} empty polls")
-                    break
-
-        # Final non-blocking drain to catch any stragglers
-        while True:
-            try:
-                frame = queue_obj.get_nowait()
-                frames.append(frame)
-            except queue.Empty:
+            time.sleep(0.05)
+            with audio_buffer_lock:
+                latest = len(buffer_obj)
+            if latest == captured:
                 break
+            captured = latest
 
-        with audio_queue_lock:
-            AUDIO_QUEUE = None
+        with audio_buffer_lock:
+            AUDIO_BUFFER = None
+            audio_data = buffer_obj.to_pcm16()
 
         # Clean up VAD monitor queue
         import whisprbar.audio.vad as _vad_module
@@ -427,11 +536,9 @@ def stop_recording() -> Optional[np.ndarray]:
         with vad_monitor_lock:
             _vad_module.VAD_MONITOR_QUEUE = None
 
-    if not frames:
+    if audio_data is None:
         debug("No audio captured")
-        audio_data = None
     else:
-        audio_data = np.concatenate(frames, axis=0)
         duration = audio_data.shape[0] / SAMPLE_RATE
         debug(f"Captured audio duration: {duration:.2f}s, samples: {audio_data.shape[0]}")
 
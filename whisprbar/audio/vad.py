@@ -3,17 +3,23 @@
 Handles VAD processing and auto-stop monitoring during recording.
 """
 
-import queue
 import threading
 import time
 from collections import deque
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 
 from whisprbar.config import cfg
 from whisprbar.utils import debug
-from .processing import SAMPLE_RATE, BLOCK_SIZE
+from .processing import (
+    SAMPLE_RATE,
+    BLOCK_SIZE,
+    PCM16_SCALE,
+    block_sum_squares,
+    float_to_pcm16,
+    pcm16_to_float32,
+)
 
 # Check for optional dependencies
 try:
@@ -23,8 +29,11 @@ except ImportError:
     webrtcvad = None
     VAD_AVAILABLE = False
 
-# VAD monitor queue for auto-stop functionality
-VAD_MONITOR_QUEUE: Optional[queue.Queue] = None
+# VAD monitor queue for auto-stop functionality. A bounded deque: the audio
+# callback appends without a condition variable and, when the monitor lags,
+# the oldest chunks fall off instead of the newest being dropped.
+VAD_MONITOR_MAX_CHUNKS = 100
+VAD_MONITOR_QUEUE: Optional[deque] = None
 vad_monitor_lock = threading.Lock()
 
 
@@ -44,30 +53,62 @@ def _drop_short_runs(mask: np.ndarray, min_len: int) -> np.ndarray:
     if min_len <= 1:
         return mask
 
+    # Run boundaries from an int8 diff of the zero-padded mask:
+    # +1 marks a run start, -1 the index just past its end.
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+
+    short_runs = (run_ends - run_starts) < min_len
+    if not short_runs.any():
+        return mask.copy()
+
+    # Mark short runs with +1/-1 at their bounds; the running sum is
+    # positive exactly inside them, so all are cleared in one assignment.
+    marks = np.zeros(mask.size + 1, dtype=np.int8)
+    marks[run_starts[short_runs]] = 1
+    marks[run_ends[short_runs]] = -1
     cleaned = mask.copy()
+    cleaned[np.cumsum(marks[:-1]) > 0] = False
+    return cleaned
 
-    # Find boundaries of True runs using vectorized diff
-    # Pad with False to handle runs at start/end
-    padded = np.pad(cleaned, (1, 1), mode='constant', constant_values=False)
-    diff = np.diff(padded.astype(int))
 
-    # Run starts where diff == 1, ends where diff == -1
-    # The indices from diff correspond directly to the original array
-    # (padding offset is automatically handled by np.diff behavior)
-    run_starts = np.where(diff == 1)[0]
-    run_ends = np.where(diff == -1)[0]
+def _dilate_mask(mask: np.ndarray, radius: int) -> np.ndarray:
+    """Grow every True region of a boolean mask by ``radius`` on each side.
 
-    # Calculate run lengths
-    run_lengths = run_ends - run_starts
+    Equivalent to convolving with a ``2 * radius + 1`` box kernel and
+    testing for > 0, but runs in O(N) using a prefix sum of the mask.
 
-    # Find runs that are too short
-    short_runs = run_lengths < min_len
+    Args:
+        mask: Boolean numpy array
+        radius: Number of elements to extend each True value by
 
-    # Zero out short runs (indices work directly on original array)
-    for start, end in zip(run_starts[short_runs], run_ends[short_runs]):
-        cleaned[start:end] = False
+    Returns:
+        Dilated boolean mask
+    """
+    if radius <= 0 or not mask.size:
+        return mask.copy()
 
-    return cleaned
+    counts = np.concatenate(([0], np.cumsum(mask, dtype=np.int32)))
+    idx = np.arange(mask.size)
+    hi = np.minimum(idx + radius + 1, mask.size)
+    lo = np.maximum(idx - radius, 0)
+    return counts[hi] > counts[lo]
+
+
+def _chunk_energy(chunk: np.ndarray) -> Tuple[float, int]:
+    """Return the sum of squares and sample count of an audio chunk.
+
+    Squares are accumulated in a single pass without allocating a squared
+    temporary, so each chunk is reduced once when it arrives.
+
+    Args:
+        chunk: int16 PCM or float audio chunk
+
+    Returns:
+        Tuple of (sum of squared samples in float units, number of samples)
+    """
+    return block_sum_squares(chunk), int(chunk.size)
 
 
 def vad_auto_stop_monitor() -> None:
@@ -89,8 +130,10 @@ def vad_auto_stop_monitor() -> None:
 
     # Use deque with maxlen for O(1) operations instead of list with O(n) pop(0)
     # BUG-008 fix: deque auto-discards oldest items when maxlen is exceeded
+    # Chunks are reduced to (sum of squares, samples) on arrival, so the
+    # window RMS needs no concatenation or float copy of the audio.
     max_chunks = (buffer_samples // BLOCK_SIZE) + 2  # +2 for safety margin
-    audio_buffer = deque(maxlen=max_chunks)
+    audio_buffer: deque = deque(maxlen=max_chunks)
     silence_start = None
 
     debug(f"VAD auto-stop monitor started (threshold: {silence_threshold}s, max_chunks: {max_chunks})")
@@ -112,10 +155,10 @@ def vad_auto_stop_monitor() -> None:
             try:
                 while True:
                     try:
-                        chunk = monitor_queue.get_nowait()
-                        audio_buffer.append(chunk)  # O(1) with deque, auto-bounded
-                    except queue.Empty:
+                        chunk = monitor_queue.popleft()
+                    except IndexError:
                         break
+                    audio_buffer.append(_chunk_energy(chunk))  # O(1) with deque, auto-bounded
             except Exception:
                 continue
 
@@ -125,14 +168,14 @@ def vad_auto_stop_monitor() -> None:
             if not audio_buffer:
                 continue
 
-            # Concatenate buffer and check for speech
-            buffer_audio = np.concatenate(audio_buffer, axis=0)
-            if buffer_audio.shape[0] < int(SAMPLE_RATE * 0.5):  # At least 500ms
+            # Sum per-chunk energies over the window and check for speech
+            total_samples = sum(samples for _, samples in audio_buffer)
+            if total_samples < int(SAMPLE_RATE * 0.5):  # At least 500ms
                 continue
 
             # Simple energy-based VAD check (lightweight)
-            mono = buffer_audio.reshape(-1).astype(np.float32)
-            rms = float(np.sqrt(np.mean(np.square(mono))))
+            sum_squares = sum(energy for energy, _ in audio_buffer)
+            rms = float(np.sqrt(sum_squares / total_samples))
             energy_floor = float(cfg.get("vad_energy_floor", 0.0005))
             energy_ratio = float(cfg.get("vad_energy_ratio", 0.05))
 
@@ -163,7 +206,7 @@ def vad_auto_stop_monitor() -> None:
         debug("VAD auto-stop monitor stopped and buffer cleared")
 
 
-def apply_vad(audio: np.ndarray) -> np.ndarray:
+def apply_vad(audio: np.ndarray, as_pcm16: bool = False) -> np.ndarray:
     """Apply Voice Activity Detection to remove silence.
 
     Uses webrtcvad with energy-based fallback to detect and keep only
@@ -171,33 +214,46 @@ def apply_vad(audio: np.ndarray) -> np.ndarray:
     short pauses.
 
     Args:
-        audio: Input audio as numpy array
+        audio: Input audio as float numpy array or int16 PCM
+        as_pcm16: Return int16 PCM instead of float32 samples in [-1, 1].
+            VAD already works on int16 internally, so callers that only
+            encode PCM skip the float round trip.
 
     Returns:
         Filtered audio with silence removed, or original if VAD disabled/unavailable
     """
-    # Optimize: Use view instead of copy where possible
-    if audio.dtype == np.float32:
-        mono = audio.reshape(-1)
+    vad_enabled = bool(cfg.get("use_vad")) and VAD_AVAILABLE
+
+    if audio.dtype == np.int16:
+        # Captured PCM goes to webrtcvad as-is; float is only built if the
+        # caller wants float output
+        pcm16 = audio.reshape(-1)
+        original = pcm16 if as_pcm16 else pcm16_to_float32(pcm16)
+        if not vad_enabled:
+            return original
     else:
-        mono = np.asarray(audio, dtype=np.float32).reshape(-1)
+        # Optimize: Use view instead of copy where possible
+        if audio.dtype == np.float32:
+            mono = audio.reshape(-1)
+        else:
+            mono = np.asarray(audio, dtype=np.float32).reshape(-1)
 
-    if not cfg.get("use_vad") or not VAD_AVAILABLE:
-        return mono
+        if not vad_enabled:
+            return float_to_pcm16(mono) if as_pcm16 else mono
 
-    # Convert to 16-bit PCM for webrtcvad
-    # Optimize: Combine clip and multiply in one operation to save memory
-    pcm16 = np.clip(mono * 32767, -32768, 32767).astype(np.int16)
+        # Convert to 16-bit PCM for webrtcvad. Everything below works on int16.
+        pcm16 = float_to_pcm16(mono)
+        original = pcm16 if as_pcm16 else mono
 
     # Frame setup (webrtcvad requires 10/20/30ms frames)
     frame_ms = 30
     frame_length = int(SAMPLE_RATE * frame_ms / 1000)
     if frame_length <= 0:
-        return mono
+        return original
 
     total_frames = len(pcm16) // frame_length
     if total_frames == 0:
-        return mono
+        return original
 
     # Split into frames (drop remainder for now)
     usable_samples = total_frames * frame_length
@@ -207,6 +263,21 @@ def apply_vad(audio: np.ndarray) -> np.ndarray:
         remainder = remainder.reshape(-1)
     frames = trimmed_pcm.reshape(total_frames, frame_length)
 
+    # Per-frame RMS feeds both the silence early-exit and the energy masks.
+    # einsum squares and sums the int16 frames in one pass, accumulating in
+    # int64 so no float copy of the frames is materialized
+    sq_sum = np.einsum("ij,ij->i", frames, frames, dtype=np.int64)
+    rms = np.sqrt(sq_sum / frame_length) * (1.0 / PCM16_SCALE)
+    max_rms = float(rms.max()) if rms.size else 0.0
+
+    energy_floor = float(cfg.get("vad_energy_floor", 0.0005))
+
+    # Near-silent input: no frame reaches even the soft threshold, so skip
+    # the per-frame webrtcvad pass entirely
+    if max_rms < energy_floor * 1.5:
+        debug(f"VAD skipped: peak frame RMS {max_rms:.5f} below silence threshold")
+        return original
+
     # Initialize VAD
     vad_mode = int(cfg.get("vad_mode", 1))
     vad_mode = max(0, min(3, vad_mode))
@@ -216,21 +287,25 @@ def apply_vad(audio: np.ndarray) -> np.ndarray:
         debug(f"Invalid VAD mode {vad_mode} ({exc}); falling back to default")
         vad = webrtcvad.Vad(1)
 
-    # Run VAD on each frame
-    speech_mask = np.zeros(total_frames, dtype=bool)
-    for idx, frame in enumerate(frames):
-        try:
-            speech_mask[idx] = vad.is_speech(frame.tobytes(), SAMPLE_RATE)
-        except (ValueError, TypeError) as exc:
-            debug(f"VAD frame failed ({exc}); disabling")
-            return mono
+    # Run VAD on each frame. Frames are zero-copy slices of one shared
+    # buffer instead of a fresh tobytes() allocation per 30 ms frame.
+    # Method and sample rate are bound to locals so the per-frame generator
+    # does no attribute or global lookups.
+    raw = memoryview(trimmed_pcm.tobytes())
+    stride = frame_length * trimmed_pcm.itemsize
+    is_speech = vad.is_speech
+    sample_rate = SAMPLE_RATE
+    try:
+        speech_mask = np.fromiter(
+            (is_speech(raw[offset:offset + stride], sample_rate) for offset in range(0, len(raw), stride)),
+            dtype=bool,
+            count=total_frames,
+        )
+    except (ValueError, TypeError) as exc:
+        debug(f"VAD frame failed ({exc}); disabling")
+        return original
 
     # Energy-based safety net for quiet speech
-    # Optimize: Compute RMS directly from int16 to avoid float conversion
-    rms = np.sqrt(np.mean(np.square(frames.astype(np.float32)), axis=1)) / 32767.0
-    max_rms = float(rms.max()) if rms.size else 0.0
-
-    energy_floor = float(cfg.get("vad_energy_floor", 0.0005))
     energy_ratio_cfg = float(cfg.get("vad_energy_ratio", 0.05))
     energy_ratio = max(0.005, min(energy_ratio_cfg, 0.3))
     energy_threshold = max(energy_floor, max_rms * energy_ratio)
@@ -238,7 +313,9 @@ def apply_vad(audio: np.ndarray) -> np.ndarray:
     # Adaptive threshold based on percentile
     nonzero_rms = rms[rms > energy_floor]
     if nonzero_rms.size:
-        percentile = float(np.percentile(nonzero_rms, 75))
+        # 75th percentile (method="lower") via O(N) quickselect instead of a sort
+        k = int(0.75 * (nonzero_rms.size - 1))
+        percentile = float(np.partition(nonzero_rms, k)[k])
         energy_threshold = min(energy_threshold, max(energy_floor, percentile))
 
     energy_mask = rms >= energy_threshold if rms.size else np.zeros_like(speech_mask)
@@ -257,7 +334,7 @@ def apply_vad(audio: np.ndarray) -> np.ndarray:
 
     if not combined_mask.any():
         debug("VAD+energy found no speech; returning original audio")
-        return mono
+        return original
 
     extra_frames = int(np.count_nonzero(energy_mask & ~speech_mask))
     if extra_frames:
@@ -273,15 +350,14 @@ def apply_vad(audio: np.ndarray) -> np.ndarray:
     bridge_frames = int(round(bridge_ms / frame_ms)) if bridge_ms else 0
 
     if bridge_frames > 0:
-        kernel = np.ones(bridge_frames * 2 + 1, dtype=int)
-        combined_mask = np.convolve(combined_mask.astype(int), kernel, mode="same") > 0
+        combined_mask = _dilate_mask(combined_mask, bridge_frames)
 
     if min_energy_frames > 1:
         combined_mask = _drop_short_runs(combined_mask, min_energy_frames)
 
     voiced_indices = np.flatnonzero(combined_mask)
     if voiced_indices.size == 0:
-        return mono
+        return original
 
     # Padding around speech segments
     padding_ms = int(cfg.get("vad_padding_ms", 200))
@@ -290,66 +366,53 @@ def apply_vad(audio: np.ndarray) -> np.ndarray:
 
     # Check if remainder has energy
     remainder_flat = remainder.reshape(-1)
-    remainder_rms = (
-        float(np.sqrt(np.mean(np.square(remainder_flat.astype(np.float32) / 32767.0))))
-        if remainder_flat.size
-        else 0.0
-    )
-
-    # Group consecutive voiced frames into segments
-    segments: List[Tuple[int, int]] = []
-    segment_start = int(voiced_indices[0])
-    prev_idx = int(voiced_indices[0])
-
-    for raw_idx in voiced_indices[1:]:
-        idx = int(raw_idx)
-        if idx - prev_idx > 1:
-            segments.append((segment_start, prev_idx))
-            segment_start = idx
-        prev_idx = idx
-    segments.append((segment_start, prev_idx))
-
-    # Extract segments with padding
-    segment_buffers: List[np.ndarray] = []
-    tail_appended = False
-
-    for seg_start, seg_end in segments:
-        start_idx = max(0, seg_start - padding_frames)
-        end_idx = min(total_frames, seg_end + padding_frames + 1)
-
-        segment_frames = frames[start_idx:end_idx]
-        if segment_frames.size == 0:
-            continue
-
-        segment_int = segment_frames.reshape(-1)
-
-        # Append remainder to last segment if it has energy
-        if (
-            not tail_appended
-            and remainder_flat.size
-            and end_idx >= total_frames
-            and remainder_rms >= energy_floor
-        ):
-            segment_int = np.concatenate((segment_int, remainder_flat))
-            tail_appended = True
-
-        segment_buffers.append(segment_int)
-
-    if not segment_buffers:
-        return mono
-
-    # Optimize: Concatenate and convert in one step to save memory
-    processed_int = np.concatenate(segment_buffers)
-    # Use *= for in-place operation to reduce memory allocation
-    processed_pcm = processed_int.astype(np.float32)
-    processed_pcm /= 32767.0  # In-place division
+    remainder_rms = 0.0
+    if remainder_flat.size:
+        remainder_sq = np.einsum("i,i->", remainder_flat, remainder_flat, dtype=np.int64)
+        remainder_rms = float(np.sqrt(remainder_sq / remainder_flat.size)) / PCM16_SCALE
+
+    # Group consecutive voiced frames into segments: a gap > 1 between
+    # neighbouring indices closes one segment and opens the next
+    gaps = np.flatnonzero(np.diff(voiced_indices) > 1)
+    seg_starts = voiced_indices[np.r_[0, gaps + 1]]
+    seg_ends = voiced_indices[np.r_[gaps, -1]]
+
+    # Padded frame ranges are known up front, so the output is allocated
+    # once and each segment copied into place (no list + concatenate)
+    start_idx = np.maximum(seg_starts - padding_frames, 0)
+    end_idx = np.minimum(seg_ends + padding_frames + 1, total_frames)
+    seg_lens = (end_idx - start_idx) * frame_length
+
+    # Append remainder to the first segment reaching the end if it has energy
+    tail_segment = -1
+    if remainder_flat.size and remainder_rms >= energy_floor:
+        reaching_end = np.flatnonzero(end_idx >= total_frames)
+        if reaching_end.size:
+            tail_segment = int(reaching_end[0])
+            seg_lens[tail_segment] += remainder_flat.size
+
+    offsets = np.concatenate(([0], np.cumsum(seg_lens))).tolist()
+    processed_int = np.empty(offsets[-1], dtype=np.int16)
+
+    for i, (seg_start, seg_end) in enumerate(zip(start_idx.tolist(), end_idx.tolist())):
+        offset = offsets[i]
+        n = (seg_end - seg_start) * frame_length
+        processed_int[offset:offset + n] = frames[seg_start:seg_end].reshape(-1)
+        if i == tail_segment:
+            processed_int[offset + n:offsets[i + 1]] = remainder_flat
 
     # Safety check: don't remove too much audio
-    retained_ratio = processed_pcm.size / mono.size if mono.size else 1.0
+    retained_ratio = processed_int.size / pcm16.size if pcm16.size else 1.0
     min_ratio = float(cfg.get("vad_min_output_ratio", 0.4))
     if retained_ratio < min_ratio:
         debug(f"VAD output ratio {retained_ratio:.2f} below {min_ratio:.2f}; using original audio")
-        return mono
+        return original
+
+    debug(f"VAD retained {retained_ratio:.2%} of audio ({len(seg_lens)} segments)")
+    if as_pcm16:
+        return processed_int
 
-    debug(f"VAD retained {retained_ratio:.2%} of audio ({len(segment_buffers)} segments)")
+    # Use /= for in-place operation to reduce memory allocation
+    processed_pcm = processed_int.astype(np.float32)
+    processed_pcm /= PCM16_SCALE
     return processed_pcm
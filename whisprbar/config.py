@@ -4,13 +4,23 @@ Handles loading, saving, and validating configuration from ~/.config/whisprbar.j
 and environment variables from ~/.config/whisprbar.env.
 """
 
+import functools
 import json
 import os
 import re
 import sys
+import threading
 from copy import deepcopy
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
+
+# Optional fast JSON codec; stdlib json is used when orjson is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 # Configuration paths
 CONFIG_PATH = Path.home() / ".config" / "whisprbar.json"
@@ -137,6 +147,24 @@ def get_env_file_path() -> Path:
     return Path.home() / ".config" / "whisprbar.env"
 
 
+# KEY=value assignments; comment lines and lines without "=" never match.
+_ENV_LINE_RE = re.compile(r"^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(.*?)\s*$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_env_file(path: str, mtime_ns: int, size: int, inode: int) -> Tuple[Tuple[str, str], ...]:
+    """Parse an env file once per on-disk version.
+
+    The stat fields are only part of the cache key so that edits (including
+    atomic replaces from save_env_file_value) trigger a fresh parse.
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    return tuple(
+        (key, value.strip('"').strip("'"))
+        for key, value in _ENV_LINE_RE.findall(text)
+    )
+
+
 def load_env_file_values() -> Dict[str, str]:
     """Load environment variables from .env file.
 
@@ -146,25 +174,15 @@ def load_env_file_values() -> Dict[str, str]:
         Format: KEY=value or KEY="value" or KEY='value'
     """
     env_path = get_env_file_path()
-    values: Dict[str, str] = {}
-    if not env_path.exists():
-        return values
     try:
-        with env_path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                stripped = line.strip()
-                if not stripped or stripped.startswith("#"):
-                    continue
-                if "=" not in stripped:
-                    continue
-                key, value = stripped.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                if key:
-                    values[key] = value
+        stat = env_path.stat()
+    except OSError:
+        return {}
+    try:
+        return dict(_parse_env_file(str(env_path), stat.st_mtime_ns, stat.st_size, stat.st_ino))
     except Exception as exc:
         print(f"[WARN] Failed to read env file {env_path}: {exc}", file=sys.stderr)
-    return values
+        return {}
 
 
 def ensure_directories() -> None:
@@ -423,6 +441,37 @@ def validate_config() -> None:
         cfg["flow_preferred_languages"] = DEFAULT_CFG["flow_preferred_languages"].copy()
 
 
+def json_loads(data):
+    """Decode a JSON document from str or bytes, using orjson when available.
+
+    Decode errors are raised as json.JSONDecodeError (orjson's error type
+    subclasses it), so callers can keep a single except clause.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> str:
+    """Encode ``obj`` as JSON text, using orjson when available.
+
+    Non-ASCII characters are written as-is, matching ``ensure_ascii=False``.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
 def load_config() -> dict:
     """Load configuration from disk.
 
@@ -442,7 +491,7 @@ def load_config() -> dict:
     try:
         if CONFIG_PATH.exists():
             with CONFIG_PATH.open("r", encoding="utf-8") as handle:
-                file_cfg = json.load(handle)
+                file_cfg = json_loads(handle.read())
             cfg.update(file_cfg)
             migrate_legacy_hotkey()  # Migrate old hotkey format
             validate_config()
@@ -454,18 +503,27 @@ def load_config() -> dict:
     return cfg
 
 
+# Serializes save_config() writers that share the same tmp file
+_save_config_lock = threading.Lock()
+
+
 def save_config() -> None:
     """Save current configuration to disk.
 
-    Writes the global `cfg` dict to ~/.config/whisprbar.json as JSON.
+    Writes the global `cfg` dict to ~/.config/whisprbar.json as JSON. The
+    dict is snapshotted on the calling thread and writers are serialized,
+    so concurrent saves (UI, tray toggles, hotkey threads) cannot interleave
+    in the shared tmp file or see `cfg` change size mid-dump.
     """
+    snapshot = deepcopy(dict(cfg))
     tmp_path = CONFIG_PATH.with_name(f"{CONFIG_PATH.name}.tmp")
     try:
-        CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with tmp_path.open("w", encoding="utf-8") as handle:
-            json.dump(cfg, handle, ensure_ascii=False, indent=2)
-            handle.write("\n")
-        os.replace(tmp_path, CONFIG_PATH)
+        with _save_config_lock:
+            CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                handle.write(json_dumps(snapshot, indent=True))
+                handle.write("\n")
+            os.replace(tmp_path, CONFIG_PATH)
     except (IOError, TypeError) as exc:
         if tmp_path.exists():
             try:
@@ -7,6 +7,7 @@ hotkey configuration management.
 """
 
 import contextlib
+import functools
 import threading
 from typing import Callable, Dict, List, Optional, Set, Tuple
 
@@ -32,6 +33,9 @@ if PYNPUT_AVAILABLE:
         if key_obj is not None:
             FKEYS[f"F{idx}"] = key_obj
 
+# Reverse lookup: keyboard.Key -> F-key token (O(1) per key event)
+FKEY_LOOKUP: Dict[keyboard.Key, str] = {key: name for name, key in FKEYS.items()}
+
 
 SPECIAL_KEY_DEFINITIONS = [
     ("CTRL_R", ("ctrl_r",)),
@@ -143,7 +147,28 @@ MODIFIER_ORDER: Dict[str, int] = {
     "SUPER": 3,
 }
 
+# Bit assigned to each modifier so listener state is a plain int mask
+MODIFIER_BITS: Dict[str, int] = {
+    "CTRL": 1,
+    "SHIFT": 2,
+    "ALT": 4,
+    "SUPER": 8,
+}
+
+# keyboard.Key -> modifier bit, resolved once instead of per key event
+MODIFIER_BIT_LOOKUP: Dict[keyboard.Key, int] = {
+    key: MODIFIER_BITS[name] for key, name in MODIFIER_LOOKUP.items()
+}
+
+# Side-specific and generic modifier tokens -> the modifier bit they set
+TOKEN_MODIFIER_BITS: Dict[str, int] = {
+    token: MODIFIER_BITS[base]
+    for base in MODIFIER_BITS
+    for token in (base, f"{base}_L", f"{base}_R")
+}
 
+
+@functools.lru_cache(maxsize=128)
 def normalize_key_token(token: str) -> Optional[str]:
     """Normalize a key token string.
 
@@ -166,6 +191,7 @@ def normalize_key_token(token: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=128)
 def parse_hotkey(binding: str) -> HotkeyBinding:
     """Parse hotkey binding string into structured format.
 
@@ -200,6 +226,35 @@ def parse_hotkey(binding: str) -> HotkeyBinding:
     return (frozenset(modifiers), key_token)
 
 
+@functools.lru_cache(maxsize=128)
+def _binding_label(modifiers: frozenset[str], token: str) -> str:
+    """Cached label for a (modifiers, token) binding."""
+    parts = [
+        MODIFIER_LABELS[m]
+        for m in sorted(modifiers, key=lambda x: MODIFIER_ORDER.get(x, 99))
+    ]
+    if token in FKEY_TOKENS:
+        parts.append(token)
+    elif token in SPECIAL_KEY_LABELS:
+        parts.append(SPECIAL_KEY_LABELS[token])
+    else:
+        parts.append(token.upper())
+    return "+".join(parts) if parts else token.upper()
+
+
+@functools.lru_cache(maxsize=128)
+def _token_label(raw: str) -> str:
+    """Cached label for a bare key token string."""
+    raw_token = raw.strip().upper().replace("-", "_").replace(" ", "_")
+    raw_token = SPECIAL_KEY_ALIASES.get(raw_token, raw_token)
+    if raw_token in SPECIAL_KEY_LABELS:
+        return SPECIAL_KEY_LABELS[raw_token]
+    token = normalize_key_token(raw)
+    if token in SPECIAL_KEY_LABELS:
+        return SPECIAL_KEY_LABELS[token]
+    return token or raw.strip().upper() or "F9"
+
+
 def key_to_label(key_obj) -> str:
     """Convert key object to human-readable label.
 
@@ -211,28 +266,11 @@ def key_to_label(key_obj) -> str:
     """
     if isinstance(key_obj, tuple) and len(key_obj) == 2:
         modifiers, token = key_obj
-        parts = [
-            MODIFIER_LABELS[m]
-            for m in sorted(modifiers, key=lambda x: MODIFIER_ORDER.get(x, 99))
-        ]
-        if token in FKEY_TOKENS:
-            parts.append(token)
-        elif token in SPECIAL_KEY_LABELS:
-            parts.append(SPECIAL_KEY_LABELS[token])
-        else:
-            parts.append(token.upper())
-        return "+".join(parts) if parts else token.upper()
+        return _binding_label(frozenset(modifiers), token)
 
     # Handle direct token strings (used by tray state for configured hotkeys)
     if isinstance(key_obj, str):
-        raw_token = key_obj.strip().upper().replace("-", "_").replace(" ", "_")
-        raw_token = SPECIAL_KEY_ALIASES.get(raw_token, raw_token)
-        if raw_token in SPECIAL_KEY_LABELS:
-            return SPECIAL_KEY_LABELS[raw_token]
-        token = normalize_key_token(key_obj)
-        if token in SPECIAL_KEY_LABELS:
-            return SPECIAL_KEY_LABELS[token]
-        return token or key_obj.strip().upper() or "F9"
+        return _token_label(key_obj)
 
     # Check if it's an F-key
     for name, key in FKEYS.items():
@@ -251,6 +289,16 @@ def key_to_label(key_obj) -> str:
     return "F9"
 
 
+@functools.lru_cache(maxsize=128)
+def _binding_config_string(modifiers: frozenset[str], token: str) -> str:
+    """Cached config string for a (modifiers, token) binding."""
+    parts = [
+        mod for mod in sorted(modifiers, key=lambda x: MODIFIER_ORDER.get(x, 99))
+    ]
+    parts.append(token.upper())
+    return "+".join(parts)
+
+
 def key_to_config_string(key_obj) -> str:
     """Convert key object to config string format.
 
@@ -262,11 +310,7 @@ def key_to_config_string(key_obj) -> str:
     """
     if isinstance(key_obj, tuple) and len(key_obj) == 2:
         modifiers, token = key_obj
-        parts = [
-            mod for mod in sorted(modifiers, key=lambda x: MODIFIER_ORDER.get(x, 99))
-        ]
-        parts.append(token.upper())
-        return "+".join(parts)
+        return _binding_config_string(frozenset(modifiers), token)
 
     # Check if it's an F-key
     for name, key in FKEYS.items():
@@ -345,9 +389,9 @@ def event_to_token(key) -> Optional[str]:
         return None
 
     # Check F-keys first
-    for name, key_obj in FKEYS.items():
-        if key == key_obj:
-            return name
+    name = FKEY_LOOKUP.get(key)
+    if name:
+        return name
 
     # Check character keys
     if isinstance(key, keyboard.KeyCode) and key.char:
@@ -374,6 +418,19 @@ def modifier_name(key) -> Optional[str]:
     return MODIFIER_LOOKUP.get(key)
 
 
+def modifier_bit(key) -> int:
+    """Get the modifier bit for a key object (0 if not a modifier)."""
+    return MODIFIER_BIT_LOOKUP.get(key, 0)
+
+
+def modifiers_to_mask(modifiers) -> int:
+    """Convert modifier names (e.g. {"CTRL", "ALT"}) to a bitmask."""
+    mask = 0
+    for name in modifiers:
+        mask |= MODIFIER_BITS.get(name, 0)
+    return mask
+
+
 def token_modifier_name(token: str) -> Optional[str]:
     """Return the generic modifier represented by a key token, if any."""
     normalized = normalize_key_token(token)
@@ -388,22 +445,35 @@ def token_modifier_name(token: str) -> Optional[str]:
     return None
 
 
-def hotkey_event_matches(
+def hotkey_mask_matches(
     token: str,
-    active_modifiers: Set[str],
-    required_mods: frozenset[str],
+    active_mask: int,
+    required_mask: int,
     required_token: str,
 ) -> bool:
-    """Return whether the current key event should trigger a hotkey binding."""
+    """Bitmask form of hotkey_event_matches() used on the listener hot path.
+
+    Modifiers must match exactly; the modifier bit of a modifier-only hotkey
+    token (e.g. CTRL_R) is ignored so the key can trigger itself.
+    """
     if token != required_token:
         return False
+    return (active_mask & ~TOKEN_MODIFIER_BITS.get(required_token, 0)) == required_mask
 
-    comparable_modifiers = set(active_modifiers)
-    token_modifier = token_modifier_name(required_token)
-    if token_modifier:
-        comparable_modifiers.discard(token_modifier)
 
-    return comparable_modifiers == set(required_mods)
+def hotkey_event_matches(
+    token: str,
+    active_modifiers: Set[str],
+    required_mods: frozenset[str],
+    required_token: str,
+) -> bool:
+    """Return whether the current key event should trigger a hotkey binding."""
+    return hotkey_mask_matches(
+        token,
+        modifiers_to_mask(active_modifiers),
+        modifiers_to_mask(required_mods),
+        required_token,
+    )
 
 
 # Current hotkey binding (used by capture_hotkey and update_hotkey_binding)
@@ -462,9 +532,11 @@ class HotkeyManager:
         # Hotkey registration (accessed from main thread and listener thread)
         self._hotkeys: Dict[str, HotkeyBinding] = {}
         self._callbacks: Dict[str, Callable[[], None]] = {}
+        # token -> [(required_mask, action)] in registration order, rebuilt on change
+        self._compiled: Dict[str, List[Tuple[int, str]]] = {}
 
         # Active key state (accessed from listener thread only, but cleared from main thread)
-        self._active_modifiers: Set[str] = set()
+        self._active_mask: int = 0
         self._active_tokens: Set[str] = set()
 
         # Special event handlers (set from main thread, called from listener thread)
@@ -485,6 +557,7 @@ class HotkeyManager:
         with self._lock:
             self._hotkeys[action] = hotkey
             self._callbacks[action] = callback
+            self._compile_hotkeys()
 
     def unregister(self, action: str) -> None:
         """Unregister a hotkey action.
@@ -497,6 +570,16 @@ class HotkeyManager:
         with self._lock:
             self._hotkeys.pop(action, None)
             self._callbacks.pop(action, None)
+            self._compile_hotkeys()
+
+    def _compile_hotkeys(self) -> None:
+        """Rebuild the token-indexed match table. Caller must hold the lock."""
+        compiled: Dict[str, List[Tuple[int, str]]] = {}
+        for action, (required_mods, required_token) in self._hotkeys.items():
+            compiled.setdefault(required_token, []).append(
+                (modifiers_to_mask(required_mods), action)
+            )
+        self._compiled = compiled
 
     def set_special_handlers(
         self,
@@ -535,7 +618,7 @@ class HotkeyManager:
 
             Thread Safety Strategy:
             1. Read handler functions under lock, then call outside lock
-            2. Protect state modifications (_active_modifiers, _active_tokens) with lock
+            2. Protect state modifications (_active_mask, _active_tokens) with lock
             3. Perform hotkey matching under lock, then call callback outside lock
             4. Minimize time spent holding the lock to reduce contention
             """
@@ -556,36 +639,32 @@ class HotkeyManager:
             if is_capture_active_fn and is_capture_active_fn():
                 return
 
-            # Check if it's a modifier
-            mod = modifier_name(key)
-            if mod:
-                with self._lock:
-                    self._active_modifiers.add(mod)
-
-            # Check if it's a recognized key token
+            # Classify the key before taking the lock
+            bit = modifier_bit(key)
             token = event_to_token(key)
-            if not token:
+            if not bit and not token:
                 return
 
-            # Thread-safe hotkey matching and callback execution
-            # Strategy: Acquire lock, match hotkey, store callback reference, release lock,
-            # then call callback. This prevents deadlock if callback calls back into manager.
+            # Thread-safe modifier update, hotkey matching and callback lookup
+            # in one critical section. Strategy: Acquire lock, match hotkey, store
+            # callback reference, release lock, then call callback. This prevents
+            # deadlock if callback calls back into manager.
             callback_to_call = None
             with self._lock:
+                if bit:
+                    self._active_mask |= bit
+                if not token:
+                    return
+
                 # Prevent key repeat
                 if token in self._active_tokens:
                     return
 
                 self._active_tokens.add(token)
 
-                # Check all registered hotkeys
-                for action, (required_mods, required_token) in self._hotkeys.items():
-                    if hotkey_event_matches(
-                        token,
-                        self._active_modifiers,
-                        required_mods,
-                        required_token,
-                    ):
+                # Only bindings for this token can match
+                for required_mask, action in self._compiled.get(token, ()):
+                    if hotkey_mask_matches(token, self._active_mask, required_mask, token):
                         callback_to_call = self._callbacks.get(action)
                         break
 
@@ -615,16 +694,15 @@ class HotkeyManager:
             if is_capture_active_fn and is_capture_active_fn():
                 return
 
-            # Release modifier - protect state modification
-            mod = modifier_name(key)
-            if mod:
-                with self._lock:
-                    self._active_modifiers.discard(mod)
-
-            # Release token - protect state modification
+            # Release modifier and token - one protected state modification
+            bit = modifier_bit(key)
             token = event_to_token(key)
-            if token:
-                with self._lock:
+            if not bit and not token:
+                return
+            with self._lock:
+                if bit:
+                    self._active_mask &= ~bit
+                if token:
                     self._active_tokens.discard(token)
 
         with self._lock:
@@ -647,7 +725,7 @@ class HotkeyManager:
         with self._lock:
             listener_to_stop = self._listener
             self._listener = None
-            self._active_modifiers.clear()
+            self._active_mask = 0
             self._active_tokens.clear()
 
         # Stop listener OUTSIDE lock to prevent cross-thread deadlock
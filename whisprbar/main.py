@@ -205,6 +205,12 @@ _live_transcription_lock = threading.Lock()
 _active_live_transcription_session = None
 _UNSET_LIVE_SESSION = object()
 
+# Backend warm-up runs once per backend (instances are only replaced when
+# the configured backend changes), not on every recording start
+_warmup_lock = threading.Lock()
+_warmup_in_flight = False
+_warmed_backend: Optional[str] = None
+
 # PID file for singleton enforcement
 PID_FILE = Path.home() / ".cache" / "whisprbar" / "whisprbar.pid"
 
@@ -476,6 +482,40 @@ def command_mode_callback() -> None:
     start_recording_hotkey()
 
 
+# Tags of UI tasks queued by schedule_idle() that have not run yet
+_idle_tasks: set = set()
+_idle_tasks_lock = threading.Lock()
+
+
+def schedule_idle(tag: str, callback: Callable[[], None]) -> None:
+    """Run UI work once on the GTK main loop, coalescing repeats by tag.
+
+    A request whose tag is already queued is dropped, so a burst of
+    identical refreshes or window-open requests runs once per idle tick.
+
+    Args:
+        tag: Identifies the task for coalescing (e.g. "tray_refresh")
+        callback: Work to run on the main loop
+    """
+    with _idle_tasks_lock:
+        if tag in _idle_tasks:
+            return
+        _idle_tasks.add(tag)
+
+    def _run() -> bool:
+        with _idle_tasks_lock:
+            _idle_tasks.discard(tag)
+        callback()
+        return False
+
+    try:
+        from gi.repository import GLib
+    except Exception:
+        _run()
+        return
+    GLib.idle_add(_run)
+
+
 def run_on_gtk_thread(callback: Callable[..., None], *args: Any) -> None:
     """Schedule GTK UI work on the main loop when invoked from hotkey threads."""
     try:
@@ -550,20 +590,25 @@ def open_settings_callback() -> None:
             register_configured_hotkeys(get_hotkey_manager(), restart_listener=True)
         except Exception as exc:
             debug(f"Failed to apply updated hotkeys: {exc}")
-        refresh_menu(get_callbacks(), state)
-        refresh_tray_indicator(state)
+        schedule_idle("tray_refresh", _refresh_tray)
 
-    run_on_gtk_thread(lambda: open_settings_window(cfg, state, on_save=on_save))
+    schedule_idle("open_settings", lambda: open_settings_window(cfg, state, on_save=on_save))
+
+
+def _refresh_tray() -> None:
+    """Rebuild the tray menu and icon from the current config and state."""
+    refresh_menu(get_callbacks(), state)
+    refresh_tray_indicator(state)
 
 
 def open_diagnostics_callback() -> None:
     """Open diagnostics window (menu callback)."""
-    run_on_gtk_thread(lambda: open_diagnostics_window(cfg, first_run=False))
+    schedule_idle("open_diagnostics", lambda: open_diagnostics_window(cfg, first_run=False))
 
 
 def open_history_callback() -> None:
     """Open transcription history window (menu/hotkey callback)."""
-    run_on_gtk_thread(lambda: open_history_window(cfg))
+    schedule_idle("open_history", lambda: open_history_window(cfg))
 
 
 def copy_to_clipboard_callback(text: str) -> None:
@@ -811,6 +856,50 @@ def on_recording_start() -> None:
     # Play audio feedback
     play_audio_feedback("start")
 
+    # Backend setup (SDK import, client creation, model loading) overlaps
+    # the recording instead of delaying the request after it
+    _start_transcriber_warmup()
+
+
+def _start_transcriber_warmup() -> None:
+    """Warm up the active backend once; later recordings skip the thread."""
+    global _warmup_in_flight
+
+    backend = cfg.get("transcription_backend", "openai")
+    with _warmup_lock:
+        if _warmup_in_flight or backend == _warmed_backend:
+            return
+        _warmup_in_flight = True
+    threading.Thread(
+        target=_prepare_transcriber,
+        args=(backend,),
+        name="whisprbar-asr-prepare",
+        daemon=True,
+    ).start()
+
+
+def _prepare_transcriber(backend: str) -> None:
+    """Warm up the active transcription backend in the background."""
+    global _warmup_in_flight, _warmed_backend
+
+    try:
+        get_transcriber().prepare()
+    except Exception as exc:
+        debug(f"Transcriber prepare failed: {exc}")
+        backend = None
+    with _warmup_lock:
+        _warmup_in_flight = False
+        if backend is not None:
+            _warmed_backend = backend
+
+
+def _update_device_index_safe() -> None:
+    """Resolve the configured input device index (startup background thread)."""
+    try:
+        update_device_index()
+    except Exception as exc:
+        debug(f"Audio device lookup failed: {exc}")
+
 
 def _start_live_transcription_session() -> None:
     """Start a live ASR session for streaming-capable backends."""
@@ -1039,7 +1128,7 @@ def on_recording_stop() -> None:
         try:
             # Import here to avoid circular dependencies
             from whisprbar.ui import show_live_overlay, update_live_overlay, hide_live_overlay
-            from whisprbar.audio import apply_vad, apply_noise_reduction, SAMPLE_RATE
+            from whisprbar.audio import apply_vad, apply_noise_reduction, block_sum_squares, SAMPLE_RATE
 
             # Show live overlay if enabled
             show_live_overlay(cfg, t("main.processing_audio", cfg))
@@ -1072,8 +1161,9 @@ def on_recording_stop() -> None:
                     debug(f"Skipping noise reduction for short recording ({input_seconds:.1f}s < {NR_MIN_SECONDS}s)")
                 audio_nr = audio_data
 
-            # Then apply VAD
-            processed = apply_vad(audio_nr)
+            # Then apply VAD. Backends that upload PCM16 take the int16 VAD
+            # output directly instead of a float copy they would convert back.
+            processed = apply_vad(audio_nr, as_pcm16=get_transcriber().accepts_pcm16())
 
             output_seconds = processed.size / SAMPLE_RATE if processed.size else 0.0
             audio_process_ms = (time.monotonic() - audio_process_started_at) * 1000
@@ -1101,8 +1191,7 @@ def on_recording_stop() -> None:
 
             # Audio energy check (prevent hallucinations on noise-only audio)
             # Calculate RMS (Root Mean Square) energy of the audio
-            import numpy as np
-            audio_energy = np.sqrt(np.mean(processed.astype(np.float32) ** 2))
+            audio_energy = (block_sum_squares(processed) / processed.size) ** 0.5
             min_audio_energy = cfg.get("min_audio_energy", 0.0008)
             debug(f"Audio energy: {audio_energy:.4f} (threshold: {min_audio_energy})")
 
@@ -1413,10 +1502,9 @@ def main() -> None:
         check_for_updates_async()
         debug("Update check initiated")
 
-        # Show first-run diagnostics if needed
-        debug("Checking first-run diagnostics...")
-        maybe_show_first_run_diagnostics(cfg)
-        debug("First-run diagnostics completed")
+        # The audio device query (PortAudio) runs alongside the rest of
+        # startup; recording_state["device_idx"] is set under its lock once done
+        threading.Thread(target=_update_device_index_safe, name="whisprbar-device-probe", daemon=True).start()
 
         # Prepare backend client lazily. Only preflight OpenAI when it is selected.
         if cfg.get("transcription_backend", "openai") == "openai":
@@ -1427,6 +1515,11 @@ def main() -> None:
             state["client_ready"] = True
             state["client_warning_shown"] = False
 
+        # Show first-run diagnostics if needed
+        debug("Checking first-run diagnostics...")
+        maybe_show_first_run_diagnostics(cfg)
+        debug("First-run diagnostics completed")
+
         # Get or create hotkey manager
         hotkey_manager = get_hotkey_manager()
 
@@ -1457,9 +1550,6 @@ def main() -> None:
         # Print tray backend info
         print(f"[INFO] Tray backend in use: {tray_backend_label()}")
 
-        # Update audio device index
-        update_device_index()
-
         # Set up recording callbacks (including audio level for indicator)
         from whisprbar.audio import set_recording_callbacks
         from whisprbar.ui.recording_indicator import update_audio_level
@@ -6,8 +6,9 @@ Handles automatic pasting of transcribed text using platform-specific methods:
 - Cross-platform: Type simulation using pynput
 """
 
+import functools
 import os
-import shutil
+import re
 import subprocess
 import threading
 import time
@@ -22,9 +23,16 @@ except Exception as exc:
     PYNPUT_AVAILABLE = False
     _PYNPUT_IMPORT_ERROR = str(exc)
 
+try:
+    import xdo as _xdo_module
+    LIBXDO_AVAILABLE = True
+except Exception:
+    _xdo_module = None
+    LIBXDO_AVAILABLE = False
+
 from .config import cfg
 from .i18n import t
-from .utils import debug, detect_session_type, notify, copy_to_clipboard
+from .utils import debug, detect_session_type, find_command, notify, copy_to_clipboard
 
 if TYPE_CHECKING:  # pragma: no cover - typing only, avoids importing flow during paste import
     from whisprbar.flow.models import PastePolicy
@@ -70,19 +78,42 @@ TERMINAL_KEYWORDS = (
     "shell",
 )
 
+# All terminal keywords in one alternation, so a window is checked in a single scan
+_TERMINAL_RE = re.compile("|".join(re.escape(keyword) for keyword in TERMINAL_KEYWORDS))
+
 # Timeout for window detection
 PASTE_DETECT_TIMEOUT = float(os.environ.get("WHISPRBAR_PASTE_DETECT_TIMEOUT", "0.35"))
 
-# Auto-paste detection cache
-_AUTO_PASTE_CACHE: Dict[str, Any] = {"sequence": "ctrl_v", "timestamp": 0.0}
+# Auto-paste detection cache: last sequence and the X11 window it was detected for.
+# Re-detection within the TTL for the same window skips the getwindowname/xprop forks.
+AUTO_PASTE_CACHE_TTL = 2.0
+_AUTO_PASTE_CACHE: Dict[str, Any] = {"sequence": "ctrl_v", "timestamp": 0.0, "win_id": None}
+_auto_paste_cache_lock = threading.Lock()
 
 # Keyboard controller for simulating key presses
 _controller = keyboard.Controller() if PYNPUT_AVAILABLE else None
 
+# xdotool key sequences for each paste option
+XDOTOOL_KEYS = {
+    "ctrl_v": "ctrl+v",
+    "ctrl_shift_v": "ctrl+Shift+v",
+    "shift_insert": "shift+Insert",
+}
+
+# In-process libxdo handle, opened on first paste (python-libxdo, optional).
+# _xdo_lock guards both its creation and every call on its X connection.
+_xdo_instance = None
+_xdo_init_failed = False
+_xdo_lock = threading.Lock()
 
+
+@functools.lru_cache(maxsize=1)
 def is_wayland_session() -> bool:
     """Check if current session is Wayland.
 
+    The session type cannot change while the process runs, so the result is
+    computed once; ``is_wayland_session.cache_clear()`` forces a re-check.
+
     Returns:
         True if Wayland session, False otherwise
     """
@@ -101,6 +132,62 @@ def press_key(key_obj) -> None:
     _controller.release(key_obj)
 
 
+def _get_libxdo():
+    """Return the shared libxdo handle, opening the X display on first use.
+
+    Returns:
+        xdo.Xdo instance, or None if python-libxdo is unavailable or failed
+    """
+    global _xdo_instance, _xdo_init_failed
+    if not LIBXDO_AVAILABLE:
+        return None
+    with _xdo_lock:
+        if _xdo_instance is None and not _xdo_init_failed:
+            try:
+                _xdo_instance = _xdo_module.Xdo()
+            except Exception as exc:
+                _xdo_init_failed = True
+                debug(f"libxdo unavailable ({exc}); using xdotool")
+        return _xdo_instance
+
+
+def _send_keysequence(target: str) -> bool:
+    """Send an xdotool-style key sequence to the focused window.
+
+    Uses libxdo in-process when available so no process is forked per
+    paste, and falls back to running ``xdotool key``.
+
+    Args:
+        target: Key sequence such as "ctrl+v"
+
+    Returns:
+        True if the sequence was sent
+    """
+    xdo_instance = _get_libxdo()
+    if xdo_instance is not None:
+        try:
+            window = getattr(_xdo_module, "CURRENTWINDOW", 0)
+            # The shared handle owns one Xlib display connection, which is
+            # not thread-safe; paste can run from several worker threads
+            with _xdo_lock:
+                xdo_instance.send_keysequence_window(window, target.encode())
+            debug(f"libxdo sent: {target}")
+            return True
+        except Exception as exc:
+            debug(f"libxdo failed ({exc}), trying xdotool")
+
+    xdotool = find_command("xdotool")
+    if not xdotool:
+        return False
+    try:
+        subprocess.run([xdotool, "key", target], check=True, timeout=2.0)
+        debug(f"xdotool sent: {target}")
+        return True
+    except (subprocess.SubprocessError, OSError, subprocess.TimeoutExpired) as exc:
+        debug(f"xdotool {target} failed: {exc}")
+        return False
+
+
 def get_paste_delay_seconds() -> float:
     """Get configured paste delay in seconds.
 
@@ -169,6 +256,31 @@ def _detect_auto_paste_sequence_blocking(xdotool: str) -> str:
         debug("No active X11 window detected; using clipboard-only paste")
         return "clipboard"
 
+    # Same window as the last detection: reuse its result
+    with _auto_paste_cache_lock:
+        if (
+            _AUTO_PASTE_CACHE.get("win_id") == win_id
+            and time.monotonic() - _AUTO_PASTE_CACHE["timestamp"] < AUTO_PASTE_CACHE_TTL
+        ):
+            debug(f"Reusing paste sequence for window {win_id}")
+            return _AUTO_PASTE_CACHE["sequence"]
+
+    sequence = _classify_window_paste_sequence(xdotool, win_id)
+    with _auto_paste_cache_lock:
+        _AUTO_PASTE_CACHE.update(sequence=sequence, timestamp=time.monotonic(), win_id=win_id)
+    return sequence
+
+
+def _classify_window_paste_sequence(xdotool: str, win_id: str) -> str:
+    """Pick the paste sequence for an X11 window from its name and class.
+
+    Args:
+        xdotool: Path to xdotool executable
+        win_id: X11 window ID
+
+    Returns:
+        Paste sequence ("ctrl_v" or "ctrl_shift_v")
+    """
     # Get window name
     try:
         name_proc = _run_paste_command([xdotool, "getwindowname", win_id])
@@ -185,7 +297,7 @@ def _detect_auto_paste_sequence_blocking(xdotool: str) -> str:
 
     # Get window class using xprop
     class_name = ""
-    xprop = shutil.which("xprop")
+    xprop = find_command("xprop")
     if xprop:
         try:
             class_proc = _run_paste_command([xprop, "-id", win_id, "WM_CLASS"])
@@ -202,10 +314,10 @@ def _detect_auto_paste_sequence_blocking(xdotool: str) -> str:
     debug(f"Focused window: class='{class_name}', name='{name}'")
 
     # Check if window is a terminal
-    for keyword in TERMINAL_KEYWORDS:
-        if keyword in class_name or keyword in name:
-            debug(f"Terminal detected (keyword: {keyword}), using Ctrl+Shift+V")
-            return "ctrl_shift_v"
+    match = _TERMINAL_RE.search(class_name) or _TERMINAL_RE.search(name)
+    if match:
+        debug(f"Terminal detected (keyword: {match.group(0)}), using Ctrl+Shift+V")
+        return "ctrl_shift_v"
 
     return "ctrl_v"
 
@@ -214,7 +326,8 @@ def detect_auto_paste_sequence() -> str:
     """Detect appropriate paste sequence for current environment.
 
     Checks session type (Wayland vs X11) and active window to determine
-    the best paste method. Results are cached for performance.
+    the best paste method. Results are cached per window for
+    AUTO_PASTE_CACHE_TTL seconds.
 
     Returns:
         Paste sequence key (from PASTE_OPTIONS)
@@ -225,7 +338,7 @@ def detect_auto_paste_sequence() -> str:
         return "clipboard"
 
     # Check if xdotool is available
-    xdotool = shutil.which("xdotool")
+    xdotool = find_command("xdotool")
     if not xdotool:
         debug("xdotool unavailable, defaulting to ctrl+V")
         return "ctrl_v"
@@ -246,10 +359,8 @@ def detect_auto_paste_sequence() -> str:
         debug("Window detection timed out; falling back to cached sequence")
         return _AUTO_PASTE_CACHE.get("sequence", "ctrl_v")
 
-    # Update cache and return
+    # The worker records per-window results in the cache itself
     sequence = result.get("sequence") or "ctrl_v"
-    _AUTO_PASTE_CACHE["sequence"] = sequence
-    _AUTO_PASTE_CACHE["timestamp"] = time.time()
     debug(f"Detected paste sequence: {sequence}")
     return sequence
 
@@ -294,13 +405,8 @@ def _send_enter_if_requested(policy: Optional["PastePolicy"]) -> None:
     if not cfg.get("flow_press_enter_enabled", False):
         debug("Press-enter paste policy ignored because flow_press_enter_enabled is false")
         return
-    xdotool = shutil.which("xdotool")
-    if xdotool:
-        try:
-            subprocess.run([xdotool, "key", "Return"], check=True, timeout=2.0)
-            return
-        except (subprocess.SubprocessError, OSError, subprocess.TimeoutExpired) as exc:
-            debug(f"xdotool Return failed: {exc}")
+    if _send_keysequence("Return"):
+        return
     if _controller is not None and PYNPUT_AVAILABLE:
         press_key(keyboard.Key.enter)
 
@@ -311,7 +417,7 @@ def perform_auto_paste(text: str, policy: Optional["PastePolicy"] = None) -> Pas
     Chooses paste method based on configuration and environment:
     1. If paste_sequence is "auto", detects best method
     2. On Wayland, always uses clipboard-only
-    3. On X11, tries xdotool first, falls back to pynput
+    3. On X11, tries libxdo/xdotool first, falls back to pynput
     4. For "type" sequence, simulates typing
 
     Args:
@@ -366,23 +472,13 @@ def perform_auto_paste(text: str, policy: Optional["PastePolicy"] = None) -> Pas
         debug(f"Waiting {delay}s before paste")
         time.sleep(delay)
 
-    # Try xdotool first (more reliable on X11)
-    xdotool = shutil.which("xdotool")
-    if xdotool:
-        mapping = {
-            "ctrl_v": "ctrl+v",
-            "ctrl_shift_v": "ctrl+Shift+v",
-            "shift_insert": "shift+Insert",
-        }
-        target = mapping.get(sequence)
-        if target:
-            try:
-                subprocess.run([xdotool, "key", target], check=True, timeout=2.0)
-                debug(f"xdotool sent: {target}")
-                _send_enter_if_requested(policy)
-                return PasteResult(status="inserted", sequence=sequence)
-            except (subprocess.SubprocessError, OSError, subprocess.TimeoutExpired) as exc:
-                debug(f"xdotool failed ({exc}), falling back to pynput")
+    # Try libxdo/xdotool first (more reliable on X11)
+    target = XDOTOOL_KEYS.get(sequence)
+    if target:
+        if _send_keysequence(target):
+            _send_enter_if_requested(policy)
+            return PasteResult(status="inserted", sequence=sequence)
+        debug("xdo key injection unavailable, falling back to pynput")
 
     # Fallback to pynput keyboard simulation
     if _controller is None or not PYNPUT_AVAILABLE:
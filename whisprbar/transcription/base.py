@@ -56,6 +56,26 @@ class Transcriber:
         """
         return self.transcribe(audio, language)
 
+    def prepare(self) -> None:
+        """Warm up the backend before the audio is ready.
+
+        Called from a background thread when recording starts, so one-time
+        setup (SDK import, client creation, model loading) overlaps the
+        recording instead of delaying the request after it. The default
+        does nothing.
+        """
+
+    def accepts_pcm16(self) -> bool:
+        """Check if transcribe() accepts int16 PCM as well as float32 audio.
+
+        Backends that only encode PCM16 for upload return True so callers
+        can hand them VAD output without converting it to float first.
+
+        Returns:
+            True if int16 PCM input is supported
+        """
+        return False
+
     def supports_streaming(self) -> bool:
         """Check if this backend supports streaming transcription.
 
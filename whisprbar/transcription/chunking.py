@@ -12,7 +12,7 @@ from whisprbar.config import cfg
 from whisprbar.i18n import t
 from whisprbar.utils import debug, error, notify
 from whisprbar.ui import show_live_overlay, update_live_overlay, hide_live_overlay
-from whisprbar.audio import SAMPLE_RATE, split_audio_into_chunks
+from whisprbar.audio import SAMPLE_RATE, pcm16_to_float32, split_audio_into_chunks
 
 
 def transcribe_chunk(
@@ -195,7 +195,7 @@ def transcribe_audio(audio: np.ndarray, language: str = "de") -> Optional[str]:
     - Notifications
 
     Args:
-        audio: Preprocessed audio data as float32 numpy array
+        audio: Preprocessed audio as float32 or int16 PCM numpy array
         language: Language code (e.g., "de", "en")
 
     Returns:
@@ -215,6 +215,8 @@ def transcribe_audio(audio: np.ndarray, language: str = "de") -> Optional[str]:
     try:
         # Audio is already preprocessed (VAD + noise reduction done in main.py)
         processed = audio
+        if processed.dtype == np.int16 and not transcriber.accepts_pcm16():
+            processed = pcm16_to_float32(processed)
         duration = processed.shape[0] / SAMPLE_RATE
         # NOTE: No notify() here — desktop notifications for normal processing are noisy.
         # Errors are notified by the caller (main.py).
@@ -7,7 +7,6 @@ import os
 import queue
 import threading
 import weakref
-import wave
 from typing import List, Optional
 
 import numpy as np
@@ -15,7 +14,7 @@ import numpy as np
 from .base import StreamingTranscriptionSession, Transcriber
 from whisprbar.config import load_env_file_values
 from whisprbar.utils import debug, error
-from whisprbar.audio import SAMPLE_RATE, CHANNELS
+from whisprbar.audio import SAMPLE_RATE, CHANNELS, encode_wav_pcm16, float_to_pcm16
 
 
 class DeepgramHTTPError(RuntimeError):
@@ -26,11 +25,10 @@ _QUEUE_SENTINEL = object()
 
 
 def _audio_chunk_to_pcm16_bytes(audio: np.ndarray) -> bytes:
-    pcm = np.asarray(audio, dtype=np.float32).reshape(-1)
+    pcm = np.asarray(audio)
     if pcm.size == 0:
         return b""
-    pcm16 = (np.clip(pcm, -1.0, 1.0) * 32767).astype(np.int16)
-    return pcm16.tobytes()
+    return float_to_pcm16(pcm).tobytes()
 
 
 class DeepgramRealtimeSession(StreamingTranscriptionSession):
@@ -427,7 +425,7 @@ class DeepgramTranscriber(Transcriber):
         """Transcribe audio using Deepgram Nova-3 REST API.
 
         Args:
-            audio: Audio data as float32 numpy array
+            audio: Audio data as float32 or int16 PCM numpy array
             language: Language code (e.g., "de", "en")
 
         Returns:
@@ -437,21 +435,8 @@ class DeepgramTranscriber(Transcriber):
             return None
 
         try:
-            import io
-
-            # Prepare audio: clip to [-1, 1] and convert to PCM16
-            pcm = np.clip(audio, -1.0, 1.0)
-            pcm16 = (pcm * 32767).astype(np.int16)
-
-            # Write to WAV in memory
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, "wb") as wf:
-                wf.setnchannels(CHANNELS)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(SAMPLE_RATE)
-                wf.writeframes(pcm16.tobytes())
-
-            wav_data = wav_buffer.getvalue()
+            # Prepare audio: clip to [-1, 1] and encode as PCM16 WAV in memory
+            wav_data = encode_wav_pcm16(audio)
 
             # Build Deepgram API URL path with parameters
             url_path = self._build_request_path(language)
@@ -504,6 +489,10 @@ class DeepgramTranscriber(Transcriber):
         """
         return "Deepgram Nova-3 (multilingual)"
 
+    def accepts_pcm16(self) -> bool:
+        """Deepgram uploads PCM16 WAV, so int16 input is encoded as-is."""
+        return True
+
     def supports_streaming(self) -> bool:
         """Deepgram supports live WebSocket streaming when websockets is installed."""
         return True
@@ -13,7 +13,7 @@ import numpy as np
 from .base import StreamingTranscriptionSession, Transcriber
 from whisprbar.config import load_env_file_values
 from whisprbar.utils import debug
-from whisprbar.audio import SAMPLE_RATE
+from whisprbar.audio import SAMPLE_RATE, float_to_pcm16
 
 
 _QUEUE_SENTINEL = object()
@@ -21,11 +21,10 @@ _QUEUE_SENTINEL = object()
 
 def _audio_chunk_to_base64(audio: np.ndarray) -> str:
     """Convert float32 mono audio to base64 PCM16 for ElevenLabs realtime."""
-    pcm = np.asarray(audio, dtype=np.float32).reshape(-1)
+    pcm = np.asarray(audio)
     if pcm.size == 0:
         return ""
-    pcm16 = (np.clip(pcm, -1.0, 1.0) * 32767).astype(np.int16)
-    return base64.b64encode(pcm16.tobytes()).decode()
+    return base64.b64encode(float_to_pcm16(pcm).tobytes()).decode()
 
 
 def _extract_transcript_text(data) -> str:
@@ -216,7 +215,7 @@ class ElevenLabsTranscriber(Transcriber):
         """Transcribe audio using ElevenLabs Scribe v2 Realtime.
 
         Args:
-            audio: Audio data as float32 numpy array
+            audio: Audio data as float32 or int16 PCM numpy array
             language: Language code (e.g., "de", "en")
 
         Returns:
@@ -241,8 +240,7 @@ class ElevenLabsTranscriber(Transcriber):
             lang_code = language
 
             # Prepare audio: clip to [-1, 1] and convert to PCM16
-            pcm = np.clip(audio, -1.0, 1.0)
-            pcm16 = (pcm * 32767).astype(np.int16)
+            pcm16 = float_to_pcm16(audio)
 
             # Convert to base64
             audio_bytes = pcm16.tobytes()
@@ -331,6 +329,14 @@ class ElevenLabsTranscriber(Transcriber):
             debug(f"ElevenLabs transcription failed: {exc}")
             return None
 
+    def prepare(self) -> None:
+        """Import the ElevenLabs SDK and create the client ahead of the upload."""
+        self.ensure_client()
+
+    def accepts_pcm16(self) -> bool:
+        """ElevenLabs sends base64 PCM16, so int16 input is sent as-is."""
+        return True
+
     def supports_streaming(self) -> bool:
         """ElevenLabs uses a true realtime transcription session."""
         return True
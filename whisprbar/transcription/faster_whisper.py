@@ -63,6 +63,10 @@ class FasterWhisperTranscriber(Transcriber):
                 debug(f"Failed to load faster-whisper model: {exc}")
                 return False
 
+    def prepare(self) -> None:
+        """Load the faster-whisper model while the user is still recording."""
+        self.ensure_model()
+
     def transcribe(self, audio: np.ndarray, language: str = "de") -> Optional[str]:
         """Transcribe audio using faster-whisper.
 
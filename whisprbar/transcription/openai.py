@@ -1,11 +1,7 @@
 """OpenAI Whisper API transcription backend for WhisprBar."""
 
-import contextlib
 import os
-import tempfile
 import threading
-import wave
-from pathlib import Path
 from typing import Optional
 
 import numpy as np
@@ -13,7 +9,7 @@ import numpy as np
 from .base import Transcriber, OPENAI_MODEL
 from whisprbar.config import load_env_file_values
 from whisprbar.utils import debug
-from whisprbar.audio import SAMPLE_RATE, CHANNELS
+from whisprbar.audio import encode_wav_pcm16
 
 
 class OpenAITranscriber(Transcriber):
@@ -62,7 +58,7 @@ class OpenAITranscriber(Transcriber):
         """Transcribe audio using OpenAI Whisper API.
 
         Args:
-            audio: Audio data as float32 numpy array
+            audio: Audio data as float32 or int16 PCM numpy array
             language: Language code
 
         Returns:
@@ -72,46 +68,34 @@ class OpenAITranscriber(Transcriber):
             return None
 
         try:
-            # Prepare audio: clip to [-1, 1] and convert to PCM16
-            pcm = np.clip(audio, -1.0, 1.0)
-            pcm16 = (pcm * 32767).astype(np.int16)
-
-            # Write to temp WAV file in WhisprBar's temp directory
-            from whisprbar.utils import get_whisprbar_temp_dir
-            temp_dir = get_whisprbar_temp_dir()
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False, dir=temp_dir) as tmp:
-                tmp_path = Path(tmp.name)
-
-            try:
-                # Create WAV file
-                with wave.open(str(tmp_path), "wb") as wf:
-                    wf.setnchannels(CHANNELS)
-                    wf.setsampwidth(2)  # 16-bit
-                    wf.setframerate(SAMPLE_RATE)
-                    wf.writeframes(pcm16.tobytes())
-
-                # Call OpenAI API
-                with tmp_path.open("rb") as handle:
-                    response = self.client.audio.transcriptions.create(
-                        model=OPENAI_MODEL,
-                        file=handle,
-                        language=language,
-                        temperature=0.0,
-                    )
-
-                transcript = response.text.strip()
-                debug(f"OpenAI transcription: {len(transcript)} chars")
-                return transcript
-
-            finally:
-                # Clean up temp file
-                with contextlib.suppress(Exception):
-                    tmp_path.unlink()
+            # Prepare audio: clip to [-1, 1] and encode as PCM16 WAV in memory
+            wav_data = encode_wav_pcm16(audio)
+
+            # Call OpenAI API; the SDK uploads a (filename, bytes, mime) tuple
+            # directly, so no temp file is written and read back
+            response = self.client.audio.transcriptions.create(
+                model=OPENAI_MODEL,
+                file=("audio.wav", wav_data, "audio/wav"),
+                language=language,
+                temperature=0.0,
+            )
+
+            transcript = response.text.strip()
+            debug(f"OpenAI transcription: {len(transcript)} chars")
+            return transcript
 
         except Exception as exc:
             debug(f"OpenAI transcription failed: {exc}")
             return None
 
+    def prepare(self) -> None:
+        """Import the OpenAI SDK and create the client ahead of the upload."""
+        self.ensure_client()
+
+    def accepts_pcm16(self) -> bool:
+        """OpenAI uploads PCM16 WAV, so int16 input is encoded as-is."""
+        return True
+
     def get_name(self) -> str:
         """Get backend name.
 
@@ -74,6 +74,10 @@ class StreamingTranscriber(Transcriber):
                 debug(f"Failed to create recognizer: {exc}")
                 return False
 
+    def prepare(self) -> None:
+        """Load the sherpa-onnx model while the user is still recording."""
+        self.ensure_model()
+
     def transcribe(self, audio: np.ndarray, language: str = "de") -> Optional[str]:
         """Transcribe audio using sherpa-onnx.
 
@@ -11,10 +11,14 @@ Handles system tray icon and menu using multiple backends:
 import os
 import shutil
 import contextlib
+import functools
+import io
 import threading
 from typing import Optional, Callable, Dict, Any
 from pathlib import Path
 
+from PIL import Image
+
 try:
     import gi
     gi.require_version('Gtk', '3.0')
@@ -33,7 +37,8 @@ except Exception:
     pystray = None
 
 from whisprbar.utils import (
-    build_icon,
+    icon_render_key,
+    render_icon_png,
     ensure_directories,
     APP_NAME,
     debug,
@@ -41,9 +46,9 @@ from whisprbar.utils import (
     clear_history,
     format_history_entry
 )
-from whisprbar.config import cfg
+from whisprbar.config import HIST_FILE, cfg
 from whisprbar.hotkeys import key_to_label
-from whisprbar.i18n import t
+from whisprbar.i18n import get_language, t
 
 # Module state
 _icon: Optional[Any] = None  # pystray.Icon
@@ -52,7 +57,13 @@ _gtk_loop: Optional[Any] = None  # GLib.MainLoop
 _icon_ready: bool = False
 _icon_ready_lock = threading.Lock()
 _icon_images: Dict[str, Any] = {}  # PIL Images for PyStray
-_icon_files: Dict[str, Path] = {}  # File paths for AppIndicator
+_icon_files: Dict[str, str] = {}  # File path strings for AppIndicator
+_refresh_lock = threading.Lock()
+_pending_refresh: Dict[str, Any] = {}  # Coalesced AppIndicator updates
+_refresh_scheduled: bool = False
+_menu_signature: Optional[tuple] = None  # Inputs of the menu currently shown (either backend)
+_tray_titles: Dict[str, str] = {}  # Cached PyStray titles per tray state
+_tray_titles_key: Optional[tuple] = None
 
 # =============================================================================
 # Backend Selection
@@ -98,40 +109,86 @@ def get_tray_backend() -> str:
 # Icon Generation and Storage
 # =============================================================================
 
-def _store_icon(name: str, image) -> Path:
+def _icons_dir() -> Path:
+    """Return the directory holding the AppIndicator icon files."""
+    return Path.home() / ".local" / "share" / "whisprbar" / "icons"
+
+
+def _store_icon(name: str, png_bytes: bytes) -> Path:
     """
-    Save icon image to disk and return path.
+    Save encoded icon bytes to disk and return path.
+
+    The file is written to a temporary name and moved into place, so a
+    crash mid-write never leaves a truncated icon behind.
 
     Args:
-        name: Icon name (e.g., "ready", "recording", "transcribing")
-        image: PIL Image object
+        name: Icon file stem (e.g., "ready-<render key>")
+        png_bytes: PNG-encoded icon data
 
     Returns:
         Path to saved icon file
     """
     ensure_directories()
-    icons_dir = Path.home() / ".local" / "share" / "whisprbar" / "icons"
+    icons_dir = _icons_dir()
     icons_dir.mkdir(parents=True, exist_ok=True)
     path = icons_dir / f"{name}.png"
-    image.save(str(path), "PNG")
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(png_bytes)
+    os.replace(tmp_path, path)
     return path
 
 
+def _open_icon(path: Path) -> Optional["Image.Image"]:
+    """Load a stored icon file, or return None if it is missing or unreadable."""
+    try:
+        image = Image.open(path)
+        image.load()
+    except (OSError, SyntaxError, ValueError) as exc:
+        if path.exists():
+            debug(f"Stored icon {path.name} unreadable, re-rendering: {exc}")
+        return None
+    return image
+
+
+def _load_icon(state: str) -> tuple:
+    """
+    Return the (image, file path) for an icon state, rendering only when needed.
+
+    The icon files written for AppIndicator double as the cache: each is
+    named after a hash of its render parameters (icon_render_key), so a
+    matching file is reused as-is and a change to the drawing code renders
+    a fresh one. Missing or corrupt files are re-rendered and rewritten.
+
+    Args:
+        state: Icon state ("ready", "recording", "transcribing")
+
+    Returns:
+        Tuple of (PIL image, path string)
+    """
+    name = f"{state}-{icon_render_key(state)}"
+    path = _icons_dir() / f"{name}.png"
+    image = _open_icon(path)
+    if image is not None:
+        return image, str(path)
+
+    png_bytes = render_icon_png(state)
+    image = Image.open(io.BytesIO(png_bytes))
+    image.load()
+    path = _store_icon(name, png_bytes)
+    # Drop files left by earlier renders of this state
+    for stale in path.parent.glob(f"{state}-*.png"):
+        if stale != path:
+            with contextlib.suppress(OSError):
+                stale.unlink()
+    return image, str(path)
+
+
 def initialize_icons() -> None:
     """Generate and store all icon states for both PyStray and AppIndicator."""
     global _icon_images, _icon_files
 
-    ready_img = build_icon(state="ready")
-    _icon_images["ready"] = ready_img
-    _icon_files["ready"] = _store_icon("ready", ready_img)
-
-    recording_img = build_icon(state="recording")
-    _icon_images["recording"] = recording_img
-    _icon_files["recording"] = _store_icon("recording", recording_img)
-
-    transcribing_img = build_icon(state="transcribing")
-    _icon_images["transcribing"] = transcribing_img
-    _icon_files["transcribing"] = _store_icon("transcribing", transcribing_img)
+    for state in ("ready", "recording", "transcribing"):
+        _icon_images[state], _icon_files[state] = _load_icon(state)
 
 
 # =============================================================================
@@ -170,28 +227,43 @@ def cfg_equals_checker(key: str, expected) -> Callable:
     return _checked
 
 
+def _on_history_item_activate(_item, copy_func: Callable, text: str) -> None:
+    """Copy a recent transcript; shared "activate" handler for history items."""
+    copy_func(text)
+
+
 # =============================================================================
 # Menu Builders
 # =============================================================================
 
+_TRAY_LABEL_NAMES = (
+    "recent",
+    "clear_history",
+    "no_recent",
+    "vad",
+    "settings",
+    "quit",
+    "ready",
+    "recording",
+    "transcribing",
+    "start_stop",
+    "start_recording",
+    "stop_recording",
+    "diagnostics",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _tray_labels_for_language(language: str) -> Dict[str, str]:
+    """Translate all tray labels for one supported UI language (memoized)."""
+    return {name: t(f"tray.{name}", language) for name in _TRAY_LABEL_NAMES}
+
+
 def get_tray_labels(config: Dict[str, Any] | None = None) -> Dict[str, str]:
     """Return localized tray labels for the configured UI language."""
-    config = config or cfg
-    return {
-        "recent": t("tray.recent", config),
-        "clear_history": t("tray.clear_history", config),
-        "no_recent": t("tray.no_recent", config),
-        "vad": t("tray.vad", config),
-        "settings": t("tray.settings", config),
-        "quit": t("tray.quit", config),
-        "ready": t("tray.ready", config),
-        "recording": t("tray.recording", config),
-        "transcribing": t("tray.transcribing", config),
-        "start_stop": t("tray.start_stop", config),
-        "start_recording": t("tray.start_recording", config),
-        "stop_recording": t("tray.stop_recording", config),
-        "diagnostics": t("tray.diagnostics", config),
-    }
+    # Labels are static per language, so menu and icon refreshes reuse one
+    # translated set instead of re-resolving every key each time
+    return dict(_tray_labels_for_language(get_language(config or cfg)))
 
 
 def _tray_status_key(state: Dict[str, Any]) -> str:
@@ -240,8 +312,7 @@ def build_pystray_menu(callbacks: Dict[str, Callable], state: Dict[str, Any]) ->
     if pystray is None:
         raise RuntimeError("PyStray not available")
 
-    labels = get_tray_labels(cfg)
-    status_key = _tray_status_key(state)
+    labels = _tray_labels_for_language(get_language(cfg))
 
     # Build recent transcriptions submenu
     history_entries = read_history(limit=10)
@@ -270,10 +341,12 @@ def build_pystray_menu(callbacks: Dict[str, Callable], state: Dict[str, Any]) ->
         )
 
     toggle_recording = callbacks.get("toggle_recording")
+    # Status, recording action and VAD check are read on each paint, so
+    # refresh_menu() can update them in place without rebuilding the menu
     menu_items = [
-        pystray.MenuItem(labels[status_key], None, enabled=False),
+        pystray.MenuItem(lambda _: labels[_tray_status_key(state)], None, enabled=False),
         pystray.MenuItem(
-            _recording_action_label(labels, state),
+            lambda _: _recording_action_label(labels, state),
             (lambda *_: toggle_recording()) if toggle_recording else None,
             enabled=toggle_recording is not None,
         ),
@@ -283,7 +356,7 @@ def build_pystray_menu(callbacks: Dict[str, Callable], state: Dict[str, Any]) ->
         pystray.MenuItem(
             labels["vad"],
             lambda *_: callbacks["toggle_vad"](),
-            checked=lambda _: cfg.get("use_vad", False),
+            checked=lambda _: bool(cfg.get("use_vad", False)),
             enabled=callbacks.get("vad_available", lambda: True)(),
         ),
         pystray.Menu.SEPARATOR,
@@ -318,7 +391,11 @@ def build_appindicator_menu(callbacks: Dict[str, Callable], state: Dict[str, Any
     if not APPINDICATOR_AVAILABLE:
         raise RuntimeError("AppIndicator backend unavailable")
 
-    labels = get_tray_labels(cfg)
+    # Read cfg once so the whole menu reflects one consistent snapshot; the
+    # labels are only read here, so the shared translated set needs no copy
+    language = get_language(cfg)
+    use_vad = bool(cfg.get("use_vad", False))
+    labels = _tray_labels_for_language(language)
     status_key = _tray_status_key(state)
     menu = Gtk.Menu()
 
@@ -341,14 +418,14 @@ def build_appindicator_menu(callbacks: Dict[str, Callable], state: Dict[str, Any
 
     history_entries = read_history(limit=10)
     if history_entries:
+        copy_to_clipboard = callbacks["copy_to_clipboard"]
         for entry in history_entries:
             text = entry.get("text", "")
             display_text = format_history_entry(entry, max_length=50)
             history_item = Gtk.MenuItem(label=display_text)
-            history_item.connect(
-                "activate",
-                lambda _, t=text: callbacks["copy_to_clipboard"](t)
-            )
+            # One module-level handler with the text as user data instead of
+            # a fresh closure per history item
+            history_item.connect("activate", _on_history_item_activate, copy_to_clipboard, text)
             recent_submenu.append(history_item)
 
         recent_submenu.append(Gtk.SeparatorMenuItem())
@@ -368,7 +445,7 @@ def build_appindicator_menu(callbacks: Dict[str, Callable], state: Dict[str, Any
 
     # VAD toggle
     vad_item = Gtk.CheckMenuItem(label=labels["vad"])
-    vad_item.set_active(cfg.get("use_vad", False))
+    vad_item.set_active(use_vad)
     vad_item.set_sensitive(callbacks.get("vad_available", lambda: True)())
     vad_item.connect("activate", lambda *_: callbacks["toggle_vad"]())
     menu.append(vad_item)
@@ -399,6 +476,128 @@ def build_appindicator_menu(callbacks: Dict[str, Callable], state: Dict[str, Any
 # Tray Refresh
 # =============================================================================
 
+def _schedule_appindicator_refresh(kind: str, payload: Any) -> None:
+    """
+    Queue an AppIndicator icon or menu update on the GTK main loop.
+
+    Updates requested before the main loop gets to them are coalesced into
+    a single idle callback that applies only the latest icon and menu, so a
+    burst of state changes costs one redraw instead of one per call. The
+    menu is only rebuilt when its rendered inputs changed.
+
+    Args:
+        kind: "icon" or "menu"
+        payload: state dict for "icon", (callbacks, state) for "menu"
+    """
+    global _refresh_scheduled
+
+    with _refresh_lock:
+        _pending_refresh[kind] = payload
+        if _refresh_scheduled:
+            return
+        _refresh_scheduled = True
+    # Low priority lets pending input and redraw events run first
+    GLib.idle_add(_flush_appindicator_refresh, priority=GLib.PRIORITY_LOW)
+
+
+def _flush_appindicator_refresh() -> bool:
+    """Apply pending AppIndicator updates (GLib idle callback)."""
+    global _refresh_scheduled, _menu_signature
+
+    with _refresh_lock:
+        pending = dict(_pending_refresh)
+        _pending_refresh.clear()
+        _refresh_scheduled = False
+
+    indicator = _indicator
+    if indicator is None:
+        return False
+
+    if "icon" in pending:
+        icon_key = _tray_status_key(pending["icon"])
+        icon_path = _icon_files.get(icon_key)
+        if icon_path:
+            status = _tray_labels_for_language(get_language(cfg))[icon_key]
+            indicator.set_icon_full(icon_path, status)
+            indicator.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
+            indicator.set_label(_compact_appindicator_label(icon_key), APP_NAME)
+
+    if "menu" in pending:
+        callbacks, state = pending["menu"]
+        signature = _tray_menu_signature(callbacks, state)
+        if signature != _menu_signature:
+            menu = build_appindicator_menu(callbacks, state)
+            indicator.set_menu(menu)
+            menu.show_all()
+            _menu_signature = signature
+    return False
+
+
+def _tray_menu_signature(callbacks: Dict[str, Callable], state: Dict[str, Any]) -> tuple:
+    """
+    Fingerprint every input that the tray menu builders render.
+
+    Args:
+        callbacks: Dictionary of callback functions
+        state: Application state dictionary
+
+    Returns:
+        Hashable ``(structure, live)`` signature; equal signatures produce
+        identical menus. Only ``live`` inputs (status, hotkey, VAD check)
+        differ between menus that PyStray can update in place.
+    """
+    try:
+        history_stat = HIST_FILE.stat()
+        history_sig = (history_stat.st_mtime_ns, history_stat.st_size)
+    except OSError:
+        history_sig = None
+    vad_available = callbacks.get("vad_available", lambda: True)()
+    structure = (
+        get_language(cfg),
+        vad_available,
+        history_sig,
+        tuple(sorted((name, id(func)) for name, func in callbacks.items())),
+    )
+    live = (
+        _tray_status_key(state),
+        state.get("hotkey_key"),
+        bool(cfg.get("use_vad", False)),
+    )
+    return structure, live
+
+
+def _pystray_title(status_key: str, state: Dict[str, Any]) -> str:
+    """
+    Return the PyStray tooltip title for a tray state.
+
+    Titles for all states are built together and reused until the UI
+    language, session type or hotkey changes.
+
+    Args:
+        status_key: "ready", "recording" or "transcribing"
+        state: Application state dictionary
+
+    Returns:
+        Tooltip title string
+    """
+    global _tray_titles, _tray_titles_key
+
+    hotkey_key = state.get("hotkey_key")
+    session_label = state.get("session_type", "unknown")
+    titles_key = (get_language(cfg), session_label, hotkey_key)
+    titles = _tray_titles
+    if titles_key != _tray_titles_key:
+        labels = _tray_labels_for_language(titles_key[0])
+        suffix = f"[{session_label}] ({key_to_label(hotkey_key)}: {labels['start_stop']})"
+        titles = {
+            key: f"{APP_NAME} - {labels[key]} {suffix}"
+            for key in ("ready", "recording", "transcribing")
+        }
+        _tray_titles = titles
+        _tray_titles_key = titles_key
+    return titles[status_key]
+
+
 def refresh_tray_indicator(state: Dict[str, Any]) -> None:
     """
     Update tray icon and label based on current state.
@@ -412,17 +611,7 @@ def refresh_tray_indicator(state: Dict[str, Any]) -> None:
         if _indicator is None or not _icon_files or GLib is None:
             return
 
-        icon_key = _tray_status_key(state)
-        status = get_tray_labels(cfg)[icon_key]
-
-        icon_path = _icon_files.get(icon_key)
-        if icon_path:
-            def _update_icon():
-                _indicator.set_icon_full(str(icon_path), status)
-                _indicator.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
-                _indicator.set_label(_compact_appindicator_label(icon_key), APP_NAME)
-                return False
-            GLib.idle_add(_update_icon)
+        _schedule_appindicator_refresh("icon", state)
         return
 
     # PyStray backend - thread-safe check
@@ -431,15 +620,7 @@ def refresh_tray_indicator(state: Dict[str, Any]) -> None:
             return
 
     image_key = _tray_status_key(state)
-    status = get_tray_labels(cfg)[image_key]
-
-    from whisprbar.hotkeys import key_to_label
-    hotkey_key = state.get("hotkey_key")
-    session_label = state.get("session_type", "unknown")
-    _icon.title = (
-        f"{APP_NAME} - {status} [{session_label}] "
-        f"({key_to_label(hotkey_key)}: {get_tray_labels(cfg)['start_stop']})"
-    )
+    _icon.title = _pystray_title(image_key, state)
     image = _icon_images.get(image_key) or _icon_images.get("ready")
     if image is not None:
         _icon.icon = image
@@ -453,19 +634,13 @@ def refresh_menu(callbacks: Dict[str, Callable], state: Dict[str, Any]) -> None:
         callbacks: Dictionary of callback functions
         state: Application state dictionary
     """
-    global _icon, _indicator, _icon_ready
+    global _icon, _indicator, _icon_ready, _menu_signature
 
     if state.get("tray_backend") == "appindicator":
         if _indicator is None or GLib is None:
             return
 
-        def _update_menu():
-            menu = build_appindicator_menu(callbacks, state)
-            _indicator.set_menu(menu)
-            menu.show_all()
-            return False
-
-        GLib.idle_add(_update_menu)
+        _schedule_appindicator_refresh("menu", (callbacks, state))
         return
 
     # PyStray backend - thread-safe check
@@ -473,7 +648,16 @@ def refresh_menu(callbacks: Dict[str, Callable], state: Dict[str, Any]) -> None:
         icon_is_ready = _icon_ready and _icon is not None
 
     if icon_is_ready:
-        _icon.menu = build_pystray_menu(callbacks, state)
+        # Keep the current menu (and its items) when nothing it shows changed;
+        # live-only changes are repainted in place by update_menu()
+        structure, live = _tray_menu_signature(callbacks, state)
+        # Live items read the state dict the menu was built with
+        signature = ((*structure, id(state)), live)
+        if signature == _menu_signature:
+            return
+        if _menu_signature is None or signature[0] != _menu_signature[0]:
+            _icon.menu = build_pystray_menu(callbacks, state)
+        _menu_signature = signature
         try:
             _icon.update_menu()
         except Exception:
@@ -495,7 +679,7 @@ def start_pystray_tray(callbacks: Dict[str, Callable], state: Dict[str, Any]) ->
     Returns:
         Function that runs the PyStray event loop
     """
-    global _icon, _icon_ready, _icon_images
+    global _icon, _icon_ready, _icon_images, _menu_signature
 
     if pystray is None:
         raise RuntimeError("PyStray not available")
@@ -504,6 +688,7 @@ def start_pystray_tray(callbacks: Dict[str, Callable], state: Dict[str, Any]) ->
         initialize_icons()
 
     _icon_ready = False
+    _menu_signature = None
     tray_menu = build_pystray_menu(callbacks, state)
     _icon = pystray.Icon(APP_NAME, _icon_images["ready"], menu=tray_menu)
     state["tray_backend"] = os.environ.get("PYSTRAY_BACKEND", state.get("tray_backend") or "auto")
@@ -535,7 +720,7 @@ def start_appindicator_tray(callbacks: Dict[str, Callable], state: Dict[str, Any
     Returns:
         Function that runs the GTK main loop
     """
-    global _indicator, _gtk_loop, _icon_files
+    global _indicator, _gtk_loop, _icon_files, _menu_signature
 
     if not APPINDICATOR_AVAILABLE:
         raise RuntimeError("AppIndicator backend unavailable")
@@ -544,9 +729,8 @@ def start_appindicator_tray(callbacks: Dict[str, Callable], state: Dict[str, Any
 
     if not _icon_files:
         initialize_icons()
-
-    if not _icon_files:
-        raise RuntimeError("Icon files missing")
+        if not _icon_files:
+            raise RuntimeError("Icon files missing")
 
     if Gtk is not None:
         try:
@@ -555,12 +739,13 @@ def start_appindicator_tray(callbacks: Dict[str, Callable], state: Dict[str, Any
             pass
 
     indicator_id = f"aa-{APP_NAME.lower()}"
+    ready_path = _icon_files["ready"]
     _indicator = AppIndicator3.Indicator.new(
         indicator_id,
-        str(_icon_files["ready"]),
+        ready_path,
         AppIndicator3.IndicatorCategory.APPLICATION_STATUS
     )
-    _indicator.set_icon_full(str(_icon_files["ready"]), get_tray_labels(cfg)["ready"])
+    _indicator.set_icon_full(ready_path, get_tray_labels(cfg)["ready"])
     _indicator.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
 
     try:
@@ -571,6 +756,7 @@ def start_appindicator_tray(callbacks: Dict[str, Callable], state: Dict[str, Any
     menu = build_appindicator_menu(callbacks, state)
     menu.show_all()
     _indicator.set_menu(menu)
+    _menu_signature = _tray_menu_signature(callbacks, state)
     _indicator.set_label(_compact_appindicator_label("ready"), APP_NAME)
 
     _gtk_loop = GLib.MainLoop()
@@ -592,8 +778,9 @@ def shutdown_tray(state: Dict[str, Any]) -> None:
     Args:
         state: Application state dictionary
     """
-    global _icon, _indicator, _gtk_loop, _icon_ready
+    global _icon, _indicator, _gtk_loop, _icon_ready, _menu_signature
 
+    _menu_signature = None
     if state.get("tray_backend") == "appindicator":
         if _indicator is not None:
             with contextlib.suppress(Exception):
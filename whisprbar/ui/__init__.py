@@ -12,4 +12,4 @@ from .history import open_history_window
 from .settings_webview import open_settings_window
 from .scratchpad import open_scratchpad_window
 from .theme import apply_theme_css, get_effective_theme, detect_system_theme
-from .helpers import make_row, build_switch
+from .helpers import make_row, build_switch, escape_markup, persist_in_background, snap_scale_to_step
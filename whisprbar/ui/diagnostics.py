@@ -13,6 +13,7 @@ except (ImportError, ValueError):
 from whisprbar.config import save_config, cfg
 from whisprbar.i18n import t
 from whisprbar.utils import (
+    cached_collect_diagnostics,
     collect_diagnostics,
     DiagnosticResult,
     STATUS_OK,
@@ -21,6 +22,7 @@ from whisprbar.utils import (
     STATUS_ICON_NAME,
     CLI_STATUS_LABEL,
 )
+from whisprbar.ui.helpers import escape_markup
 from whisprbar.ui.theme import get_effective_theme, apply_theme_css
 
 # Module state
@@ -115,7 +117,7 @@ def open_diagnostics_window(cfg: dict, first_run: bool = False) -> None:
 
         title_label = Gtk.Label()
         if GLib is not None:
-            title_label.set_markup(f"<b>{GLib.markup_escape_text(t('diagnostics.environment', cfg))}</b>")
+            title_label.set_markup(f"<b>{escape_markup(t('diagnostics.environment', cfg))}</b>")
         else:
             title_label.set_text(t("diagnostics.environment", cfg))
         title_label.set_xalign(0.0)
@@ -150,11 +152,10 @@ def open_diagnostics_window(cfg: dict, first_run: bool = False) -> None:
         button_box.pack_start(rerun_button, False, False, 0)
         button_box.pack_start(close_button, False, False, 0)
 
-        def populate() -> None:
-            for child in list(results_box.get_children()):
-                results_box.remove(child)
+        shown_results = {"value": None}
 
-            results = collect_diagnostics()
+        def populate(force: bool = False) -> None:
+            results = cached_collect_diagnostics(force=force)
             errors = sum(1 for item in results if item.status == STATUS_ERROR)
             warnings = sum(1 for item in results if item.status == STATUS_WARN)
             if errors:
@@ -164,6 +165,15 @@ def open_diagnostics_window(cfg: dict, first_run: bool = False) -> None:
             else:
                 summary_label.set_text(t("diagnostics.all_passed", cfg))
 
+            # Identical results on "Run again": keep the existing rows
+            # instead of destroying and rebuilding every widget
+            if results == shown_results["value"]:
+                return
+            shown_results["value"] = list(results)
+
+            for child in list(results_box.get_children()):
+                results_box.remove(child)
+
             for res in results:
                 row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
                 row.set_hexpand(True)
@@ -181,7 +191,7 @@ def open_diagnostics_window(cfg: dict, first_run: bool = False) -> None:
 
                 label_text = res.label
                 if GLib is not None:
-                    safe_label = GLib.markup_escape_text(label_text)
+                    safe_label = escape_markup(label_text)
                     title = Gtk.Label()
                     title.set_markup(f"<b>{safe_label}</b>")
                 else:
@@ -198,7 +208,7 @@ def open_diagnostics_window(cfg: dict, first_run: bool = False) -> None:
                 if res.remedy:
                     remedy_text = f"{t('diagnostics.fix', cfg)}: {res.remedy}"
                     if GLib is not None:
-                        safe_fix = GLib.markup_escape_text(remedy_text)
+                        safe_fix = escape_markup(remedy_text)
                         remedy = Gtk.Label()
                         remedy.set_markup(f"<span size='small'>{safe_fix}</span>")
                     else:
@@ -219,7 +229,7 @@ def open_diagnostics_window(cfg: dict, first_run: bool = False) -> None:
 
         populate()
 
-        rerun_button.connect("clicked", lambda *_: populate())
+        rerun_button.connect("clicked", lambda *_: populate(force=True))
         close_button.connect("clicked", lambda *_: window.destroy())
 
         def on_destroy(*_args) -> None:
@@ -3,15 +3,56 @@
 whisprbar/ui/helpers.py - Shared GTK helper functions used across multiple UI components
 """
 
-from typing import Optional
+import threading
+from typing import Callable, Optional
 
 try:
     import gi
     gi.require_version('Gtk', '3.0')
-    from gi.repository import Gtk
+    from gi.repository import GLib, Gtk
 except (ImportError, ValueError):
+    GLib = None
     Gtk = None
 
+# Serializes background settings work so rapid saves apply in order
+_persist_lock = threading.Lock()
+
+# Pango markup escapes, applied in one pass. Control characters (other than
+# tab, newline and carriage return) become numeric character references, the
+# form GMarkup accepts, so stray control bytes cannot make set_markup() fail.
+_MARKUP_CONTROL_CHARS = [
+    *range(0x01, 0x09),
+    0x0B,
+    0x0C,
+    *range(0x0E, 0x20),
+    *range(0x7F, 0x85),
+    *range(0x86, 0xA0),
+]
+_MARKUP_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    "'": "&apos;",
+    '"': "&quot;",
+    **{chr(code): f"&#x{code:x};" for code in _MARKUP_CONTROL_CHARS},
+})
+
+
+def escape_markup(text: str) -> str:
+    """Escape text for use inside Pango markup.
+
+    Replaces the five markup-significant characters with entities and
+    C0/C1 control characters (except tab, newline and carriage return)
+    with character references.
+
+    Args:
+        text: Plain text
+
+    Returns:
+        Text safe to embed in set_markup()
+    """
+    return text.translate(_MARKUP_TABLE)
+
 
 def make_row(
     label_text: str,
@@ -71,3 +112,55 @@ def build_switch(label_text: str, active: bool, tooltip: Optional[str] = None) -
         switch.set_tooltip_text(tooltip)
     row = make_row(label_text, switch, tooltip=tooltip)
     return row, switch
+
+
+def snap_scale_to_step(scale, step: float) -> None:
+    """Quantize a Gtk.Scale to multiples of ``step`` while it is dragged.
+
+    The adjustment only changes (and emits value-changed) when the pointer
+    crosses to the next step instead of on every intermediate value.
+
+    Args:
+        scale: Gtk.Scale (or any Gtk.Range) to snap
+        step: Step size the value is rounded to
+    """
+    def _on_change_value(range_widget, _scroll, value) -> bool:
+        adjustment = range_widget.get_adjustment()
+        snapped = round(value / step) * step
+        snapped = min(max(snapped, adjustment.get_lower()), adjustment.get_upper())
+        if snapped != adjustment.get_value():
+            adjustment.set_value(snapped)
+        return True
+
+    scale.connect("change-value", _on_change_value)
+
+
+def persist_in_background(
+    work: Callable[[], None],
+    on_done: Optional[Callable[[], None]] = None,
+) -> threading.Thread:
+    """Run slow settings follow-up work off the GTK main loop.
+
+    ``work`` (e.g. the audio device probe) runs on a daemon thread; ``on_done``
+    is then posted back to the main loop so UI refreshes stay on GTK.
+
+    Args:
+        work: Blocking probe work to run on the worker thread
+        on_done: Optional UI callback to run once ``work`` has finished
+
+    Returns:
+        The started worker thread
+    """
+    def _worker() -> None:
+        with _persist_lock:
+            work()
+        if on_done is None:
+            return
+        if GLib is None:
+            on_done()
+            return
+        GLib.idle_add(lambda: on_done() or False)
+
+    thread = threading.Thread(target=_worker, name="whisprbar-settings-save", daemon=True)
+    thread.start()
+    return thread
@@ -18,6 +18,7 @@ from whisprbar.utils import (
     copy_to_clipboard,
 )
 from whisprbar.i18n import t
+from whisprbar.ui.helpers import escape_markup
 from whisprbar.ui.theme import get_effective_theme, apply_theme_css
 from whisprbar.flow.stats import compute_dictation_stats
 
@@ -73,7 +74,7 @@ def open_history_window(cfg: dict) -> None:
 
         title = Gtk.Label()
         if GLib is not None:
-            title.set_markup(f"<b>{GLib.markup_escape_text(t('history.recent', cfg))}</b>")
+            title.set_markup(f"<b>{escape_markup(t('history.recent', cfg))}</b>")
         else:
             title.set_text(t("history.recent", cfg))
         title.set_xalign(0.0)
@@ -156,7 +157,7 @@ def open_history_window(cfg: dict) -> None:
 
                 meta_label = Gtk.Label()
                 if GLib is not None:
-                    meta_label.set_markup(f"<b>{GLib.markup_escape_text(meta_text)}</b>")
+                    meta_label.set_markup(f"<b>{escape_markup(meta_text)}</b>")
                 else:
                     meta_label.set_text(meta_text)
                 meta_label.set_xalign(0.0)
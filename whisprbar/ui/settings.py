@@ -11,6 +11,7 @@ This module handles all user interface components:
 """
 
 from typing import Optional, Callable, List
+import copy
 import sys
 import threading
 import json
@@ -37,12 +38,13 @@ from whisprbar.utils import (
     STATUS_ICON_NAME,
     CLI_STATUS_LABEL,
     APP_NAME,
+    debug,
     notify,
     read_history,
     clear_history,
     copy_to_clipboard,
 )
-from whisprbar.audio import list_input_devices, update_device_index
+from whisprbar.audio import device_index_is_stale, list_input_devices, update_device_index
 from whisprbar.hotkeys import capture_hotkey, cancel_hotkey_capture
 from whisprbar.hotkey_actions import HOTKEY_SETTINGS_LABELS
 from whisprbar.ui_hotkeys import (
@@ -75,7 +77,7 @@ except ImportError:
 # Theme Detection and Styling
 # =============================================================================
 
-from .helpers import make_row, build_switch
+from .helpers import make_row, build_switch, persist_in_background, snap_scale_to_step
 from .theme import apply_theme_css, get_effective_theme
 
 # =============================================================================
@@ -122,7 +124,8 @@ def open_settings_window(cfg: dict, state: dict, on_save: Optional[Callable] = N
                 _settings_window.close()
                 return False
 
-        devices = list_input_devices()
+        # Re-scan on open so devices plugged in or removed since startup show up
+        devices = list_input_devices(refresh=True)
         device_map = {"__default__": None}
 
         window = Gtk.Window(title=f"{APP_NAME} Settings")
@@ -462,8 +465,9 @@ def open_settings_window(cfg: dict, state: dict, on_save: Optional[Callable] = N
         basis_page.pack_start(Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL), False, False, 6)
 
         # Auto-paste and notifications
+        wayland_session = is_wayland_session()
         auto_tooltip = "Text automatisch nach Transkription einfügen"
-        if is_wayland_session():
+        if wayland_session:
             auto_tooltip += " (Wayland: nur Zwischenablage)"
         auto_row, auto_switch = build_switch("Auto-Paste", cfg.get("auto_paste_enabled", False), auto_tooltip)
         basis_page.pack_start(auto_row, False, False, 0)
@@ -477,7 +481,7 @@ def open_settings_window(cfg: dict, state: dict, on_save: Optional[Callable] = N
         for key, label in PASTE_OPTIONS.items():
             paste_combo.append(key, label)
         paste_combo.set_active_id(cfg.get("paste_sequence", "auto"))
-        if is_wayland_session():
+        if wayland_session:
             paste_combo.set_sensitive(False)
         paste_row = make_row("  Paste-Modus", paste_combo, tooltip="Methode für Auto-Paste")
         basis_page.pack_start(paste_row, False, False, 0)
@@ -509,13 +513,13 @@ def open_settings_window(cfg: dict, state: dict, on_save: Optional[Callable] = N
         device_combo = Gtk.ComboBoxText()
         device_combo.append("__default__", "System-Standard")
         active_device_id = "__default__"
-        saved_name = cfg.get("device_name")
+        saved_name = (cfg.get("device_name") or "").lower()
         for device in devices:
             device_id = str(device.get("index"))
             device_name = device.get("name") or f"Gerät {device_id}"
             device_map[device_id] = device_name
             device_combo.append(device_id, device_name)
-            if saved_name and device_name.lower() == saved_name.lower():
+            if saved_name and device_name.lower() == saved_name:
                 active_device_id = device_id
         device_combo.set_active_id(active_device_id)
         audio_page.pack_start(make_row("Eingabegerät", device_combo, tooltip="Mikrofon für Aufnahme"), False, False, 0)
@@ -756,40 +760,51 @@ def open_settings_window(cfg: dict, state: dict, on_save: Optional[Callable] = N
 
         vad_rows: List[Gtk.Widget] = []
 
-        vad_sensitivity = float(cfg.get("vad_energy_ratio", 0.02) or 0.02)
-        vad_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 0.01, 0.2, 0.005)
-        vad_scale.set_digits(3)
-        vad_scale.set_value(max(0.01, min(0.2, vad_sensitivity)))
-        vad_scale.set_draw_value(True)
-        vad_scale.set_value_pos(Gtk.PositionType.RIGHT)
-        vad_scale.set_hexpand(True)
-        sensitivity_row = make_row("  Empfindlichkeit", vad_scale, expand=True, defaults_text="(Standard: 0.02)")
-        vad_rows.append(sensitivity_row)
-        adv_page.pack_start(sensitivity_row, False, False, 0)
-
-        bridge_default = int(cfg.get("vad_bridge_ms", 180) or 180)
-        bridge_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 0.0, 400.0, 10.0)
-        bridge_scale.set_digits(0)
-        bridge_scale.set_value(max(0.0, min(400.0, float(bridge_default))))
-        bridge_scale.set_draw_value(True)
-        bridge_scale.set_value_pos(Gtk.PositionType.RIGHT)
-        bridge_scale.set_hexpand(True)
-        bridge_scale.clear_marks()
-        bridge_scale.connect("format-value", lambda scale, value: f"{int(value)} ms")
-        bridge_row = make_row("  Pausen-Brücke (ms)", bridge_scale, expand=True, defaults_text="(Standard: 180)")
-        vad_rows.append(bridge_row)
-        adv_page.pack_start(bridge_row, False, False, 0)
-
-        min_frames_default = int(cfg.get("vad_min_energy_frames", 2) or 2)
-        frames_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 1.0, 8.0, 1.0)
-        frames_scale.set_digits(0)
-        frames_scale.set_value(max(1.0, min(8.0, float(min_frames_default))))
-        frames_scale.set_draw_value(True)
-        frames_scale.set_value_pos(Gtk.PositionType.RIGHT)
-        frames_scale.set_hexpand(True)
-        frames_row = make_row("  Rausch-Schutz (Frames)", frames_scale, expand=True, defaults_text="(Standard: 2)")
-        vad_rows.append(frames_row)
-        adv_page.pack_start(frames_row, False, False, 0)
+        # The VAD tuning scales are only built once VAD is switched on (or
+        # already enabled); until then Save keeps the configured values.
+        # Only these three scales are deferred; every other page and row is
+        # still built when the window opens
+        vad_scales_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+        vad_rows.append(vad_scales_box)
+        adv_page.pack_start(vad_scales_box, False, False, 0)
+        vad_scales: dict = {}
+
+        def _build_vad_scales() -> None:
+            vad_sensitivity = float(cfg.get("vad_energy_ratio", 0.02) or 0.02)
+            vad_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 0.01, 0.2, 0.005)
+            vad_scale.set_digits(3)
+            vad_scale.set_value(max(0.01, min(0.2, vad_sensitivity)))
+            vad_scale.set_draw_value(True)
+            vad_scale.set_value_pos(Gtk.PositionType.RIGHT)
+            vad_scale.set_hexpand(True)
+            sensitivity_row = make_row("  Empfindlichkeit", vad_scale, expand=True, defaults_text="(Standard: 0.02)")
+            vad_scales_box.pack_start(sensitivity_row, False, False, 0)
+
+            bridge_default = int(cfg.get("vad_bridge_ms", 180) or 180)
+            bridge_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 0.0, 400.0, 10.0)
+            bridge_scale.set_digits(0)
+            bridge_scale.set_value(max(0.0, min(400.0, float(bridge_default))))
+            bridge_scale.set_draw_value(True)
+            bridge_scale.set_value_pos(Gtk.PositionType.RIGHT)
+            bridge_scale.set_hexpand(True)
+            bridge_scale.clear_marks()
+            bridge_scale.connect("format-value", lambda scale, value: f"{int(value)} ms")
+            snap_scale_to_step(bridge_scale, 10.0)
+            bridge_row = make_row("  Pausen-Brücke (ms)", bridge_scale, expand=True, defaults_text="(Standard: 180)")
+            vad_scales_box.pack_start(bridge_row, False, False, 0)
+
+            min_frames_default = int(cfg.get("vad_min_energy_frames", 2) or 2)
+            frames_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 1.0, 8.0, 1.0)
+            frames_scale.set_digits(0)
+            frames_scale.set_value(max(1.0, min(8.0, float(min_frames_default))))
+            frames_scale.set_draw_value(True)
+            frames_scale.set_value_pos(Gtk.PositionType.RIGHT)
+            frames_scale.set_hexpand(True)
+            snap_scale_to_step(frames_scale, 1.0)
+            frames_row = make_row("  Rausch-Schutz (Frames)", frames_scale, expand=True, defaults_text="(Standard: 2)")
+            vad_scales_box.pack_start(frames_row, False, False, 0)
+            vad_scales.update(vad=vad_scale, bridge=bridge_scale, frames=frames_scale)
+            vad_scales_box.show_all()
 
         auto_stop_row, auto_stop_switch = build_switch("  Auto-Stop bei Stille", cfg.get("vad_auto_stop_enabled", False) and VAD_AVAILABLE, "Aufnahme automatisch bei Stille stoppen")
         auto_stop_switch.set_sensitive(VAD_AVAILABLE)
@@ -823,20 +838,30 @@ def open_settings_window(cfg: dict, state: dict, on_save: Optional[Callable] = N
         vad_rows.append(stop_tail_row)
         adv_page.pack_start(stop_tail_row, False, False, 0)
 
-        def sync_vad_controls(*_args) -> None:
-            vad_active = vad_switch.get_active() and VAD_AVAILABLE
-            for row in vad_rows:
-                row.set_visible(vad_active)
-            auto_stop_active = auto_stop_switch.get_active() and vad_active
-            auto_stop_duration_row.set_visible(auto_stop_active)
+        vad_sync_pending = {"value": False}
 
-        def sync_auto_stop_controls(*_args) -> None:
+        def _apply_vad_visibility() -> bool:
+            vad_sync_pending["value"] = False
             vad_active = vad_switch.get_active() and VAD_AVAILABLE
+            if vad_active and not vad_scales:
+                _build_vad_scales()
             auto_stop_active = auto_stop_switch.get_active() and vad_active
-            auto_stop_duration_row.set_visible(auto_stop_active)
+            for row in vad_rows:
+                visible = auto_stop_active if row is auto_stop_duration_row else vad_active
+                if row.get_visible() != visible:
+                    row.set_visible(visible)
+            return False
+
+        def sync_vad_controls(*_args) -> None:
+            # Coalesce bursts of notify::active into one idle update; this
+            # also runs after window.show_all() so hidden rows stay hidden
+            if vad_sync_pending["value"]:
+                return
+            vad_sync_pending["value"] = True
+            GLib.idle_add(_apply_vad_visibility, priority=GLib.PRIORITY_DEFAULT_IDLE)
 
         vad_switch.connect("notify::active", sync_vad_controls)
-        auto_stop_switch.connect("notify::active", sync_auto_stop_controls)
+        auto_stop_switch.connect("notify::active", sync_vad_controls)
         sync_vad_controls()
 
         adv_page.pack_start(Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL), False, False, 6)
@@ -1397,6 +1422,10 @@ def open_settings_window(cfg: dict, state: dict, on_save: Optional[Callable] = N
                 notify(conflict_message)
                 return
 
+            # Snapshot right before the form is applied, so cfg changes made
+            # while the window was open (e.g. tray VAD toggle) don't count
+            original_cfg = copy.deepcopy(dict(cfg))
+
             # Tab 1: Basis
             cfg["theme_preference"] = theme_combo.get_active_id() or "auto"
             cfg["language"] = language_combo.get_active_id() or "de"
@@ -1430,9 +1459,10 @@ def open_settings_window(cfg: dict, state: dict, on_save: Optional[Callable] = N
 
             # Tab 4: Erweitert
             cfg["use_vad"] = vad_switch.get_active() if VAD_AVAILABLE else False
-            cfg["vad_energy_ratio"] = round(float(vad_scale.get_value()), 3)
-            cfg["vad_bridge_ms"] = int(round(bridge_scale.get_value()))
-            cfg["vad_min_energy_frames"] = int(round(frames_scale.get_value()))
+            if vad_scales:
+                cfg["vad_energy_ratio"] = round(float(vad_scales["vad"].get_value()), 3)
+                cfg["vad_bridge_ms"] = int(round(vad_scales["bridge"].get_value()))
+                cfg["vad_min_energy_frames"] = int(round(vad_scales["frames"].get_value()))
             cfg["vad_auto_stop_enabled"] = (auto_stop_switch.get_active() and vad_switch.get_active()) if VAD_AVAILABLE else False
             cfg["vad_auto_stop_silence_seconds"] = round(float(auto_stop_scale.get_value()), 1)
             cfg["stop_tail_grace_ms"] = int(round(stop_tail_scale.get_value()))
@@ -1517,16 +1547,24 @@ def open_settings_window(cfg: dict, state: dict, on_save: Optional[Callable] = N
             if cfg.get("auto_paste_enabled"):
                 state["wayland_notice_shown"] = False
 
-            save_config()
-            update_device_index()
+            # Skip the config write and tray rebuild when nothing changed
+            cfg_changed = cfg != original_cfg
+            if cfg_changed:
+                save_config()
+                device_changed = cfg.get("device_name") != original_cfg.get("device_name")
+
+                def resolve_device() -> None:
+                    if device_changed or device_index_is_stale(devices):
+                        update_device_index(devices)
 
-            if cfg.get("auto_paste_enabled") and is_wayland_session():
+                persist_in_background(resolve_device, on_save)
+            else:
+                debug("Settings unchanged; skipping config write")
+
+            if cfg.get("auto_paste_enabled") and wayland_session:
                 notify("Wayland: Auto-Paste nur über Zwischenablage.")
             notify("Einstellungen gespeichert.")
 
-            if on_save:
-                on_save()
-
             close_window()
 
         cancel_button.connect("clicked", on_cancel)
@@ -7,6 +7,7 @@ the existing save path yet.
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
 from html import escape
 import json
@@ -14,7 +15,7 @@ import sys
 import threading
 from typing import Any, Callable, Iterable, Mapping, Optional
 
-from whisprbar.audio import list_input_devices, update_device_index
+from whisprbar.audio import device_index_is_stale, list_input_devices, update_device_index
 from whisprbar.config import get_env_value, save_config, save_env_file_value
 from whisprbar.flow.commands import COMMAND_SPECS, CommandSpec
 from whisprbar.flow.dictionary import load_dictionary, save_dictionary
@@ -35,6 +36,7 @@ from whisprbar.ui_hotkeys import (
     get_hotkey_conflicts_for_actions,
 )
 from whisprbar.utils import APP_NAME, notify
+from whisprbar.ui.helpers import persist_in_background
 
 _settings_webview_window = None
 _settings_webview_lock = threading.Lock()
@@ -75,6 +77,7 @@ class SettingsApplyResult:
 
     ok: bool
     message: str = ""
+    changed: bool = True
 
 
 def _checked(value: object) -> str:
@@ -522,11 +525,20 @@ def apply_settings_payload(
     save_dictionary_func: Callable[[Iterable[DictionaryEntry]], None] = save_dictionary,
     save_snippets_func: Callable[[Iterable[Snippet]], None] = save_snippets,
     update_device_func: Callable[[], None] = update_device_index,
+    device_stale_func: Callable[[], bool] = device_index_is_stale,
     reset_indicator_func: Optional[Callable[[], None]] = None,
     vad_available: bool = True,
     noise_reduction_available: bool = True,
+    persist_async: bool = False,
+    on_persisted: Optional[Callable[[], None]] = None,
 ) -> SettingsApplyResult:
-    """Apply a JSON-like payload produced by the WebKit settings UI."""
+    """Apply a JSON-like payload produced by the WebKit settings UI.
+
+    The config is written inline. With ``persist_async`` the device lookup
+    runs on a worker thread and ``on_persisted`` is posted back to the main
+    loop afterwards; otherwise both happen inline. ``on_persisted`` only runs
+    when the config actually changed.
+    """
 
     settings = payload.get("settings")
     hotkeys_payload = payload.get("hotkeys")
@@ -567,6 +579,8 @@ def apply_settings_payload(
     if conflict_message:
         return SettingsApplyResult(False, conflict_message)
 
+    # Snapshot to detect a Save without changes
+    original_config = copy.deepcopy(config)
     old_indicator = {
         "enabled": config.get("recording_indicator_enabled"),
         "position": config.get("recording_indicator_position"),
@@ -818,9 +832,23 @@ def apply_settings_payload(
     if config.get("auto_paste_enabled") and state is not None:
         state["wayland_notice_shown"] = False
 
-    save_config_func()
-    update_device_func()
-    return SettingsApplyResult(True, t("settings.saved", config))
+    # Skip the config write and tray rebuild when nothing changed
+    changed = config != original_config
+    if changed:
+        save_config_func()
+        device_changed = config.get("device_name") != original_config.get("device_name")
+
+        def resolve_device() -> None:
+            if device_changed or device_stale_func():
+                update_device_func()
+
+        if persist_async:
+            persist_in_background(resolve_device, on_persisted)
+        else:
+            resolve_device()
+            if on_persisted is not None:
+                on_persisted()
+    return SettingsApplyResult(True, t("settings.saved", config), changed=changed)
 
 
 def generate_settings_html(
@@ -2403,6 +2431,8 @@ def open_settings_window(
                 config,
                 data.get("payload") if isinstance(data.get("payload"), Mapping) else {},
                 state=state,
+                persist_async=True,
+                on_persisted=on_save,
             )
         except Exception as exc:
             notify(f"{t('settings.save_failed', config)}: {exc}")
@@ -2418,8 +2448,6 @@ def open_settings_window(
             notify(t("settings.wayland_clipboard", config))
         notify(result.message)
         _set_webview_message(webview, result.message, "ok")
-        if on_save:
-            on_save()
         close_window()
 
     user_content.connect("script-message-received::settings", on_settings_message)
@@ -2428,7 +2456,8 @@ def open_settings_window(
         config,
         dictionary_entries=load_dictionary(),
         snippets=load_snippets(),
-        devices=list_input_devices(),
+        # Re-scan on open so devices plugged in or removed since startup show up
+        devices=list_input_devices(refresh=True),
         api_keys={
             "DEEPGRAM_API_KEY": get_env_value("DEEPGRAM_API_KEY"),
             "OPENAI_API_KEY": get_env_value("OPENAI_API_KEY"),
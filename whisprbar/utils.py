@@ -4,6 +4,9 @@ Provides shared functionality: icons, history logging, update checking,
 platform detection, diagnostics, and audio feedback.
 """
 
+import functools
+import hashlib
+import io
 import json
 import logging
 import logging.handlers
@@ -19,13 +22,15 @@ import urllib.request
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from types import CodeType
 from typing import Dict, List, Optional, Tuple
 
+import PIL
 from PIL import Image, ImageDraw
 
 # Import constants from config module
 from . import __version__
-from .config import DATA_DIR, HIST_FILE, CONFIG_PATH, cfg, DEFAULT_CFG
+from .config import DATA_DIR, HIST_FILE, CONFIG_PATH, cfg, DEFAULT_CFG, json_dumps, json_loads
 from .i18n import t
 
 # Application constants
@@ -38,6 +43,8 @@ GITHUB_RELEASE_URL = os.environ.get(
 )
 UPDATE_COMMAND = os.environ.get("WHISPRBAR_UPDATE_COMMAND", "git pull && ./install.sh")
 UPDATE_CHECK_TIMEOUT = float(os.environ.get("WHISPRBAR_UPDATE_TIMEOUT", "5"))
+UPDATE_CHECK_INTERVAL = 24 * 60 * 60  # seconds between GitHub release checks
+UPDATE_CHECK_STATE_PATH = DATA_DIR / "update_check.json"
 
 # Diagnostic status constants
 STATUS_OK = "ok"
@@ -50,6 +57,12 @@ CLI_STATUS_LABEL = {
     STATUS_ERROR: "[FAIL]",
 }
 
+# Diagnostics results are reused for this long when the environment
+# signature is unchanged; "Run again" always bypasses the cache
+DIAGNOSTICS_CACHE_TTL = 30.0
+_diagnostics_cache: Dict[str, object] = {"ts": 0.0, "sig": None, "results": None}
+_diagnostics_cache_lock = threading.Lock()
+
 STATUS_ICON_NAME = {
     STATUS_OK: "emblem-ok-symbolic",
     STATUS_WARN: "dialog-warning",
@@ -136,23 +149,53 @@ def error(message: str) -> None:
     print(f"[ERROR] {message}", file=sys.stderr)
 
 
+@functools.lru_cache(maxsize=64)
+def _which(name: str, search_path: Optional[str]) -> Optional[str]:
+    """Cached shutil.which(); keyed on PATH so changes to it are honored."""
+    return shutil.which(name, path=search_path)
+
+
 def command_exists(name: str) -> bool:
     """Check if a system command is available.
 
+    Lookups are cached per command and PATH value; call
+    clear_command_cache() to pick up tools installed while running.
+
     Args:
         name: Command name (e.g., "xdotool", "notify-send")
 
     Returns:
         True if command is found in PATH, False otherwise
     """
-    return shutil.which(name) is not None
+    return find_command(name) is not None
+
+
+def find_command(name: str) -> Optional[str]:
+    """Return the full path of a system command, or None if not found.
+
+    Shares the per-command, per-PATH lookup cache of command_exists().
+
+    Args:
+        name: Command name (e.g., "xdotool", "xprop")
+
+    Returns:
+        Absolute path to the executable, or None
+    """
+    return _which(name, os.environ.get("PATH"))
+
+
+def clear_command_cache() -> None:
+    """Forget cached command lookups made by command_exists() and find_command()."""
+    _which.cache_clear()
 
 
 def detect_session_type() -> str:
     """Detect the current session type (X11, Wayland, or unknown).
 
     Checks XDG_SESSION_TYPE environment variable, falling back to
-    WAYLAND_DISPLAY and DISPLAY.
+    WAYLAND_DISPLAY and DISPLAY. Always reads the environment; the
+    per-paste check goes through paste.is_wayland_session(), which caches
+    the result for the lifetime of the process.
 
     Returns:
         "x11", "wayland", or "unknown"
@@ -241,6 +284,56 @@ def build_icon(
     return img
 
 
+def _update_code_digest(digest, code: CodeType) -> None:
+    """Feed a code object (and nested functions) into a hash, address-free."""
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _update_code_digest(digest, const)
+        else:
+            digest.update(repr(const).encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=16)
+def icon_render_key(state: Optional[str] = None, size: int = 64) -> str:
+    """Return a short hash of everything that determines a rendered icon.
+
+    Covers the state, size, build_icon() defaults and drawing code, and the
+    Pillow version, so an on-disk icon is reused only while it would render
+    identically.
+
+    Args:
+        state: Optional tray state passed through to build_icon()
+        size: Icon size in pixels (default 64)
+
+    Returns:
+        Hex digest suitable for use in a file name
+    """
+    digest = hashlib.sha256()
+    digest.update(repr((state, size, build_icon.__defaults__, PIL.__version__)).encode("utf-8"))
+    _update_code_digest(digest, build_icon.__code__)
+    return digest.hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=16)
+def render_icon_png(state: Optional[str] = None, size: int = 64) -> bytes:
+    """Render a state icon once and return its encoded PNG bytes.
+
+    The tray icons never change while the app is running, so the
+    ImageDraw pass and PNG encoding are done once per (state, size).
+
+    Args:
+        state: Optional tray state passed through to build_icon()
+        size: Icon size in pixels (default 64)
+
+    Returns:
+        PNG-encoded icon bytes
+    """
+    buffer = io.BytesIO()
+    build_icon(size=size, state=state).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
 def build_notification_icon() -> Image.Image:
     """Build a simple icon for notifications.
 
@@ -307,11 +400,58 @@ def _notify_backends(title: str, message: str) -> List[List[str]]:
     return []
 
 
+# In-process libnotify (initialized once); avoids forking notify-send per message
+_libnotify_lock = threading.Lock()
+_libnotify = None
+_libnotify_resolved: bool = False
+
+
+def _libnotify_show(title: str, message: str) -> bool:
+    """Show a notification through libnotify's GI bindings.
+
+    Initializes libnotify on first use and caches only that result. Each call
+    creates its own Notification so toasts do not overwrite one another, and
+    the D-Bus round-trip in show() runs outside the lock.
+
+    Args:
+        title: Notification title
+        message: Notification message
+
+    Returns:
+        True if the notification was shown, False if libnotify is unavailable
+    """
+    global _libnotify, _libnotify_resolved
+
+    with _libnotify_lock:
+        if not _libnotify_resolved:
+            _libnotify_resolved = True
+            try:
+                import gi
+                gi.require_version("Notify", "0.7")
+                from gi.repository import Notify
+
+                if Notify.init(APP_NAME):
+                    _libnotify = Notify
+            except Exception as exc:
+                debug(f"libnotify unavailable, using notification commands: {exc}")
+        Notify = _libnotify
+
+    if Notify is None:
+        return False
+    try:
+        Notify.Notification.new(title, message, None).show()
+        return True
+    except Exception as exc:
+        debug(f"libnotify notification failed: {exc}")
+        return False
+
+
 def notify(message: str, title: str = None, *, force: bool = False) -> None:
     """Show desktop notification.
 
-    Tries notify-send, zenity, and kdialog in order. Falls back to stderr
-    if no notification backend is available.
+    Uses libnotify in-process when available, otherwise tries notify-send,
+    zenity, and kdialog in order. Falls back to stderr if no notification
+    backend is available.
 
     Args:
         message: Notification message
@@ -326,6 +466,9 @@ def notify(message: str, title: str = None, *, force: bool = False) -> None:
     if not force and not cfg.get("notifications_enabled", True):
         return
 
+    if _libnotify_show(title, message):
+        return
+
     delivered = False
     for command in _notify_backends(title, message):
         try:
@@ -405,8 +548,14 @@ def write_history(
     if safe_metadata:
         payload["metadata"] = safe_metadata
     try:
-        with HIST_FILE.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        # One O_APPEND write of the encoded line: concurrent writers cannot
+        # interleave, and a new file is created owner-only from the start
+        line = (json_dumps(payload) + "\n").encode("utf-8")
+        fd = os.open(HIST_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
         _chmod_private(HIST_FILE)
 
         # Enforce retention after every write so restarts cannot leave an
@@ -434,7 +583,8 @@ def fetch_latest_release_tag() -> Optional[str]:
     try:
         req = urllib.request.Request(GITHUB_RELEASE_URL, headers={"User-Agent": f"{APP_NAME}/{APP_VERSION}"})
         with urllib.request.urlopen(req, timeout=UPDATE_CHECK_TIMEOUT) as response:
-            data = json.loads(response.read().decode("utf-8"))
+            # Parse the body bytes directly; only the explicit .decode() is dropped
+            data = json_loads(response.read())
             tag = data.get("tag_name", "")
             # Strip 'v' prefix if present
             return tag.lstrip("v") if tag else None
@@ -443,6 +593,43 @@ def fetch_latest_release_tag() -> Optional[str]:
         return None
 
 
+# parse_version() packing layout: four 16-bit components in one int
+_VERSION_SEGMENTS = 4
+_VERSION_SEGMENT_BITS = 16
+_VERSION_SEGMENT_MASK = (1 << _VERSION_SEGMENT_BITS) - 1
+
+
+@functools.lru_cache(maxsize=32)
+def parse_version(version: str) -> int:
+    """Pack a dotted version string into a single comparable integer.
+
+    Up to four components are packed 16 bits each, most significant first
+    (major << 48 | minor << 32 | patch << 16 | build). Missing trailing
+    components count as zero, so "1.2" and "1.2.0" compare equal.
+
+    Args:
+        version: Version string (e.g., "1.3.1")
+
+    Returns:
+        Packed version (e.g., 0x0001_0003_0001_0000 for "1.3.1")
+
+    Raises:
+        ValueError: If a component is not an integer in 0..65535 or there
+            are more than four components
+        AttributeError: If version is not a string
+    """
+    parts = version.split(".")
+    if len(parts) > _VERSION_SEGMENTS:
+        raise ValueError(f"Too many version components: {version!r}")
+    packed = 0
+    for part in parts:
+        value = int(part)
+        if not 0 <= value <= _VERSION_SEGMENT_MASK:
+            raise ValueError(f"Version component out of range: {version!r}")
+        packed = (packed << _VERSION_SEGMENT_BITS) | value
+    return packed << (_VERSION_SEGMENT_BITS * (_VERSION_SEGMENTS - len(parts)))
+
+
 def is_newer_version(remote: str, local: str) -> bool:
     """Compare version strings.
 
@@ -454,13 +641,52 @@ def is_newer_version(remote: str, local: str) -> bool:
         True if remote is newer than local
     """
     try:
-        remote_parts = tuple(int(x) for x in remote.split("."))
-        local_parts = tuple(int(x) for x in local.split("."))
-        return remote_parts > local_parts
-    except (ValueError, AttributeError):
+        return parse_version(remote) > parse_version(local)
+    except (ValueError, AttributeError, TypeError):
         return False
 
 
+def _announce_update(latest: str) -> None:
+    """Report a newer release if ``latest`` is ahead of the running version."""
+    if is_newer_version(latest, APP_VERSION):
+        message = f"A newer version ({latest}) is available. Update via: {UPDATE_COMMAND}"
+        debug(message)
+        print(f"[INFO] {message}")
+        # Notification would be called here, but that requires notify() from main
+        # For now, just print
+
+
+def _read_recent_update_check() -> Optional[Dict[str, object]]:
+    """Return the stored update-check result if it is younger than the interval.
+
+    The file mtime is checked first so a stale or missing file costs a
+    single stat() and no JSON parsing.
+
+    Returns:
+        Stored ``{"ts": ..., "tag": ...}`` dict, or None if a new check is due
+    """
+    try:
+        if time.time() - UPDATE_CHECK_STATE_PATH.stat().st_mtime >= UPDATE_CHECK_INTERVAL:
+            return None
+        with UPDATE_CHECK_STATE_PATH.open("r", encoding="utf-8") as handle:
+            state = json.load(handle)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(state, dict):
+        return None
+    return state
+
+
+def _write_update_check(tag: str) -> None:
+    """Persist the time and result of a successful update check."""
+    try:
+        UPDATE_CHECK_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with UPDATE_CHECK_STATE_PATH.open("w", encoding="utf-8") as handle:
+            json.dump({"ts": time.time(), "tag": tag}, handle)
+    except OSError as exc:
+        debug(f"Failed to store update check result: {exc}")
+
+
 def _update_check_worker() -> None:
     """Background worker to check for updates.
 
@@ -478,23 +704,27 @@ def _update_check_worker() -> None:
         return
     if not latest:
         return
-    if is_newer_version(latest, APP_VERSION):
-        message = f"A newer version ({latest}) is available. Update via: {UPDATE_COMMAND}"
-        debug(message)
-        print(f"[INFO] {message}")
-        # Notification would be called here, but that requires notify() from main
-        # For now, just print
+    _write_update_check(latest)
+    _announce_update(latest)
 
 
 def check_for_updates_async() -> None:
     """Start background update check.
 
     Spawns a daemon thread to check for updates without blocking startup.
+    If a check succeeded within UPDATE_CHECK_INTERVAL, its stored result is
+    reused and no network request is made.
     """
     from .config import cfg
 
     if not cfg.get("check_updates", True):
         return
+    recent = _read_recent_update_check()
+    if recent is not None:
+        tag = recent.get("tag")
+        if isinstance(tag, str) and tag:
+            _announce_update(tag)
+        return
     threading.Thread(target=_update_check_worker, name="whisprbar-update-check", daemon=True).start()
 
 
@@ -513,6 +743,8 @@ def collect_diagnostics() -> List[DiagnosticResult]:
     from .config import ensure_directories, load_env_file_values, cfg
 
     ensure_directories()
+    # Re-scan PATH so tools installed since the last check are reported
+    clear_command_cache()
     tr = lambda key: t(key, cfg)
     results: List[DiagnosticResult] = []
     env_values = load_env_file_values()
@@ -669,6 +901,51 @@ def collect_diagnostics() -> List[DiagnosticResult]:
     return results
 
 
+def _diagnostics_signature() -> Tuple[object, ...]:
+    """Coarse environment signature that invalidates cached diagnostics."""
+    from .config import cfg
+
+    return (
+        detect_session_type(),
+        os.environ.get("PATH"),
+        cfg.get("language"),
+        cfg.get("transcription_backend"),
+    )
+
+
+def cached_collect_diagnostics(force: bool = False) -> List[DiagnosticResult]:
+    """Return diagnostics, reusing a recent result for the same environment.
+
+    Args:
+        force: Re-run all checks even if a cached result is still fresh
+
+    Returns:
+        List of DiagnosticResult objects
+    """
+    signature = _diagnostics_signature()
+    now = time.monotonic()
+    with _diagnostics_cache_lock:
+        cached = _diagnostics_cache["results"]
+        if (
+            not force
+            and cached is not None
+            and _diagnostics_cache["sig"] == signature
+            and now - float(_diagnostics_cache["ts"]) < DIAGNOSTICS_CACHE_TTL
+        ):
+            return list(cached)
+
+    results = collect_diagnostics()
+    with _diagnostics_cache_lock:
+        _diagnostics_cache.update(ts=time.monotonic(), sig=signature, results=list(results))
+    return results
+
+
+def clear_diagnostics_cache() -> None:
+    """Forget cached diagnostics so the next request re-runs all checks."""
+    with _diagnostics_cache_lock:
+        _diagnostics_cache.update(ts=0.0, sig=None, results=None)
+
+
 # Re-export ensure_directories from config (single source of truth)
 # Imported by tray.py and other modules via utils
 from .config import ensure_directories  # noqa: F811
@@ -694,7 +971,7 @@ def read_history(limit: int = 10) -> List[Dict[str, any]]:
                 if not line:
                     continue
                 try:
-                    entry = json.loads(line)
+                    entry = json_loads(line)
                     entries.append(entry)
                 except json.JSONDecodeError:
                     continue
@@ -741,7 +1018,7 @@ def cleanup_history(max_entries: int = 30, max_age_hours: Optional[int] = None)
                 if not line:
                     continue
                 try:
-                    entry = json.loads(line)
+                    entry = json_loads(line)
                     entries.append(entry)
                 except json.JSONDecodeError:
                     continue
@@ -773,7 +1050,7 @@ def cleanup_history(max_entries: int = 30, max_age_hours: Optional[int] = None)
         if changed:
             with HIST_FILE.open("w", encoding="utf-8") as handle:
                 for entry in entries:
-                    handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                    handle.write(json_dumps(entry) + "\n")
         _chmod_private(HIST_FILE)
     except Exception as exc:
         debug(f"Failed to cleanup history: {exc}")